@@ -5,14 +5,20 @@ This module contains the GPT-4o powered inference engine for skill assessment.
 """
 
 from .inference_engine import SkillInferenceEngine
-from .rubric_loader import load_rubric, load_curriculum_context
+from .rubric_loader import (
+    load_rubric, load_curriculum_context,
+    hash_rubric_sections, diff_rubric_sections
+)
 from .few_shot_manager import FewShotManager
-from .confidence_scoring import calculate_confidence_score
+from .confidence_scoring import calculate_confidence_score, calculate_confidence_scores
 
 __all__ = [
     'SkillInferenceEngine',
     'load_rubric',
     'load_curriculum_context',
+    'hash_rubric_sections',
+    'diff_rubric_sections',
     'FewShotManager',
-    'calculate_confidence_score'
+    'calculate_confidence_score',
+    'calculate_confidence_scores'
 ]
@@ -4,7 +4,50 @@ Confidence Scoring Module
 Calculates heuristic confidence scores for skill assessments based on multiple factors.
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Sequence
+
+import numpy as np
+
+
+# Rubric-aligned phrases rewarded in Factor 2 (shared by the single and batch scorers)
+RUBRIC_KEYWORDS = [
+    'independently',
+    'consistently',
+    'with prompting',
+    'with support',
+    'beginning to',
+    'developing',
+    'demonstrates',
+    'applies'
+]
+
+# Keywords implied by each keyword (itself plus any keyword it contains),
+# so a match also credits the shorter keywords nested inside it
+_IMPLIED_KEYWORDS = {
+    keyword: frozenset(other for other in RUBRIC_KEYWORDS if other in keyword)
+    for keyword in RUBRIC_KEYWORDS
+}
+_KEYWORDS_NEST = any(len(implied) > 1 for implied in _IMPLIED_KEYWORDS.values())
+
+# A non-overlapping scan can only miss a keyword that starts inside another
+# match and runs past its end; fall back to an overlapping lookahead scan if
+# any keyword's suffix is another keyword's prefix.
+_KEYWORDS_CAN_OVERLAP = any(
+    first[-size:] == second[:size]
+    for first in RUBRIC_KEYWORDS
+    for second in RUBRIC_KEYWORDS
+    for size in range(1, min(len(first), len(second)))
+)
+
+# Single-pass keyword matcher; longer phrases are tried first so a phrase is
+# never shadowed by its own prefix
+_KEYWORD_ALTERNATION = '|'.join(
+    re.escape(keyword) for keyword in sorted(RUBRIC_KEYWORDS, key=len, reverse=True)
+)
+_KEYWORD_PATTERN = re.compile(
+    f'(?=({_KEYWORD_ALTERNATION}))' if _KEYWORDS_CAN_OVERLAP else f'({_KEYWORD_ALTERNATION})'
+)
 
 
 def calculate_confidence_score(data_entry: Dict[str, Any], assessment: Dict[str, Any]) -> float:
@@ -40,18 +83,7 @@ def calculate_confidence_score(data_entry: Dict[str, Any], assessment: Dict[str,
     # Factor 2: Rubric Keyword Matching
     # Presence of rubric-aligned language indicates deeper understanding
     justification = assessment.get('justification', '').lower()
-    rubric_keywords = [
-        'independently',
-        'consistently',
-        'with prompting',
-        'with support',
-        'beginning to',
-        'developing',
-        'demonstrates',
-        'applies'
-    ]
-    
-    keyword_matches = sum(1 for keyword in rubric_keywords if keyword in justification)
+    keyword_matches = sum(1 for keyword in RUBRIC_KEYWORDS if keyword in justification)
     confidence += min(keyword_matches * 0.05, 0.15)
     
     # Factor 3: Data Entry Completeness
@@ -72,3 +104,66 @@ def calculate_confidence_score(data_entry: Dict[str, Any], assessment: Dict[str,
     
     # Cap confidence at 1.0
     return min(confidence, 1.0)
+
+
+def count_rubric_keywords(justification: str) -> int:
+    """
+    Count the distinct rubric keywords present in a justification in one regex pass
+
+    Args:
+        justification: Assessment justification text (any case)
+
+    Returns:
+        int: Number of distinct RUBRIC_KEYWORDS found
+    """
+    matches = set(_KEYWORD_PATTERN.findall(justification.lower()))
+    if not _KEYWORDS_NEST:
+        return len(matches)
+    return len(frozenset().union(*(_IMPLIED_KEYWORDS[match] for match in matches)))
+
+
+def calculate_confidence_scores(
+    data_entries: Sequence[Dict[str, Any]],
+    assessments: Sequence[Dict[str, Any]]
+) -> List[float]:
+    """
+    Batch version of calculate_confidence_score for scoring many assessments at once
+
+    Each distinct entry content is tokenized only once, keywords are matched in a
+    single regex pass per justification, and the factor arithmetic runs on NumPy
+    arrays in the same order as the scalar scorer, so results are identical.
+
+    Args:
+        data_entries: Data entry for each assessment (parallel to assessments;
+            the same entry may be repeated for all of its assessments)
+        assessments: Skill assessments to score
+
+    Returns:
+        List[float]: Confidence score for each assessment, between 0.5 and 1.0
+    """
+    if len(data_entries) != len(assessments):
+        raise ValueError("data_entries and assessments must have the same length")
+
+    if not assessments:
+        return []
+
+    # Word counts keyed by content so each entry is split once
+    content_word_counts: Dict[str, int] = {}
+    for data_entry in data_entries:
+        content = data_entry.get('content', '')
+        if content not in content_word_counts:
+            content_word_counts[content] = len(content.split())
+
+    quote_words = np.array([len(a.get('source_quote', '').split()) for a in assessments])
+    keyword_matches = np.array([count_rubric_keywords(a.get('justification', '')) for a in assessments])
+    content_words = np.array([content_word_counts[e.get('content', '')] for e in data_entries])
+    data_points = np.array([a.get('data_point_count', 1) for a in assessments])
+
+    # Factors are added in the scalar scorer's order to keep float results identical
+    confidence = np.full(len(assessments), 0.5)
+    confidence += np.where(quote_words >= 20, 0.15, np.where(quote_words >= 10, 0.10, 0.0))
+    confidence += np.minimum(keyword_matches * 0.05, 0.15)
+    confidence += np.where(content_words > 200, 0.10, np.where(content_words > 100, 0.05, 0.0))
+    confidence += np.where(data_points >= 3, 0.10, 0.0)
+
+    return np.minimum(confidence, 1.0).tolist()
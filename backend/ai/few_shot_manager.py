@@ -11,7 +11,7 @@ from typing import List, Dict
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.connection import get_db_connection
+from database.connection import db
 
 
 class FewShotManager:
@@ -36,9 +36,6 @@ class FewShotManager:
             - source_quote
             - teacher_notes
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Base query: Join assessments with teacher_corrections
         base_query = """
             SELECT 
@@ -53,19 +50,17 @@ class FewShotManager:
             WHERE tc.teacher_notes IS NOT NULL
         """
         
-        # Add skill filter if specified
-        if skill_name:
-            query = base_query + " AND a.skill_name = %s ORDER BY tc.corrected_at DESC LIMIT %s"
-            cursor.execute(query, (skill_name, limit))
-        else:
-            query = base_query + " ORDER BY tc.corrected_at DESC LIMIT %s"
-            cursor.execute(query, (limit,))
-        
-        # Fetch all corrections
-        corrections = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
+        with db() as cursor:
+            # Add skill filter if specified
+            if skill_name:
+                query = base_query + " AND a.skill_name = %s ORDER BY tc.corrected_at DESC LIMIT %s"
+                cursor.execute(query, (skill_name, limit))
+            else:
+                query = base_query + " ORDER BY tc.corrected_at DESC LIMIT %s"
+                cursor.execute(query, (limit,))
+            
+            # Fetch all corrections
+            corrections = cursor.fetchall()
         
         # Build examples list
         examples = []
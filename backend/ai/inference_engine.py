@@ -12,7 +12,7 @@ from typing import List, Dict, Any
 
 from .prompts import SYSTEM_PROMPT_TEMPLATE, build_few_shot_section, build_user_prompt
 from .rubric_loader import load_rubric
-from .confidence_scoring import calculate_confidence_score
+from .confidence_scoring import calculate_confidence_scores
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -119,12 +119,15 @@ class SkillInferenceEngine:
                 assessments = []
             
             # Calculate confidence scores for assessments that don't have them
-            for assessment in assessments:
-                if 'confidence_score' not in assessment or assessment['confidence_score'] is None:
-                    assessment['confidence_score'] = calculate_confidence_score(
-                        student_data, 
-                        assessment
-                    )
+            # (scored as one batch so the entry content is tokenized once)
+            unscored = [
+                assessment for assessment in assessments
+                if assessment.get('confidence_score') is None
+            ]
+            if unscored:
+                scores = calculate_confidence_scores([student_data] * len(unscored), unscored)
+                for assessment, score in zip(unscored, scores):
+                    assessment['confidence_score'] = score
             
             logger.info(f"Generated {len(assessments)} skill assessments")
             return assessments
@@ -4,7 +4,10 @@ Rubric and Curriculum Loader Module
 Loads the rubric and curriculum context from the Docs/ directory.
 """
 
+import hashlib
 import os
+import re
+from typing import Dict, Set
 
 
 def load_rubric() -> str:
@@ -67,3 +70,71 @@ def load_curriculum_context() -> str:
         return curriculum_content
     except FileNotFoundError:
         raise FileNotFoundError(f"Curriculum file not found at: {curriculum_path}")
+
+
+# Key for rubric text outside the per-skill rows (title, proficiency level
+# definitions, table headers); a change there affects every skill
+RUBRIC_GLOBAL_SECTION = '__global__'
+
+# Matches a skill row such as "| **5. Organization** | ... |"
+_SKILL_ROW_PATTERN = re.compile(r'^\|\s*\*\*\d+\.\s*(?P<skill>[^*]+?)\s*\*\*\s*\|')
+
+
+def parse_rubric_sections(rubric: str) -> Dict[str, str]:
+    """
+    Split the rubric into one section per skill plus a global section
+
+    Args:
+        rubric: Complete rubric content as string
+
+    Returns:
+        Dict mapping skill name to its rubric row, with everything else
+        collected under RUBRIC_GLOBAL_SECTION
+    """
+    sections = {}
+    global_lines = []
+
+    for line in rubric.splitlines():
+        match = _SKILL_ROW_PATTERN.match(line)
+        if match:
+            sections[match.group('skill')] = line.strip()
+        else:
+            global_lines.append(line.rstrip())
+
+    sections[RUBRIC_GLOBAL_SECTION] = '\n'.join(global_lines).strip()
+    return sections
+
+
+def hash_rubric_sections(rubric: str) -> Dict[str, str]:
+    """
+    Compute a SHA-256 hash for each rubric section
+
+    Args:
+        rubric: Complete rubric content as string
+
+    Returns:
+        Dict mapping section name (skill or RUBRIC_GLOBAL_SECTION) to hex digest
+    """
+    return {
+        name: hashlib.sha256(text.encode('utf-8')).hexdigest()
+        for name, text in parse_rubric_sections(rubric).items()
+    }
+
+
+def diff_rubric_sections(old_hashes: Dict[str, str], new_hashes: Dict[str, str]) -> Set[str]:
+    """
+    Find the skills whose rubric guidance changed between two rubric versions
+
+    Args:
+        old_hashes: Section hashes of the previous rubric version
+        new_hashes: Section hashes of the new rubric version
+
+    Returns:
+        Set of affected skill names (every skill if the global section changed)
+    """
+    skills = (set(old_hashes) | set(new_hashes)) - {RUBRIC_GLOBAL_SECTION}
+
+    if old_hashes.get(RUBRIC_GLOBAL_SECTION) != new_hashes.get(RUBRIC_GLOBAL_SECTION):
+        return skills
+
+    return {skill for skill in skills if old_hashes.get(skill) != new_hashes.get(skill)}
@@ -0,0 +1,18 @@
+"""
+Analytics Module
+
+Columnar (Parquet) snapshots of the database for analysts, and a reader
+for them, so analysis does not run ad-hoc SQL against production.
+"""
+
+from .snapshot import SNAPSHOT_DIR, SNAPSHOT_TABLES, run_snapshot
+from .reader import open_dataset, read_table, snapshot_info
+
+__all__ = [
+    'SNAPSHOT_DIR',
+    'SNAPSHOT_TABLES',
+    'run_snapshot',
+    'open_dataset',
+    'read_table',
+    'snapshot_info'
+]
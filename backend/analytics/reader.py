@@ -0,0 +1,142 @@
+"""
+Snapshot Reader
+
+Reads the Parquet snapshots written by analytics/snapshot.py.
+
+Partition filters (teacher, months) only open the matching directories, and
+column selection only reads those column chunks, so narrow questions stay
+cheap however large the snapshot grows:
+
+    from analytics import read_table
+
+    assessments = read_table("assessments", teacher_id="T001", months=["2025-09", "2025-10"],
+                             columns=["student_id", "skill_name", "level"])
+    df = assessments.to_pandas()
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .snapshot import LIVE_IDS_FILE, PARTITION_SCHEMA, SNAPSHOT_DIR, SNAPSHOT_TABLES, load_state, row_schema
+
+
+def open_dataset(table: str, root: Path = SNAPSHOT_DIR) -> ds.Dataset:
+    """
+    Open a snapshot table as a pyarrow dataset (for custom scans)
+
+    Raises:
+        ValueError: If the table is not a snapshot table
+        FileNotFoundError: If the table has not been exported yet
+    """
+    if table not in SNAPSHOT_TABLES:
+        raise ValueError(f"Unknown snapshot table '{table}'; use one of: {', '.join(SNAPSHOT_TABLES)}")
+
+    path = Path(root) / table
+    if not path.exists():
+        raise FileNotFoundError(f"No snapshot of {table} in {root}; run scripts/export_parquet_snapshot.py")
+
+    # Explicit schema: a table whose runs exported no rows has no data files
+    # to infer one from
+    return ds.dataset(
+        str(path),
+        schema=row_schema(table),
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+    )
+
+
+def latest_versions(table: pa.Table, live_ids: Optional[pa.Array] = None) -> pa.Table:
+    """
+    Keep the most recently changed version of each id, ordered by id
+
+    Ids missing from live_ids (deleted since they were exported) are dropped.
+    """
+    if live_ids is not None:
+        table = table.filter(pc.is_in(table.column("id"), value_set=live_ids))
+
+    if table.num_rows == 0:
+        return table
+
+    order = pc.sort_indices(table, sort_keys=[("id", "ascending"), ("changed_at", "descending")])
+    table = table.take(order)
+
+    ids = table.column("id").to_numpy()
+    first_of_id = np.ones(len(ids), dtype=bool)
+    first_of_id[1:] = ids[1:] != ids[:-1]
+
+    return table.filter(pa.array(first_of_id))
+
+
+def read_table(
+    table: str,
+    teacher_id: Optional[str] = None,
+    months: Optional[Union[str, Iterable[str]]] = None,
+    columns: Optional[List[str]] = None,
+    latest: bool = True,
+    root: Path = SNAPSHOT_DIR
+) -> pa.Table:
+    """
+    Read a snapshot table
+
+    Args:
+        table: assessments, data_entries, skill_targets or badges
+        teacher_id: Only this teacher's students
+        months: Only these months ("YYYY-MM", or a list of them)
+        columns: Columns to return (default all, including month and teacher_id)
+        latest: Keep only the latest version of each row that still exists
+            (False returns every exported version, e.g. to see when
+            assessments were corrected)
+        root: Snapshot directory
+
+    Returns:
+        pyarrow.Table (call .to_pandas() for a DataFrame)
+    """
+    dataset = open_dataset(table, root)
+
+    filters = []
+    if teacher_id is not None:
+        filters.append(ds.field("teacher_id") == teacher_id)
+    if months is not None:
+        months = [months] if isinstance(months, str) else list(months)
+        filters.append(ds.field("month").isin(months))
+
+    row_filter = None
+    for condition in filters:
+        row_filter = condition if row_filter is None else row_filter & condition
+
+    # Deduplication needs id and changed_at even when they are not requested
+    scan_columns = None
+    if columns is not None:
+        scan_columns = list(columns)
+        if latest:
+            scan_columns += [name for name in ("id", "changed_at") if name not in scan_columns]
+
+    result = dataset.to_table(columns=scan_columns, filter=row_filter)
+
+    if latest:
+        live_ids_path = Path(root) / table / LIVE_IDS_FILE
+        live_ids = None
+        if live_ids_path.exists():
+            live_ids = pq.read_table(live_ids_path).column("id").combine_chunks()
+        result = latest_versions(result, live_ids)
+
+    if columns is not None:
+        result = result.select(columns)
+
+    return result
+
+
+def snapshot_info(root: Path = SNAPSHOT_DIR) -> Dict[str, Any]:
+    """
+    Describe the snapshot: per table, the watermark, last run and rows it wrote
+
+    Returns:
+        {table: {"watermark", "last_run", "rows"}}
+    """
+    return load_state(root)["tables"]
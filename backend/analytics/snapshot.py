@@ -0,0 +1,417 @@
+"""
+Analytics Snapshots
+
+Columnar copies of the tables analysts query, so ad-hoc analysis runs
+against Parquet files instead of competing with teacher traffic on the
+production database.
+
+Each snapshot table is written as a hive-partitioned Parquet dataset,
+readable by the reader in analytics/reader.py, pandas, DuckDB or Spark:
+
+    <root>/<table>/month=YYYY-MM/teacher_id=T001/part-<run>-0.parquet
+    <root>/_snapshot_state.json
+
+`month` comes from each table's own date (assessment creation, entry date,
+target assignment, badge earned date) and `teacher_id` is the student's
+teacher, so one teacher's month can be read across all tables without
+touching other files. Skill, category and level columns are dictionary
+encoded and files are zstd-compressed.
+
+Runs are incremental: each table keeps a watermark in the state file, and
+the next run appends a new part file per partition holding only rows changed
+after it. The watermark is the start of the run's snapshot transaction, held
+back to the start of the oldest transaction still open at that moment: such
+a transaction stamps its rows with its own (earlier) NOW() and may commit
+after the snapshot, so a watermark taken from the newest changed_at seen
+would skip its rows for good. On a quiet database a run after an unchanged
+one writes nothing.
+
+A row that changes (an assessment is corrected, a target completed) appears
+once per version; every row carries changed_at, and the reader keeps the
+latest version of each id. Rows re-exported after an interrupted run, or
+because a concurrent transaction held the watermark back, are deduplicated
+the same way, so a failed run can simply be started again. Deleted rows (e.g. assessments replaced by a rubric
+re-score) are handled by a list of the ids still live, rewritten on every
+run as <table>/_live_ids.parquet; the reader drops versions of other ids.
+"""
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from database.connection import get_db_connection, return_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Configuration (can be overridden via environment variables)
+SNAPSHOT_DIR = Path(os.getenv(
+    "ANALYTICS_SNAPSHOT_DIR",
+    str(Path(__file__).resolve().parent.parent / "snapshots")
+))
+# Rows fetched from the server-side cursor, and written, per batch
+SNAPSHOT_FETCH_SIZE = int(os.getenv("SNAPSHOT_FETCH_SIZE", "5000"))
+
+STATE_FILE = "_snapshot_state.json"
+# Underscore-prefixed, so dataset discovery skips it as a data file
+LIVE_IDS_FILE = "_live_ids.parquet"
+PARQUET_COMPRESSION = "zstd"
+
+PARTITION_SCHEMA = pa.schema([
+    ("month", pa.string()),
+    ("teacher_id", pa.string()),
+])
+
+# Start of the oldest transaction that could still commit rows this snapshot
+# does not see (the run's own transaction included), as a timestamp in the
+# session time zone like the tables' NOW() defaults. Other sessions' xact_start
+# needs the same role or pg_read_all_stats.
+WATERMARK_QUERY = """
+    SELECT LEAST(
+        now(),
+        (SELECT min(xact_start) FROM pg_stat_activity
+         WHERE xact_start IS NOT NULL AND pid <> pg_backend_pid())
+    )::timestamp as watermark
+"""
+
+# Low-cardinality strings stored as dictionary indices
+DICTIONARY_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Per table: SELECT with a {where} slot, the change expression the watermark
+# filters on, and the Arrow schema of the rows (dictionary typed columns are
+# written dictionary encoded). Every query also returns the month and
+# teacher_id partition values.
+SNAPSHOT_TABLES: Dict[str, Dict[str, Any]] = {
+    "assessments": {
+        "query": """
+            SELECT
+                a.id, a.data_entry_id, a.student_id,
+                a.skill_name, a.skill_category, a.level, a.level_numeric,
+                a.confidence_score::float8 as confidence_score,
+                a.justification, a.source_quote, a.data_point_count,
+                a.rubric_version, a.corrected, a.observed_on,
+                a.created_at, a.updated_at,
+                GREATEST(a.created_at, a.updated_at) as changed_at,
+                to_char(a.created_at, 'YYYY-MM') as month,
+                s.teacher_id
+            FROM assessments a
+            LEFT JOIN students s ON s.id = a.student_id
+            {where}
+        """,
+        "changed": "GREATEST(a.created_at, a.updated_at)",
+        "schema": pa.schema([
+            ("id", pa.int32()),
+            ("data_entry_id", pa.string()),
+            ("student_id", pa.string()),
+            ("skill_name", DICTIONARY_STRING),
+            ("skill_category", DICTIONARY_STRING),
+            ("level", DICTIONARY_STRING),
+            ("level_numeric", pa.int16()),
+            ("confidence_score", pa.float64()),
+            ("justification", pa.string()),
+            ("source_quote", pa.string()),
+            ("data_point_count", pa.int32()),
+            ("rubric_version", DICTIONARY_STRING),
+            ("corrected", pa.bool_()),
+            ("observed_on", pa.date32()),
+            ("created_at", pa.timestamp("us")),
+            ("updated_at", pa.timestamp("us")),
+            ("changed_at", pa.timestamp("us")),
+        ]),
+    },
+    # Metadata only: the entry text itself stays in the database
+    "data_entries": {
+        "query": """
+            SELECT
+                de.id, de.student_id, de.teacher_id as entered_by, de.type, de.date,
+                de.metadata::text as metadata,
+                length(de.content) as content_length,
+                de.created_at,
+                de.created_at as changed_at,
+                to_char(de.date, 'YYYY-MM') as month,
+                s.teacher_id
+            FROM data_entries de
+            LEFT JOIN students s ON s.id = de.student_id
+            {where}
+        """,
+        "changed": "de.created_at",
+        "schema": pa.schema([
+            ("id", pa.string()),
+            ("student_id", pa.string()),
+            ("entered_by", pa.string()),
+            ("type", DICTIONARY_STRING),
+            ("date", pa.date32()),
+            ("metadata", pa.string()),
+            ("content_length", pa.int32()),
+            ("created_at", pa.timestamp("us")),
+            ("changed_at", pa.timestamp("us")),
+        ]),
+    },
+    "skill_targets": {
+        "query": """
+            SELECT
+                st.id, st.student_id, st.skill_name,
+                st.starting_level, st.target_level,
+                st.assigned_by, st.assigned_at, st.completed, st.completed_at,
+                GREATEST(st.assigned_at, st.completed_at) as changed_at,
+                to_char(st.assigned_at, 'YYYY-MM') as month,
+                s.teacher_id
+            FROM skill_targets st
+            LEFT JOIN students s ON s.id = st.student_id
+            {where}
+        """,
+        "changed": "GREATEST(st.assigned_at, st.completed_at)",
+        "schema": pa.schema([
+            ("id", pa.int32()),
+            ("student_id", pa.string()),
+            ("skill_name", DICTIONARY_STRING),
+            ("starting_level", DICTIONARY_STRING),
+            ("target_level", DICTIONARY_STRING),
+            ("assigned_by", pa.string()),
+            ("assigned_at", pa.timestamp("us")),
+            ("completed", pa.bool_()),
+            ("completed_at", pa.timestamp("us")),
+            ("changed_at", pa.timestamp("us")),
+        ]),
+    },
+    "badges": {
+        "query": """
+            SELECT
+                b.id, b.student_id, b.skill_name, b.skill_category,
+                b.level_achieved, b.badge_type, b.granted_by,
+                b.earned_date, b.created_at,
+                b.created_at as changed_at,
+                to_char(b.earned_date, 'YYYY-MM') as month,
+                s.teacher_id
+            FROM badges b
+            LEFT JOIN students s ON s.id = b.student_id
+            {where}
+        """,
+        "changed": "b.created_at",
+        "schema": pa.schema([
+            ("id", pa.int32()),
+            ("student_id", pa.string()),
+            ("skill_name", DICTIONARY_STRING),
+            ("skill_category", DICTIONARY_STRING),
+            ("level_achieved", DICTIONARY_STRING),
+            ("badge_type", DICTIONARY_STRING),
+            ("granted_by", pa.string()),
+            ("earned_date", pa.date32()),
+            ("created_at", pa.timestamp("us")),
+            ("changed_at", pa.timestamp("us")),
+        ]),
+    },
+}
+
+
+def row_schema(table: str) -> pa.Schema:
+    """Arrow schema of a snapshot table's rows, partition columns included"""
+    schema = SNAPSHOT_TABLES[table]["schema"]
+    for field in PARTITION_SCHEMA:
+        schema = schema.append(field)
+    return schema
+
+
+def dictionary_columns(table: str) -> List[str]:
+    """Columns of a snapshot table stored dictionary encoded"""
+    return [field.name for field in SNAPSHOT_TABLES[table]["schema"] if field.type == DICTIONARY_STRING]
+
+
+def load_state(root: Path = SNAPSHOT_DIR) -> Dict[str, Any]:
+    """
+    Read the snapshot state file
+
+    Returns:
+        {"tables": {table: {"watermark", "last_run", "rows"}}}; empty before
+        the first run
+    """
+    path = Path(root) / STATE_FILE
+    if not path.exists():
+        return {"tables": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state: Dict[str, Any], root: Path = SNAPSHOT_DIR):
+    """Write the snapshot state file atomically"""
+    path = Path(root) / STATE_FILE
+    partial = path.with_suffix(".partial")
+    with open(partial, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(partial, path)
+
+
+def stream_batches(cursor, schema: pa.Schema, progress: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+    """
+    Turn a server-side cursor into Arrow record batches
+
+    Counts the rows in `progress` as batches are consumed.
+    """
+    while True:
+        rows = cursor.fetchmany(SNAPSHOT_FETCH_SIZE)
+        if not rows:
+            return
+
+        progress["rows"] += len(rows)
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def write_live_ids(conn, table: str, root: Path):
+    """
+    Replace the table's list of live ids with the ids present in this snapshot
+    """
+    cursor = conn.cursor(name=f"snapshot_{table}_ids")
+    cursor.itersize = SNAPSHOT_FETCH_SIZE
+    id_type = SNAPSHOT_TABLES[table]["schema"].field("id").type
+    chunks = []
+
+    try:
+        # Table names come from SNAPSHOT_TABLES, never from input
+        cursor.execute(f"SELECT id FROM {table}")
+        while True:
+            rows = cursor.fetchmany(SNAPSHOT_FETCH_SIZE)
+            if not rows:
+                break
+            chunks.append(pa.array([row["id"] for row in rows], type=id_type))
+    finally:
+        cursor.close()
+
+    path = Path(root) / table / LIVE_IDS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    pq.write_table(
+        pa.table({"id": pa.chunked_array(chunks, type=id_type)}),
+        partial,
+        compression=PARQUET_COMPRESSION
+    )
+    os.replace(partial, path)
+
+
+def write_table(conn, table: str, root: Path, run_id: str, since: Optional[datetime]) -> int:
+    """
+    Append one table's rows changed since the watermark to its dataset
+
+    Args:
+        conn: psycopg2 connection, inside the run's snapshot transaction
+        table: Key of SNAPSHOT_TABLES
+        root: Snapshot directory
+        run_id: Identifier embedded in the new part files' names
+        since: Watermark from the previous run (None exports every row)
+
+    Returns:
+        Number of rows written
+    """
+    spec = SNAPSHOT_TABLES[table]
+    schema = row_schema(table)
+
+    where = ""
+    params = ()
+    if since is not None:
+        where = f"WHERE {spec['changed']} > %s"
+        params = (since,)
+
+    progress = {"rows": 0}
+    cursor = conn.cursor(name=f"snapshot_{table}")
+    cursor.itersize = SNAPSHOT_FETCH_SIZE
+
+    try:
+        cursor.execute(spec["query"].format(where=where), params)
+
+        parquet = ds.ParquetFileFormat()
+        ds.write_dataset(
+            stream_batches(cursor, schema, progress),
+            base_dir=str(Path(root) / table),
+            schema=schema,
+            format=parquet,
+            file_options=parquet.make_write_options(
+                compression=PARQUET_COMPRESSION,
+                use_dictionary=dictionary_columns(table)
+            ),
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            basename_template=f"part-{run_id}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+    finally:
+        cursor.close()
+
+    return progress["rows"]
+
+
+def run_snapshot(
+    root: Path = SNAPSHOT_DIR,
+    tables: Optional[Iterable[str]] = None,
+    full: bool = False
+) -> Dict[str, int]:
+    """
+    Export the snapshot tables, appending rows changed since the last run
+
+    All tables are read from one REPEATABLE READ snapshot, so they are
+    consistent with each other, and every table's new watermark is the
+    snapshot's (see WATERMARK_QUERY). A table's watermark is only advanced
+    after its files are written.
+
+    Args:
+        root: Snapshot directory
+        tables: Tables to export (default all of SNAPSHOT_TABLES)
+        full: Discard the existing datasets and export everything again
+
+    Returns:
+        Rows written per table
+    """
+    root = Path(root)
+    tables = list(tables or SNAPSHOT_TABLES)
+    unknown = [table for table in tables if table not in SNAPSHOT_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown snapshot tables: {', '.join(unknown)}")
+
+    root.mkdir(parents=True, exist_ok=True)
+    state = load_state(root)
+    # Unique per run: part files are named after it, and a name collision
+    # would overwrite an earlier run's rows
+    run_id = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+    written = {}
+
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+            # First query of the transaction, so it also fixes the snapshot
+            cursor.execute(WATERMARK_QUERY)
+            watermark = cursor.fetchone()["watermark"]
+
+        for table in tables:
+            table_state = state["tables"].get(table, {})
+            since = None
+
+            if full:
+                shutil.rmtree(root / table, ignore_errors=True)
+            elif table_state.get("watermark"):
+                since = datetime.fromisoformat(table_state["watermark"])
+
+            logger.info(f"Exporting {table} " + (f"changed since {since}" if since else "(all rows)"))
+            rows = write_table(conn, table, root, run_id, since)
+            write_live_ids(conn, table, root)
+
+            state["tables"][table] = {
+                "watermark": watermark.isoformat(),
+                "last_run": run_id,
+                "rows": rows
+            }
+            save_state(state, root)
+            written[table] = rows
+
+            logger.info(f"✓ {table}: {rows} rows")
+    finally:
+        # Read-only: nothing to commit
+        conn.rollback()
+        return_db_connection(conn)
+
+    return written
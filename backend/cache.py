@@ -0,0 +1,327 @@
+"""
+Response Cache
+
+In-process read-through cache for the API's read endpoints.
+
+Streamlit reruns a page script on every widget interaction, so the same
+student views are requested over and over between writes. Entries are keyed
+by endpoint and call arguments, expire after a TTL, and are evicted least
+recently used once the cache is full. Each entry is tagged with the students
+it describes; write endpoints call invalidate_student() so the next read
+sees the change immediately rather than after the TTL. Class-wide entries
+also carry their teacher's tag, dropped by invalidate_teacher() when the
+class gains or loses a student.
+
+The cache lives in the API process (start.py runs a single uvicorn worker).
+Writers outside the API, such as scripts/rescore_rubric_changes.py, are
+picked up when entries expire, or sooner when a conditional request sees the
+student's data version move (see conditional.py).
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
+
+# Configuration (can be overridden via environment variables)
+CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+# Seconds before an entry expires even without a write
+CACHE_DEFAULT_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+
+def student_tag(student_id: str) -> str:
+    """Tag carried by every entry that includes data for the student"""
+    return f"student:{student_id}"
+
+
+def teacher_tag(teacher_id: str) -> str:
+    """Tag carried by every entry that covers the teacher's whole class"""
+    return f"teacher:{teacher_id}"
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache with tag-based invalidation.
+
+    Safe to call from the event loop and from threadpool endpoints
+    (data_ingest invalidates from a worker thread).
+    """
+
+    def __init__(self, max_entries: int, default_ttl: float):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, tags), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Set[str]]]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[Hashable]] = {}
+        # Bumped by every invalidation; a read that overlapped one is not stored
+        self._write_generation = 0
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        # Last data version seen per student (see observe_student_version)
+        self._student_versions: Dict[str, int] = {}
+        # Last class membership seen per teacher (see observe_class_members)
+        self._class_members: Dict[str, FrozenSet[str]] = {}
+
+    @property
+    def write_generation(self) -> int:
+        return self._write_generation
+
+    def get(self, endpoint: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up an entry, counting the hit or miss against the endpoint
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits[endpoint] = self._hits.get(endpoint, 0) + 1
+            return True, entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str],
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None
+    ):
+        """
+        Store an entry, evicting the least recently used ones if full
+
+        Args:
+            key: Cache key
+            value: Response to cache
+            tags: Tags to invalidate the entry by
+            ttl: Seconds to keep the entry (default: the cache's default TTL)
+            generation: write_generation read before the value was computed;
+                if an invalidation happened since, the value may be stale and
+                is not stored
+        """
+        with self._lock:
+            if generation is not None and generation != self._write_generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            tag_set = set(tags)
+            expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+            self._entries[key] = (expires_at, value, tag_set)
+            for tag in tag_set:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, tag: str) -> int:
+        """
+        Drop every entry carrying the tag
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._write_generation += 1
+            keys = self._keys_by_tag.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def invalidate_student(self, student_id: Optional[str]) -> int:
+        """Drop every entry that includes data for the student"""
+        if not student_id:
+            return 0
+        return self.invalidate(student_tag(student_id))
+
+    def invalidate_teacher(self, teacher_id: Optional[str]) -> int:
+        """Drop every class-wide entry for the teacher"""
+        if not teacher_id:
+            return 0
+        return self.invalidate(teacher_tag(teacher_id))
+
+    def observe_student_version(self, student_id: str, version: int) -> bool:
+        """
+        Record a student's current data version from the database
+
+        Writers outside this process (scripts, other workers) move the version
+        without calling invalidate_student(); seeing a new version drops the
+        student's entries so nothing older than that version is served.
+
+        Returns:
+            True if the version changed and entries were dropped
+        """
+        with self._lock:
+            if self._student_versions.get(student_id) == version:
+                return False
+            self._student_versions[student_id] = version
+
+        self.invalidate_student(student_id)
+        return True
+
+    def observe_class_members(self, teacher_id: str, student_ids: Iterable[str]) -> bool:
+        """
+        Record a teacher's current students from the database
+
+        Students are added and moved between classes outside the API (seed
+        and ingest scripts). A student new to the class carries none of the
+        class entries' student tags, so seeing the membership change drops
+        the teacher's entries instead.
+
+        Returns:
+            True if the membership changed and entries were dropped
+        """
+        members = frozenset(student_ids)
+        with self._lock:
+            if self._class_members.get(teacher_id) == members:
+                return False
+            self._class_members[teacher_id] = members
+
+        self.invalidate_teacher(teacher_id)
+        return True
+
+    def clear(self):
+        """Drop all entries (statistics are kept)"""
+        with self._lock:
+            self._write_generation += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def _remove(self, key: Hashable):
+        """Remove an entry and its tag index references (caller holds the lock)"""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring
+
+        Returns:
+            Dictionary with size, overall and per-endpoint hit ratios,
+            and eviction/expiration/invalidation counts
+        """
+        with self._lock:
+            endpoints = sorted(set(self._hits) | set(self._misses))
+            by_endpoint = {}
+            for endpoint in endpoints:
+                hits = self._hits.get(endpoint, 0)
+                misses = self._misses.get(endpoint, 0)
+                by_endpoint[endpoint] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0
+                }
+
+            total_hits = sum(self._hits.values())
+            total_misses = sum(self._misses.values())
+
+            return {
+                "enabled": CACHE_ENABLED,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "default_ttl_seconds": self.default_ttl,
+                "hits": total_hits,
+                "misses": total_misses,
+                "hit_ratio": round(total_hits / (total_hits + total_misses), 3)
+                if total_hits + total_misses else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "by_endpoint": by_endpoint
+            }
+
+
+# Process-wide cache used by the routers
+response_cache = ResponseCache(CACHE_MAX_ENTRIES, CACHE_DEFAULT_TTL)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Statistics for the process-wide response cache"""
+    return response_cache.stats()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn an argument value into something usable in a cache key"""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def cached(
+    endpoint: str,
+    ttl: Optional[float] = None,
+    tags: Optional[Callable[[Dict[str, Any], Any], Iterable[str]]] = None
+):
+    """
+    Cache an async endpoint's return value
+
+    Place between @router.get(...) and the function. FastAPI still sees the
+    original signature. Exceptions (404s included) are never cached.
+
+    Args:
+        endpoint: Name used in the cache key and in per-endpoint statistics
+        ttl: Seconds to keep entries (default: RESPONSE_CACHE_TTL)
+        tags: Optional function of (arguments, result) returning the entry's
+            tags; by default entries are tagged with the student_id argument
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            key = (endpoint,) + tuple((name, _freeze(value)) for name, value in arguments.items())
+
+            hit, value = response_cache.get(endpoint, key)
+            if hit:
+                return value
+
+            generation = response_cache.write_generation
+            value = await func(*args, **kwargs)
+
+            if tags is not None:
+                entry_tags = tags(arguments, value)
+            elif arguments.get('student_id'):
+                entry_tags = [student_tag(arguments['student_id'])]
+            else:
+                entry_tags = []
+
+            response_cache.set(key, value, entry_tags, ttl, generation)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,194 @@
+"""
+Response Compression
+
+ASGI middleware that compresses response bodies with Brotli or gzip.
+
+The encoding is negotiated from Accept-Encoding: Brotli when the client
+accepts it (browsers, curl --compressed), else gzip (the Streamlit frontend's
+requests session). Bodies smaller than the size threshold, and responses that
+already carry a Content-Encoding, are sent unchanged. Streaming responses are
+compressed chunk by chunk and flushed after each chunk, so a client reading
+a long export still receives rows as they are produced.
+
+A compressed body is a different representation from the uncompressed one,
+so a strong ETag on it is sent as a weak ETag (W/"..."). If-None-Match uses
+weak comparison (see conditional.py), so revalidation is unaffected.
+"""
+
+import os
+import zlib
+from typing import Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Configuration (can be overridden via environment variables)
+# Bodies smaller than this many bytes are not compressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# Low levels: most of the size reduction on JSON at a fraction of the CPU
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+
+class GzipCompressor:
+    """Incremental gzip stream"""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so it can be sent now"""
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the last chunk and end the stream"""
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliCompressor:
+    """Incremental Brotli stream"""
+
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so it can be sent now"""
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the last chunk and end the stream"""
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def accepted_encodings(header: str) -> set:
+    """Content codings the client accepts, ignoring those refused with q=0"""
+    accepted = set()
+    for part in header.lower().split(","):
+        coding, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        if params in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Compress HTTP responses with the best encoding the client accepts
+
+    Args:
+        app: ASGI app to wrap
+        minimum_size: Smallest body, in bytes, that is compressed
+        gzip_level: zlib compression level (1-9)
+        brotli_quality: Brotli quality (0-11)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _compressor(self, scope: Scope):
+        """Compressor for the request's Accept-Encoding, or None"""
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if "br" in accepted:
+            return BrotliCompressor(self.brotli_quality)
+        if "gzip" in accepted:
+            return GzipCompressor(self.gzip_level)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            compressor = self._compressor(scope)
+            if compressor is not None:
+                responder = CompressionResponder(self.app, compressor, self.minimum_size)
+                await responder(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    """
+    Compresses one response
+
+    Holds back http.response.start until the first body chunk shows whether
+    the response is worth compressing, then rewrites its headers.
+    """
+
+    def __init__(self, app: ASGIApp, compressor, minimum_size: int):
+        self.app = app
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        # None until decided; False passes the body through unchanged
+        self.compressing: Optional[bool] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def _start_compressed(self, streaming: bool):
+        """Rewrite the held-back response headers for a compressed body"""
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        headers["Content-Encoding"] = self.compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+        if streaming:
+            del headers["Content-Length"]
+
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send_compressed(self, message: Message):
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Held until the first body chunk decides the headers
+            self.initial_message = message
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressing is None:
+            already_encoded = "content-encoding" in Headers(raw=self.initial_message["headers"])
+            self.compressing = not already_encoded and (more_body or len(body) >= self.minimum_size)
+
+            if self.compressing:
+                self._start_compressed(streaming=more_body)
+                if not more_body:
+                    body = self.compressor.finish(body)
+                    MutableHeaders(raw=self.initial_message["headers"])["Content-Length"] = str(len(body))
+                    message["body"] = body
+                else:
+                    message["body"] = self.compressor.compress(body)
+
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if self.compressing:
+            message["body"] = (
+                self.compressor.compress(body) if more_body else self.compressor.finish(body)
+            )
+
+        await self.send(message)
@@ -0,0 +1,99 @@
+"""
+Conditional Requests
+
+ETag / If-None-Match support for student-scoped GET endpoints.
+
+Each student has a data version in student_versions that triggers move
+forward on every write affecting them (migration 007). The ETag of a
+student-scoped response is derived from that version and the request URL,
+so checking freshness is a single primary-key lookup: when the client's
+If-None-Match still matches, the endpoint answers 304 without running its
+queries.
+
+Attach with dependencies=[Depends(student_etag)] on routes that have a
+student_id path parameter, or Depends(teacher_etag) on teacher_id routes.
+"""
+
+import hashlib
+from typing import Iterable
+
+from fastapi import HTTPException, Request, Response
+from cache import response_cache
+from database.repositories import students as students_repo
+from database.repositories import teachers as teachers_repo
+
+
+def make_etag(request: Request, version: str) -> str:
+    """
+    Build a strong ETag for a data version and the requested representation
+
+    The path and query string are folded in so that, for example, each page
+    of a paginated listing gets its own tag.
+    """
+    representation = f"{request.url.path}?{request.url.query}"
+    digest = hashlib.sha1(representation.encode()).hexdigest()[:12]
+    return f'"{version}-{digest}"'
+
+
+def if_none_match(request: Request) -> Iterable[str]:
+    """Entity tags listed in the request's If-None-Match header"""
+    header = request.headers.get("if-none-match", "")
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def check_etag(request: Request, response: Response, etag: str):
+    """
+    Answer 304 if the client already holds this ETag, else set it on the response
+
+    Raises:
+        HTTPException: 304 Not Modified carrying the ETag
+    """
+    tags = if_none_match(request)
+    if etag in tags or "*" in tags:
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+
+
+async def student_etag(student_id: str, request: Request, response: Response):
+    """
+    Dependency for routes scoped to one student
+
+    Unknown students are passed through so the endpoint can return its 404.
+    """
+    version = await students_repo.get_version(student_id)
+    if version is None:
+        return
+
+    # Entries cached before an out-of-process write must not be served
+    # under the new ETag
+    response_cache.observe_student_version(student_id, version)
+
+    check_etag(request, response, make_etag(request, str(version)))
+
+
+async def teacher_etag(teacher_id: str, request: Request, response: Response):
+    """
+    Dependency for class-wide routes
+
+    The tag covers the version of every student in the class, so it changes
+    when any of them is written to or the class membership changes.
+    """
+    versions = await teachers_repo.list_class_versions(teacher_id)
+    if versions is None:
+        return
+
+    # Dropping the class entries on a membership change keeps a dashboard
+    # cached before a student joined from being served under the new ETag
+    response_cache.observe_class_members(teacher_id, [row['student_id'] for row in versions])
+
+    for row in versions:
+        if row['version'] is not None:
+            response_cache.observe_student_version(row['student_id'], row['version'])
+
+    class_version = hashlib.sha1(
+        ",".join(f"{row['student_id']}:{row['version']}" for row in versions).encode()
+    ).hexdigest()[:16]
+
+    check_etag(request, response, make_etag(request, class_version))
@@ -1,3 +1,11 @@
-from .connection import get_db_connection, test_connection, get_student_count
+from .connection import (
+    get_db_connection, return_db_connection, db, test_connection,
+    get_student_count, get_pool_stats, DatabaseUnavailableError
+)
+from .async_connection import adb, get_async_pool_stats
 
-__all__ = ['get_db_connection', 'test_connection', 'get_student_count']
+__all__ = [
+    'get_db_connection', 'return_db_connection', 'db', 'test_connection',
+    'get_student_count', 'get_pool_stats', 'DatabaseUnavailableError',
+    'adb', 'get_async_pool_stats'
+]
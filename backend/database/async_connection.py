@@ -0,0 +1,234 @@
+"""
+Async database access for Flourish Skills Tracker.
+
+The read/write API endpoints run on the event loop, so they must not block
+it with psycopg2 calls. This module provides an asyncpg connection pool that
+is created at application startup and shared by the repository layer in
+database/repositories.
+
+asyncpg prepares every statement it executes and keeps them in a
+per-connection LRU cache, so repository queries (which are constant strings)
+are parsed and planned once per connection and then reused.
+
+Single statements use the fetch()/fetchrow()/fetchval() helpers, which run in
+autocommit mode; multi-statement work uses adb() for a transaction, and
+result sets too large to hold in memory are read in chunks with stream():
+
+    name = await fetchval("SELECT name FROM students WHERE id = $1", student_id)
+
+    async with adb() as conn:
+        await conn.execute("INSERT ...", ...)
+        await conn.execute("UPDATE ...", ...)
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Dict, Any
+import logging
+
+import asyncpg
+
+from .connection import DatabaseUnavailableError, POOL_ACQUIRE_TIMEOUT, WAIT_SAMPLE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Async pool configuration
+# Shares the ~20 connection budget with the sync pool used by ingestion
+ASYNC_POOL_MIN_CONNECTIONS = int(os.getenv("DB_ASYNC_POOL_MIN", "2"))
+ASYNC_POOL_MAX_CONNECTIONS = int(os.getenv("DB_ASYNC_POOL_MAX", "10"))
+# Prepared statements cached per connection
+STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+# Idle connections are closed after this many seconds (0 disables)
+MAX_INACTIVE_CONNECTION_LIFETIME = float(os.getenv("DB_ASYNC_MAX_IDLE", "300"))
+
+# Global async pool (created by init_async_pool at startup)
+_async_pool: Optional[asyncpg.Pool] = None
+_async_pool_lock = asyncio.Lock()
+
+# Acquisition metrics (event loop is single-threaded, no lock needed)
+_acquired = 0
+_timeouts = 0
+_total_wait = 0.0
+_max_wait = 0.0
+_recent_waits = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+
+async def init_async_pool():
+    """
+    Create the asyncpg pool.
+
+    Called at application startup and lazily on first use.
+    Safe to call multiple times (idempotent).
+    """
+    global _async_pool
+
+    async with _async_pool_lock:
+        if _async_pool is not None:
+            return
+
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL environment variable not set")
+
+        _async_pool = await asyncpg.create_pool(
+            dsn=database_url,
+            min_size=ASYNC_POOL_MIN_CONNECTIONS,
+            max_size=ASYNC_POOL_MAX_CONNECTIONS,
+            statement_cache_size=STATEMENT_CACHE_SIZE,
+            max_inactive_connection_lifetime=MAX_INACTIVE_CONNECTION_LIFETIME,
+            reset=_skip_session_reset,
+            timeout=10  # 10 second connection timeout
+        )
+        logger.info(
+            f"✓ Async database pool initialized "
+            f"({ASYNC_POOL_MIN_CONNECTIONS}-{ASYNC_POOL_MAX_CONNECTIONS} connections)"
+        )
+
+
+async def _skip_session_reset(conn: asyncpg.Connection):
+    """
+    Pool reset hook replacing asyncpg's default per-release reset query.
+
+    The default (RESET ALL, UNLISTEN *, advisory unlock, ...) costs a round
+    trip on every release, but the repositories never change session state.
+    Only a transaction left open by a cancelled request needs cleaning up.
+    """
+    if conn.is_in_transaction():
+        await conn.execute("ROLLBACK")
+
+
+@asynccontextmanager
+async def _acquire(timeout: Optional[float] = None):
+    """Check out a pooled connection, recording wait time; 503 on timeout."""
+    global _acquired, _timeouts, _total_wait, _max_wait
+
+    if _async_pool is None:
+        await init_async_pool()
+
+    timeout = POOL_ACQUIRE_TIMEOUT if timeout is None else timeout
+    start = time.perf_counter()
+
+    try:
+        conn = await _async_pool.acquire(timeout=timeout)
+    except asyncio.TimeoutError:
+        _timeouts += 1
+        logger.warning(f"Timed out after {timeout:.1f}s waiting for an async database connection")
+        raise DatabaseUnavailableError()
+
+    waited = time.perf_counter() - start
+    _acquired += 1
+    _total_wait += waited
+    _max_wait = max(_max_wait, waited)
+    _recent_waits.append(waited)
+
+    try:
+        yield conn
+    finally:
+        await _async_pool.release(conn)
+
+
+@asynccontextmanager
+async def adb(timeout: Optional[float] = None):
+    """
+    Async context manager yielding a pooled asyncpg connection in a transaction.
+
+    Commits when the block exits normally and rolls back if it raises.
+
+    Args:
+        timeout: Seconds to wait for a free connection (default DB_POOL_ACQUIRE_TIMEOUT)
+
+    Yields:
+        asyncpg.Connection
+
+    Raises:
+        DatabaseUnavailableError: If no connection is free within the timeout
+    """
+    async with _acquire(timeout) as conn:
+        async with conn.transaction():
+            yield conn
+
+
+async def fetch(query: str, *args) -> List[asyncpg.Record]:
+    """Run a single statement on a pooled connection and return all rows."""
+    async with _acquire() as conn:
+        return await conn.fetch(query, *args)
+
+
+async def fetchrow(query: str, *args) -> Optional[asyncpg.Record]:
+    """Run a single statement on a pooled connection and return the first row."""
+    async with _acquire() as conn:
+        return await conn.fetchrow(query, *args)
+
+
+async def fetchval(query: str, *args) -> Any:
+    """Run a single statement on a pooled connection and return the first value."""
+    async with _acquire() as conn:
+        return await conn.fetchval(query, *args)
+
+
+async def stream(query: str, *args, chunk_size: int = 1000) -> AsyncIterator[List[asyncpg.Record]]:
+    """
+    Run a query through a server-side cursor and yield its rows in chunks.
+
+    Only one chunk is held in memory at a time, however many rows match.
+    The cursor lives in a read-only REPEATABLE READ transaction, so every
+    chunk comes from the same snapshot; the pooled connection stays checked
+    out until the iterator is exhausted or closed.
+
+    Args:
+        query: SELECT statement
+        *args: Query parameters
+        chunk_size: Rows fetched from the cursor per round trip
+
+    Yields:
+        Lists of at most chunk_size rows
+    """
+    async with _acquire() as conn:
+        async with conn.transaction(isolation='repeatable_read', readonly=True):
+            cursor = await conn.cursor(query, *args)
+            while True:
+                rows = await cursor.fetch(chunk_size)
+                if not rows:
+                    return
+                yield rows
+
+
+def get_async_pool_stats() -> Dict[str, Any]:
+    """
+    Get async pool usage and wait-time metrics (milliseconds).
+
+    Returns:
+        Dictionary of pool metrics, or {"initialized": False} before first use
+    """
+    if _async_pool is None:
+        return {"initialized": False}
+
+    waits = sorted(_recent_waits)
+    return {
+        "initialized": True,
+        "max_connections": _async_pool.get_max_size(),
+        "size": _async_pool.get_size(),
+        "idle": _async_pool.get_idle_size(),
+        "acquired": _acquired,
+        "timeouts": _timeouts,
+        "wait_ms_avg": round(_total_wait / _acquired * 1000, 2) if _acquired else 0.0,
+        "wait_ms_p50": round(waits[len(waits) // 2] * 1000, 2) if waits else 0.0,
+        "wait_ms_p95": round(waits[int(len(waits) * 0.95)] * 1000, 2) if waits else 0.0,
+        "wait_ms_max": round(_max_wait * 1000, 2),
+    }
+
+
+async def close_async_pool():
+    """
+    Close the async pool.
+
+    Called during application shutdown.
+    """
+    global _async_pool
+
+    if _async_pool is not None:
+        await _async_pool.close()
+        logger.info("✓ Async database pool closed")
+        _async_pool = None
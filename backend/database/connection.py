@@ -1,21 +1,188 @@
 """
 Database connection utility for Flourish Skills Tracker.
 
-Uses connection pooling to efficiently manage database connections
+Uses a thread-safe connection pool to efficiently manage database connections
 and prevent connection exhaustion on free tier (max 20 connections).
+
+Preferred usage is the db() context manager, which checks out a connection,
+commits on success, rolls back on error and always returns the connection:
+
+    with db() as cursor:
+        cursor.execute("SELECT name FROM students WHERE id = %s", (student_id,))
+        student = cursor.fetchone()
+
+If no connection frees up within DB_POOL_ACQUIRE_TIMEOUT seconds, a
+DatabaseUnavailableError (HTTP 503) is raised instead of hanging the request.
 """
 import os
 import time
+import threading
 import psycopg2
+from collections import deque
+from contextlib import contextmanager
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
-from typing import Optional
+from fastapi import HTTPException
+from typing import Optional, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Global connection pool (initialized on first import)
-_connection_pool: Optional[pool.SimpleConnectionPool] = None
+# Pool configuration
+# Free tier PostgreSQL on Render has ~20 max connections
+# Use conservative limits to avoid exhaustion. This pool only serves
+# ingestion and AI work; API reads go through the async pool.
+POOL_MIN_CONNECTIONS = int(os.getenv("DB_POOL_MIN", "1"))
+POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX", "6"))
+# Seconds to wait for a free connection before answering 503
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "5"))
+# Connections idle longer than this are pinged before being handed out
+POOL_HEALTH_CHECK_AFTER = float(os.getenv("DB_POOL_HEALTH_CHECK_AFTER", "30"))
+# Number of recent wait times kept for percentile metrics
+WAIT_SAMPLE_SIZE = 1000
+
+
+class DatabaseUnavailableError(HTTPException):
+    """
+    Raised when no database connection can be acquired in time.
+
+    Subclasses HTTPException so routers' `except HTTPException: raise`
+    clauses pass it through and the client receives a 503.
+    """
+
+    def __init__(self, detail: str = "Database is busy, please retry shortly"):
+        super().__init__(status_code=503, detail=detail, headers={"Retry-After": "1"})
+
+
+class BoundedConnectionPool:
+    """
+    Thread-safe connection pool with bounded acquisition waits.
+
+    Wraps psycopg2's ThreadedConnectionPool (which fails immediately when
+    exhausted) with a semaphore so callers queue for up to a timeout, checks
+    connection health on checkout, and records wait-time metrics.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, acquire_timeout: float, **connect_kwargs):
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **connect_kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._acquire_timeout = acquire_timeout
+        self._maxconn = maxconn
+        self._last_used: Dict[int, float] = {}
+
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._replaced = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recent_waits = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def getconn(self, timeout: Optional[float] = None):
+        """
+        Check out a healthy connection, waiting up to the acquisition timeout.
+
+        Raises:
+            DatabaseUnavailableError: If no connection frees up in time
+        """
+        timeout = self._acquire_timeout if timeout is None else timeout
+        start = time.perf_counter()
+
+        if not self._slots.acquire(timeout=timeout):
+            with self._stats_lock:
+                self._timeouts += 1
+            logger.warning(f"Timed out after {timeout:.1f}s waiting for a database connection")
+            raise DatabaseUnavailableError()
+
+        try:
+            conn = self._checkout_healthy()
+        except Exception:
+            self._slots.release()
+            raise
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self._in_use += 1
+            self._acquired += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._recent_waits.append(waited)
+
+        return conn
+
+    def putconn(self, conn, close: bool = False):
+        """Return a connection (psycopg2 rolls back any open transaction)."""
+        try:
+            if close or conn.closed:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=close)
+            # Connections beyond minconn are closed by psycopg2 on return
+            if conn.closed:
+                self._last_used.pop(id(conn), None)
+        finally:
+            with self._stats_lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def closeall(self):
+        """Close every connection in the pool."""
+        self._pool.closeall()
+        self._last_used.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage and acquisition wait-time metrics (milliseconds)."""
+        with self._stats_lock:
+            waits = sorted(self._recent_waits)
+            acquired = self._acquired
+            return {
+                "max_connections": self._maxconn,
+                "in_use": self._in_use,
+                "acquired": acquired,
+                "timeouts": self._timeouts,
+                "replaced_unhealthy": self._replaced,
+                "wait_ms_avg": round(self._total_wait / acquired * 1000, 2) if acquired else 0.0,
+                "wait_ms_p50": round(waits[len(waits) // 2] * 1000, 2) if waits else 0.0,
+                "wait_ms_p95": round(waits[int(len(waits) * 0.95)] * 1000, 2) if waits else 0.0,
+                "wait_ms_max": round(self._max_wait * 1000, 2),
+            }
+
+    def _checkout_healthy(self):
+        """Get a connection from the pool, replacing it once if it fails a health check."""
+        conn = self._pool.getconn()
+        if self._is_healthy(conn):
+            return conn
+
+        logger.warning("Discarding unhealthy pooled connection")
+        with self._stats_lock:
+            self._replaced += 1
+        self._last_used.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+        return self._pool.getconn()
+
+    def _is_healthy(self, conn) -> bool:
+        """Cheap closed check always; round-trip ping only after an idle period."""
+        if conn.closed:
+            return False
+
+        last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < POOL_HEALTH_CHECK_AFTER:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+
+# Global connection pool (initialized on first use)
+_connection_pool: Optional[BoundedConnectionPool] = None
+_pool_init_lock = threading.Lock()
 
 
 def init_connection_pool():
@@ -23,77 +190,82 @@ def init_connection_pool():
     Initialize the connection pool with retry logic.
 
     Called automatically on first connection request.
-    Safe to call multiple times (idempotent).
+    Safe to call multiple times and from multiple threads (idempotent).
 
     Retries with exponential backoff to handle database startup delays.
     """
     global _connection_pool
 
-    if _connection_pool is not None:
-        return  # Already initialized
-
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable not set")
-
-    # Retry configuration for database startup
-    max_retries = 5
-    retry_delay = 1  # Start with 1 second
-
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.info(f"Initializing database connection pool (attempt {attempt}/{max_retries})...")
-
-            # Create connection pool
-            # Free tier PostgreSQL on Render has ~20 max connections
-            # Use conservative limits to avoid exhaustion
-            _connection_pool = pool.SimpleConnectionPool(
-                minconn=2,   # Keep 2 connections warm
-                maxconn=10,  # Max 10 connections (safe for free tier)
-                dsn=database_url,
-                cursor_factory=RealDictCursor,
-                connect_timeout=10  # 10 second connection timeout
-            )
-            logger.info("✓ Database connection pool initialized (2-10 connections)")
-            return  # Success!
-
-        except (psycopg2.OperationalError, psycopg2.DatabaseError) as e:
-            if attempt < max_retries:
-                logger.warning(f"Connection attempt {attempt} failed: {e}")
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay = min(retry_delay * 2, 16)  # Exponential backoff, max 16s
-            else:
-                logger.error(f"Failed to initialize connection pool after {max_retries} attempts: {e}")
+    with _pool_init_lock:
+        if _connection_pool is not None:
+            return  # Already initialized
+
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL environment variable not set")
+
+        # Retry configuration for database startup
+        max_retries = 5
+        retry_delay = 1  # Start with 1 second
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                logger.info(f"Initializing database connection pool (attempt {attempt}/{max_retries})...")
+
+                _connection_pool = BoundedConnectionPool(
+                    minconn=POOL_MIN_CONNECTIONS,
+                    maxconn=POOL_MAX_CONNECTIONS,
+                    acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+                    dsn=database_url,
+                    cursor_factory=RealDictCursor,
+                    connect_timeout=10  # 10 second connection timeout
+                )
+                logger.info(
+                    f"✓ Database connection pool initialized "
+                    f"({POOL_MIN_CONNECTIONS}-{POOL_MAX_CONNECTIONS} connections)"
+                )
+                return  # Success!
+
+            except (psycopg2.OperationalError, psycopg2.DatabaseError) as e:
+                if attempt < max_retries:
+                    logger.warning(f"Connection attempt {attempt} failed: {e}")
+                    logger.info(f"Retrying in {retry_delay} seconds...")
+                    time.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, 16)  # Exponential backoff, max 16s
+                else:
+                    logger.error(f"Failed to initialize connection pool after {max_retries} attempts: {e}")
+                    raise
+            except Exception as e:
+                logger.error(f"Unexpected error initializing connection pool: {e}")
                 raise
-        except Exception as e:
-            logger.error(f"Unexpected error initializing connection pool: {e}")
-            raise
 
 
-def get_db_connection():
+def get_db_connection(timeout: Optional[float] = None):
     """
     Get a connection from the pool.
 
+    Args:
+        timeout: Seconds to wait for a free connection (default DB_POOL_ACQUIRE_TIMEOUT)
+
     Returns:
         psycopg2 connection object with RealDictCursor
 
     Raises:
+        DatabaseUnavailableError: If no connection is free within the timeout
         psycopg2.OperationalError: If connection fails
 
     Note:
-        Caller MUST call putconn() to return connection to pool,
-        or use the connection context manager.
+        Caller MUST call return_db_connection() to return the connection,
+        or use the db() context manager instead.
     """
-    global _connection_pool
-
     # Initialize pool on first use
     if _connection_pool is None:
         init_connection_pool()
 
     try:
-        conn = _connection_pool.getconn()
-        return conn
+        return _connection_pool.getconn(timeout=timeout)
+    except DatabaseUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Failed to get connection from pool: {e}")
         raise
@@ -106,12 +278,49 @@ def return_db_connection(conn):
     Args:
         conn: Connection to return
     """
-    global _connection_pool
-
     if _connection_pool is not None and conn is not None:
         _connection_pool.putconn(conn)
 
 
+@contextmanager
+def db(timeout: Optional[float] = None):
+    """
+    Context manager yielding a cursor on a pooled connection.
+
+    Commits when the block exits normally and rolls back if it raises.
+    Long-running blocks can commit intermediate work via cursor.connection.commit().
+
+    Args:
+        timeout: Seconds to wait for a free connection (default DB_POOL_ACQUIRE_TIMEOUT)
+
+    Yields:
+        RealDictCursor
+    """
+    conn = get_db_connection(timeout=timeout)
+    cursor = conn.cursor()
+    try:
+        yield cursor
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        return_db_connection(conn)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get connection pool usage and wait-time metrics.
+
+    Returns:
+        Dictionary of pool metrics, or {"initialized": False} before first use
+    """
+    if _connection_pool is None:
+        return {"initialized": False}
+    return {"initialized": True, **_connection_pool.stats()}
+
+
 def test_connection() -> bool:
     """
     Test database connectivity using connection pool.
@@ -119,37 +328,21 @@ def test_connection() -> bool:
     Returns:
         bool: True if connection successful, False otherwise
     """
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 as test")
-        result = cursor.fetchone()
-        cursor.close()
-        return_db_connection(conn)
+        with db() as cursor:
+            cursor.execute("SELECT 1 as test")
+            result = cursor.fetchone()
         return result['test'] == 1
     except Exception as e:
         logger.error(f"Connection test failed: {e}")
-        if conn:
-            return_db_connection(conn)
         return False
 
 
 def get_student_count() -> int:
     """Helper to verify seed data loaded."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    with db() as cursor:
         cursor.execute("SELECT COUNT(*) as count FROM students")
-        result = cursor.fetchone()
-        cursor.close()
-        return_db_connection(conn)
-        return result['count']
-    except Exception as e:
-        if conn:
-            return_db_connection(conn)
-        raise
+        return cursor.fetchone()['count']
 
 
 def close_all_connections():
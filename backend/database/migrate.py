@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 # Cache to track if we've already verified migrations in this session
 _migration_verified = False
 
+# Numbered schema changes applied after init.sql (e.g. 001_rubric_versions.sql)
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
 
 def check_tables_exist(cursor) -> bool:
     """
@@ -94,6 +97,47 @@ def run_sql_file(cursor, conn, sql_file_path: Path, description: str):
     logger.info(f"✓ {description} completed successfully in {elapsed:.2f}s")
 
 
+def run_versioned_migrations(cursor, conn):
+    """
+    Apply numbered SQL files from database/migrations/ that have not run yet.
+
+    Each file runs in its own transaction together with its schema_migrations
+    record, so a failed migration is retried on the next startup.
+
+    Args:
+        cursor: Database cursor
+        conn: Database connection
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(100) PRIMARY KEY,
+            applied_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+    conn.commit()
+
+    cursor.execute("SELECT version FROM schema_migrations")
+    applied = {row[0] for row in cursor.fetchall()}
+
+    pending = [path for path in sorted(MIGRATIONS_DIR.glob("*.sql")) if path.stem not in applied]
+
+    if not pending:
+        logger.info(f"✓ Schema migrations up to date ({len(applied)} applied)")
+        return
+
+    for migration_path in pending:
+        logger.info(f"Applying schema migration: {migration_path.name}")
+        start_time = time.time()
+
+        with open(migration_path, 'r', encoding='utf-8') as f:
+            cursor.execute(f.read())
+        cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (migration_path.stem,))
+        conn.commit()
+
+        elapsed = time.time() - start_time
+        logger.info(f"✓ Migration {migration_path.stem} applied in {elapsed:.2f}s")
+
+
 def run_migrations():
     """
     Main migration function - runs database initialization if needed.
@@ -104,6 +148,7 @@ def run_migrations():
     2. If not, create schema from init.sql
     3. Check if sample assessments exist
     4. If not, load seed_assessments.sql
+    5. Apply any pending numbered migrations from database/migrations/
 
     This runs automatically on backend startup to ensure database is ready.
 
@@ -178,6 +223,9 @@ def run_migrations():
         else:
             logger.info(f"✓ Sample assessments already exist ({seed_count} found) - skipping seed load")
 
+        # Step 4: Apply schema migrations added after the initial schema
+        run_versioned_migrations(cursor, conn)
+
         # Verify assessments were loaded
         cursor.execute("SELECT COUNT(*) FROM assessments")
         count = cursor.fetchone()[0]
@@ -0,0 +1,29 @@
+-- Flourish Skills Tracker Migration 001
+-- Rubric version registry and per-entry inference fingerprints
+-- Used by scripts/rescore_rubric_changes.py to re-assess only what a rubric change affects
+
+-- ============================================================================
+-- RUBRIC VERSIONS TABLE
+-- ============================================================================
+-- One row per registered rubric version with a SHA-256 hash per skill section
+-- (plus "__global__" for the shared level definitions and table headers)
+CREATE TABLE IF NOT EXISTS rubric_versions (
+    version VARCHAR(10) PRIMARY KEY,
+    section_hashes JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- ============================================================================
+-- INFERENCE FINGERPRINTS TABLE
+-- ============================================================================
+-- Hash of the prompt inputs (user prompt + rubric sections of the entry's skills)
+-- that produced an entry's current assessments. Written per batch by the
+-- re-scoring pipeline, which makes interrupted runs resumable.
+CREATE TABLE IF NOT EXISTS inference_fingerprints (
+    data_entry_id VARCHAR(20) PRIMARY KEY REFERENCES data_entries(id) ON DELETE CASCADE,
+    rubric_version VARCHAR(10) NOT NULL,
+    prompt_hash CHAR(64) NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_assessments_rubric_version ON assessments(rubric_version);
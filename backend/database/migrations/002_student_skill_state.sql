@@ -0,0 +1,191 @@
+-- Flourish Skills Tracker Migration 002
+-- Trigger-maintained current level per student and skill
+-- Lets progress endpoints read latest/previous levels with one indexed lookup
+-- instead of window functions over the student's full assessment history
+
+-- ============================================================================
+-- STUDENT SKILL STATE TABLE
+-- ============================================================================
+-- "Latest" is the assessment with the newest observation date (data entry
+-- date, ties broken by assessment id). previous_level is the level held before
+-- the most recent level change, and level_changed_on is when that change was
+-- observed; both are NULL while a skill has only ever had one level.
+CREATE TABLE IF NOT EXISTS student_skill_state (
+    student_id VARCHAR(10) REFERENCES students(id) ON DELETE CASCADE,
+    skill_name VARCHAR(100) NOT NULL,
+    skill_category VARCHAR(50) NOT NULL,
+    latest_level VARCHAR(20) NOT NULL,
+    previous_level VARCHAR(20),
+    last_observed_on DATE NOT NULL,
+    level_changed_on DATE,
+    latest_assessment_id INTEGER NOT NULL,
+    assessment_count INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (student_id, skill_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_skill_state_level_changes
+    ON student_skill_state(student_id, level_changed_on DESC)
+    WHERE previous_level IS NOT NULL;
+
+-- ============================================================================
+-- FUNCTION: Rebuild one student/skill row from assessment history
+-- ============================================================================
+-- Used for backfill and for changes the insert fast path cannot apply
+-- (deletes, level/skill edits, and observations older than the latest one).
+CREATE OR REPLACE FUNCTION refresh_student_skill_state(p_student_id VARCHAR, p_skill_name VARCHAR)
+RETURNS VOID AS $$
+DECLARE
+    v_latest RECORD;
+    v_previous RECORD;
+    v_changed_on DATE;
+    v_count INTEGER;
+BEGIN
+    SELECT a.id, a.level, a.skill_category, de.date
+    INTO v_latest
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+    ORDER BY de.date DESC, a.id DESC
+    LIMIT 1;
+
+    IF NOT FOUND THEN
+        DELETE FROM student_skill_state
+        WHERE student_id = p_student_id AND skill_name = p_skill_name;
+        RETURN;
+    END IF;
+
+    SELECT COUNT(*)
+    INTO v_count
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name;
+
+    -- The newest assessment at a different level precedes the last change
+    SELECT a.id, a.level, de.date
+    INTO v_previous
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+      AND a.level <> v_latest.level
+    ORDER BY de.date DESC, a.id DESC
+    LIMIT 1;
+
+    IF FOUND THEN
+        SELECT de.date
+        INTO v_changed_on
+        FROM assessments a
+        JOIN data_entries de ON a.data_entry_id = de.id
+        WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+          AND (de.date, a.id) > (v_previous.date, v_previous.id)
+        ORDER BY de.date ASC, a.id ASC
+        LIMIT 1;
+    END IF;
+
+    INSERT INTO student_skill_state (
+        student_id, skill_name, skill_category, latest_level, previous_level,
+        last_observed_on, level_changed_on, latest_assessment_id, assessment_count, updated_at
+    )
+    VALUES (
+        p_student_id, p_skill_name, v_latest.skill_category, v_latest.level,
+        CASE WHEN v_previous.id IS NULL THEN NULL ELSE v_previous.level END,
+        v_latest.date, v_changed_on, v_latest.id, v_count, NOW()
+    )
+    ON CONFLICT (student_id, skill_name) DO UPDATE SET
+        skill_category = EXCLUDED.skill_category,
+        latest_level = EXCLUDED.latest_level,
+        previous_level = EXCLUDED.previous_level,
+        last_observed_on = EXCLUDED.last_observed_on,
+        level_changed_on = EXCLUDED.level_changed_on,
+        latest_assessment_id = EXCLUDED.latest_assessment_id,
+        assessment_count = EXCLUDED.assessment_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- TRIGGER: Keep student_skill_state in step with assessments
+-- ============================================================================
+CREATE OR REPLACE FUNCTION maintain_student_skill_state()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_date DATE;
+BEGIN
+    -- Serialize writers per student/skill so concurrent rebuilds see each other's rows
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(NEW.student_id || '/' || NEW.skill_name));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(OLD.student_id || '/' || OLD.skill_name));
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT date INTO v_date FROM data_entries WHERE id = NEW.data_entry_id;
+        IF v_date IS NULL THEN
+            RETURN NULL;
+        END IF;
+
+        -- Fast path: the new assessment is the latest observation for the skill
+        UPDATE student_skill_state
+        SET previous_level = CASE WHEN latest_level <> NEW.level THEN latest_level ELSE previous_level END,
+            level_changed_on = CASE WHEN latest_level <> NEW.level THEN v_date ELSE level_changed_on END,
+            latest_level = NEW.level,
+            skill_category = NEW.skill_category,
+            last_observed_on = v_date,
+            latest_assessment_id = NEW.id,
+            assessment_count = assessment_count + 1,
+            updated_at = NOW()
+        WHERE student_id = NEW.student_id AND skill_name = NEW.skill_name
+          AND (last_observed_on, latest_assessment_id) < (v_date, NEW.id);
+
+        IF NOT FOUND THEN
+            PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        IF (OLD.student_id, OLD.skill_name) IS DISTINCT FROM (NEW.student_id, NEW.skill_name) THEN
+            PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_student_skill_state_insert ON assessments;
+CREATE TRIGGER trigger_student_skill_state_insert
+AFTER INSERT ON assessments
+FOR EACH ROW
+EXECUTE FUNCTION maintain_student_skill_state();
+
+-- Only changes that affect the derived state trigger a rebuild
+-- (not corrected/confidence updates made during review)
+DROP TRIGGER IF EXISTS trigger_student_skill_state_update ON assessments;
+CREATE TRIGGER trigger_student_skill_state_update
+AFTER UPDATE OF level, skill_name, skill_category, student_id, data_entry_id ON assessments
+FOR EACH ROW
+WHEN (
+    OLD.level IS DISTINCT FROM NEW.level
+    OR OLD.skill_name IS DISTINCT FROM NEW.skill_name
+    OR OLD.skill_category IS DISTINCT FROM NEW.skill_category
+    OR OLD.student_id IS DISTINCT FROM NEW.student_id
+    OR OLD.data_entry_id IS DISTINCT FROM NEW.data_entry_id
+)
+EXECUTE FUNCTION maintain_student_skill_state();
+
+DROP TRIGGER IF EXISTS trigger_student_skill_state_delete ON assessments;
+CREATE TRIGGER trigger_student_skill_state_delete
+AFTER DELETE ON assessments
+FOR EACH ROW
+EXECUTE FUNCTION maintain_student_skill_state();
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+SELECT refresh_student_skill_state(student_id, skill_name)
+FROM (SELECT DISTINCT student_id, skill_name FROM assessments) AS pairs;
@@ -0,0 +1,216 @@
+-- Flourish Skills Tracker Migration 003
+-- Canonical proficiency levels with a numeric column
+-- Seed data stores full names ('Emerging') while AI inference wrote letters ('E');
+-- levels are now stored as full names alongside a 1-4 smallint used for
+-- comparisons, so queries no longer translate labels with CASE blocks
+
+-- ============================================================================
+-- FUNCTIONS: Canonical level mapping (mirrors models/levels.py)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION canonical_level(p_level VARCHAR)
+RETURNS VARCHAR AS $$
+    SELECT CASE lower(trim(p_level))
+        WHEN 'e' THEN 'Emerging'
+        WHEN 'emerging' THEN 'Emerging'
+        WHEN 'd' THEN 'Developing'
+        WHEN 'developing' THEN 'Developing'
+        WHEN 'p' THEN 'Proficient'
+        WHEN 'proficient' THEN 'Proficient'
+        WHEN 'a' THEN 'Advanced'
+        WHEN 'advanced' THEN 'Advanced'
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 1=Emerging, 2=Developing, 3=Proficient, 4=Advanced; NULL for unknown labels
+CREATE OR REPLACE FUNCTION level_to_numeric(p_level VARCHAR)
+RETURNS SMALLINT AS $$
+    SELECT (array_position(
+        ARRAY['Emerging', 'Developing', 'Proficient', 'Advanced']::VARCHAR[],
+        canonical_level(p_level)
+    ))::SMALLINT
+$$ LANGUAGE sql IMMUTABLE;
+
+-- ============================================================================
+-- ASSESSMENTS: level_numeric column
+-- ============================================================================
+ALTER TABLE assessments ADD COLUMN IF NOT EXISTS level_numeric SMALLINT;
+
+ALTER TABLE assessments DROP CONSTRAINT IF EXISTS assessments_level_numeric_check;
+ALTER TABLE assessments ADD CONSTRAINT assessments_level_numeric_check
+    CHECK (level_numeric BETWEEN 1 AND 4);
+
+-- Application code writes canonical levels (models/levels.py); this trigger is
+-- the safety net for any other writer and keeps level_numeric derived from level
+CREATE OR REPLACE FUNCTION normalize_assessment_level()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF canonical_level(NEW.level) IS NULL THEN
+        RAISE EXCEPTION 'Unknown proficiency level: %', NEW.level
+            USING ERRCODE = 'check_violation';
+    END IF;
+    NEW.level := canonical_level(NEW.level);
+    NEW.level_numeric := level_to_numeric(NEW.level);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_normalize_assessment_level ON assessments;
+CREATE TRIGGER trigger_normalize_assessment_level
+BEFORE INSERT OR UPDATE OF level, level_numeric ON assessments
+FOR EACH ROW
+EXECUTE FUNCTION normalize_assessment_level();
+
+-- ============================================================================
+-- STUDENT SKILL STATE: latest_level_numeric column
+-- ============================================================================
+ALTER TABLE student_skill_state ADD COLUMN IF NOT EXISTS latest_level_numeric SMALLINT;
+
+CREATE OR REPLACE FUNCTION refresh_student_skill_state(p_student_id VARCHAR, p_skill_name VARCHAR)
+RETURNS VOID AS $$
+DECLARE
+    v_latest RECORD;
+    v_previous RECORD;
+    v_changed_on DATE;
+    v_count INTEGER;
+BEGIN
+    SELECT a.id, a.level, a.level_numeric, a.skill_category, de.date
+    INTO v_latest
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+    ORDER BY de.date DESC, a.id DESC
+    LIMIT 1;
+
+    IF NOT FOUND THEN
+        DELETE FROM student_skill_state
+        WHERE student_id = p_student_id AND skill_name = p_skill_name;
+        RETURN;
+    END IF;
+
+    SELECT COUNT(*)
+    INTO v_count
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name;
+
+    -- The newest assessment at a different level precedes the last change
+    SELECT a.id, a.level, de.date
+    INTO v_previous
+    FROM assessments a
+    JOIN data_entries de ON a.data_entry_id = de.id
+    WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+      AND a.level <> v_latest.level
+    ORDER BY de.date DESC, a.id DESC
+    LIMIT 1;
+
+    IF FOUND THEN
+        SELECT de.date
+        INTO v_changed_on
+        FROM assessments a
+        JOIN data_entries de ON a.data_entry_id = de.id
+        WHERE a.student_id = p_student_id AND a.skill_name = p_skill_name
+          AND (de.date, a.id) > (v_previous.date, v_previous.id)
+        ORDER BY de.date ASC, a.id ASC
+        LIMIT 1;
+    END IF;
+
+    INSERT INTO student_skill_state (
+        student_id, skill_name, skill_category, latest_level, latest_level_numeric,
+        previous_level, last_observed_on, level_changed_on, latest_assessment_id,
+        assessment_count, updated_at
+    )
+    VALUES (
+        p_student_id, p_skill_name, v_latest.skill_category, v_latest.level, v_latest.level_numeric,
+        CASE WHEN v_previous.id IS NULL THEN NULL ELSE v_previous.level END,
+        v_latest.date, v_changed_on, v_latest.id, v_count, NOW()
+    )
+    ON CONFLICT (student_id, skill_name) DO UPDATE SET
+        skill_category = EXCLUDED.skill_category,
+        latest_level = EXCLUDED.latest_level,
+        latest_level_numeric = EXCLUDED.latest_level_numeric,
+        previous_level = EXCLUDED.previous_level,
+        last_observed_on = EXCLUDED.last_observed_on,
+        level_changed_on = EXCLUDED.level_changed_on,
+        latest_assessment_id = EXCLUDED.latest_assessment_id,
+        assessment_count = EXCLUDED.assessment_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_student_skill_state()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_date DATE;
+BEGIN
+    -- Serialize writers per student/skill so concurrent rebuilds see each other's rows
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(NEW.student_id || '/' || NEW.skill_name));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(OLD.student_id || '/' || OLD.skill_name));
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT date INTO v_date FROM data_entries WHERE id = NEW.data_entry_id;
+        IF v_date IS NULL THEN
+            RETURN NULL;
+        END IF;
+
+        -- Fast path: the new assessment is the latest observation for the skill
+        UPDATE student_skill_state
+        SET previous_level = CASE WHEN latest_level <> NEW.level THEN latest_level ELSE previous_level END,
+            level_changed_on = CASE WHEN latest_level <> NEW.level THEN v_date ELSE level_changed_on END,
+            latest_level = NEW.level,
+            latest_level_numeric = NEW.level_numeric,
+            skill_category = NEW.skill_category,
+            last_observed_on = v_date,
+            latest_assessment_id = NEW.id,
+            assessment_count = assessment_count + 1,
+            updated_at = NOW()
+        WHERE student_id = NEW.student_id AND skill_name = NEW.skill_name
+          AND (last_observed_on, latest_assessment_id) < (v_date, NEW.id);
+
+        IF NOT FOUND THEN
+            PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        IF (OLD.student_id, OLD.skill_name) IS DISTINCT FROM (NEW.student_id, NEW.skill_name) THEN
+            PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+-- Normalize stored labels with the state trigger paused, then rebuild the
+-- state table once instead of once per updated row
+ALTER TABLE assessments DISABLE TRIGGER trigger_student_skill_state_update;
+
+UPDATE assessments
+SET level = canonical_level(level), level_numeric = level_to_numeric(level)
+WHERE canonical_level(level) IS NOT NULL
+  AND (level <> canonical_level(level) OR level_numeric IS DISTINCT FROM level_to_numeric(level));
+
+ALTER TABLE assessments ENABLE TRIGGER trigger_student_skill_state_update;
+
+UPDATE teacher_corrections
+SET original_level = canonical_level(original_level)
+WHERE canonical_level(original_level) IS NOT NULL
+  AND original_level <> canonical_level(original_level);
+
+SELECT refresh_student_skill_state(student_id, skill_name)
+FROM (SELECT DISTINCT student_id, skill_name FROM assessments) AS pairs;
+
+-- The varchar level index is superseded by the compact numeric one
+DROP INDEX IF EXISTS idx_assessments_level;
+CREATE INDEX IF NOT EXISTS idx_assessments_level_numeric ON assessments(level_numeric);
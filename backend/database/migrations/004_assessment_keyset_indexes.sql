@@ -0,0 +1,33 @@
+-- Flourish Skills Tracker Migration 004
+-- Indexes for keyset-paginated assessment listings
+-- The review queue pages on (confidence, created_at, id) and student history
+-- on (created_at, id); each index below matches one listing's sort key, led
+-- by its equality filter, so every page is a bounded index range scan
+
+-- ============================================================================
+-- REVIEW QUEUE (uncorrected assessments, lowest confidence first)
+-- ============================================================================
+-- Unscored assessments sort as confidence 0, matching repositories/assessments.py
+CREATE INDEX IF NOT EXISTS idx_assessments_review_queue
+    ON assessments(COALESCE(confidence_score, 0), created_at DESC, id DESC)
+    WHERE corrected = FALSE;
+
+-- Also serves the teacher filter, which expands to the teacher's student IDs
+CREATE INDEX IF NOT EXISTS idx_assessments_review_queue_student
+    ON assessments(student_id, COALESCE(confidence_score, 0), created_at DESC, id DESC)
+    WHERE corrected = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_assessments_review_queue_skill
+    ON assessments(skill_name, COALESCE(confidence_score, 0), created_at DESC, id DESC)
+    WHERE corrected = FALSE;
+
+-- Superseded by idx_assessments_review_queue_student
+DROP INDEX IF EXISTS idx_assessments_pending;
+
+-- ============================================================================
+-- STUDENT HISTORY (newest first)
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_assessments_student_created
+    ON assessments(student_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_students_teacher ON students(teacher_id);
@@ -0,0 +1,206 @@
+-- Flourish Skills Tracker Migration 005
+-- Observation date stored on assessments
+-- Trend and skill-state queries joined data_entries only to read de.date;
+-- observed_on copies that date onto each assessment so those reads are
+-- index-only scans of one covering index
+
+-- ============================================================================
+-- ASSESSMENTS: observed_on column
+-- ============================================================================
+ALTER TABLE assessments ADD COLUMN IF NOT EXISTS observed_on DATE;
+
+UPDATE assessments a
+SET observed_on = de.date
+FROM data_entries de
+WHERE de.id = a.data_entry_id
+  AND a.observed_on IS DISTINCT FROM de.date;
+
+-- Ingest and re-scoring pass observed_on explicitly; this fills it for any
+-- other writer and follows the assessment if it is moved to another entry
+CREATE OR REPLACE FUNCTION fill_assessment_observed_on()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.observed_on IS NULL
+       OR (TG_OP = 'UPDATE' AND NEW.data_entry_id IS DISTINCT FROM OLD.data_entry_id) THEN
+        SELECT date INTO NEW.observed_on FROM data_entries WHERE id = NEW.data_entry_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_fill_assessment_observed_on ON assessments;
+CREATE TRIGGER trigger_fill_assessment_observed_on
+BEFORE INSERT OR UPDATE OF data_entry_id, observed_on ON assessments
+FOR EACH ROW
+EXECUTE FUNCTION fill_assessment_observed_on();
+
+-- Re-dating a data entry re-dates its assessments
+CREATE OR REPLACE FUNCTION propagate_data_entry_date()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE assessments
+    SET observed_on = NEW.date
+    WHERE data_entry_id = NEW.id
+      AND observed_on IS DISTINCT FROM NEW.date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_propagate_data_entry_date ON data_entries;
+CREATE TRIGGER trigger_propagate_data_entry_date
+AFTER UPDATE OF date ON data_entries
+FOR EACH ROW
+WHEN (OLD.date IS DISTINCT FROM NEW.date)
+EXECUTE FUNCTION propagate_data_entry_date();
+
+-- ============================================================================
+-- COVERING INDEX
+-- ============================================================================
+-- Key order matches the trend and state reads (per skill, by date, id as the
+-- tie-break); the INCLUDE columns are everything those reads select
+CREATE INDEX IF NOT EXISTS idx_assessments_student_skill_observed
+    ON assessments(student_id, skill_name, observed_on, id)
+    INCLUDE (level, level_numeric, confidence_score, skill_category);
+
+-- Prefix of the covering index
+DROP INDEX IF EXISTS idx_assessments_student_skill;
+
+-- ============================================================================
+-- STUDENT SKILL STATE: read observed_on instead of joining data_entries
+-- ============================================================================
+-- Assessments without a data entry have no observed_on and stay excluded,
+-- as they were by the join
+CREATE OR REPLACE FUNCTION refresh_student_skill_state(p_student_id VARCHAR, p_skill_name VARCHAR)
+RETURNS VOID AS $$
+DECLARE
+    v_latest RECORD;
+    v_previous RECORD;
+    v_changed_on DATE;
+    v_count INTEGER;
+BEGIN
+    SELECT id, level, level_numeric, skill_category, observed_on
+    INTO v_latest
+    FROM assessments
+    WHERE student_id = p_student_id AND skill_name = p_skill_name
+      AND observed_on IS NOT NULL
+    ORDER BY observed_on DESC, id DESC
+    LIMIT 1;
+
+    IF NOT FOUND THEN
+        DELETE FROM student_skill_state
+        WHERE student_id = p_student_id AND skill_name = p_skill_name;
+        RETURN;
+    END IF;
+
+    SELECT COUNT(*)
+    INTO v_count
+    FROM assessments
+    WHERE student_id = p_student_id AND skill_name = p_skill_name
+      AND observed_on IS NOT NULL;
+
+    -- The newest assessment at a different level precedes the last change
+    SELECT id, level, observed_on
+    INTO v_previous
+    FROM assessments
+    WHERE student_id = p_student_id AND skill_name = p_skill_name
+      AND observed_on IS NOT NULL
+      AND level <> v_latest.level
+    ORDER BY observed_on DESC, id DESC
+    LIMIT 1;
+
+    IF FOUND THEN
+        SELECT observed_on
+        INTO v_changed_on
+        FROM assessments
+        WHERE student_id = p_student_id AND skill_name = p_skill_name
+          AND (observed_on, id) > (v_previous.observed_on, v_previous.id)
+        ORDER BY observed_on ASC, id ASC
+        LIMIT 1;
+    END IF;
+
+    INSERT INTO student_skill_state (
+        student_id, skill_name, skill_category, latest_level, latest_level_numeric,
+        previous_level, last_observed_on, level_changed_on, latest_assessment_id,
+        assessment_count, updated_at
+    )
+    VALUES (
+        p_student_id, p_skill_name, v_latest.skill_category, v_latest.level, v_latest.level_numeric,
+        CASE WHEN v_previous.id IS NULL THEN NULL ELSE v_previous.level END,
+        v_latest.observed_on, v_changed_on, v_latest.id, v_count, NOW()
+    )
+    ON CONFLICT (student_id, skill_name) DO UPDATE SET
+        skill_category = EXCLUDED.skill_category,
+        latest_level = EXCLUDED.latest_level,
+        latest_level_numeric = EXCLUDED.latest_level_numeric,
+        previous_level = EXCLUDED.previous_level,
+        last_observed_on = EXCLUDED.last_observed_on,
+        level_changed_on = EXCLUDED.level_changed_on,
+        latest_assessment_id = EXCLUDED.latest_assessment_id,
+        assessment_count = EXCLUDED.assessment_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_student_skill_state()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Serialize writers per student/skill so concurrent rebuilds see each other's rows
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(NEW.student_id || '/' || NEW.skill_name));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_advisory_xact_lock(hashtext(OLD.student_id || '/' || OLD.skill_name));
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.observed_on IS NULL THEN
+            RETURN NULL;
+        END IF;
+
+        -- Fast path: the new assessment is the latest observation for the skill
+        UPDATE student_skill_state
+        SET previous_level = CASE WHEN latest_level <> NEW.level THEN latest_level ELSE previous_level END,
+            level_changed_on = CASE WHEN latest_level <> NEW.level THEN NEW.observed_on ELSE level_changed_on END,
+            latest_level = NEW.level,
+            latest_level_numeric = NEW.level_numeric,
+            skill_category = NEW.skill_category,
+            last_observed_on = NEW.observed_on,
+            latest_assessment_id = NEW.id,
+            assessment_count = assessment_count + 1,
+            updated_at = NOW()
+        WHERE student_id = NEW.student_id AND skill_name = NEW.skill_name
+          AND (last_observed_on, latest_assessment_id) < (NEW.observed_on, NEW.id);
+
+        IF NOT FOUND THEN
+            PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_student_skill_state(NEW.student_id, NEW.skill_name);
+        IF (OLD.student_id, OLD.skill_name) IS DISTINCT FROM (NEW.student_id, NEW.skill_name) THEN
+            PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    PERFORM refresh_student_skill_state(OLD.student_id, OLD.skill_name);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- observed_on now drives the state, so changes to it (including re-dated
+-- data entries) trigger a rebuild
+DROP TRIGGER IF EXISTS trigger_student_skill_state_update ON assessments;
+CREATE TRIGGER trigger_student_skill_state_update
+AFTER UPDATE OF level, skill_name, skill_category, student_id, data_entry_id, observed_on ON assessments
+FOR EACH ROW
+WHEN (
+    OLD.level IS DISTINCT FROM NEW.level
+    OR OLD.skill_name IS DISTINCT FROM NEW.skill_name
+    OR OLD.skill_category IS DISTINCT FROM NEW.skill_category
+    OR OLD.student_id IS DISTINCT FROM NEW.student_id
+    OR OLD.observed_on IS DISTINCT FROM NEW.observed_on
+)
+EXECUTE FUNCTION maintain_student_skill_state();
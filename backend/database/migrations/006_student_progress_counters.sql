@@ -0,0 +1,210 @@
+-- Flourish Skills Tracker Migration 006
+-- Trigger-maintained per-student counters for the progress endpoint
+-- Replaces three COUNT(*) subqueries per student with one primary-key lookup,
+-- so progress for one student (or a whole class) is a single statement
+
+-- ============================================================================
+-- STUDENT PROGRESS COUNTERS TABLE
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS student_progress_counters (
+    student_id VARCHAR(10) PRIMARY KEY REFERENCES students(id) ON DELETE CASCADE,
+    assessment_count INTEGER NOT NULL DEFAULT 0,
+    badge_count INTEGER NOT NULL DEFAULT 0,
+    active_target_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- ============================================================================
+-- FUNCTION: Recount one student's row
+-- ============================================================================
+-- Used for backfill and for updates that move rows between students or
+-- complete targets; inserts and deletes apply deltas instead
+CREATE OR REPLACE FUNCTION refresh_student_progress_counters(p_student_id VARCHAR)
+RETURNS VOID AS $$
+BEGIN
+    -- Wait out concurrent deltas so the recount (a new snapshot) includes them
+    PERFORM 1 FROM student_progress_counters WHERE student_id = p_student_id FOR UPDATE;
+
+    INSERT INTO student_progress_counters (
+        student_id, assessment_count, badge_count, active_target_count, updated_at
+    )
+    SELECT
+        s.id,
+        (SELECT COUNT(*) FROM assessments WHERE student_id = s.id),
+        (SELECT COUNT(*) FROM badges WHERE student_id = s.id),
+        (SELECT COUNT(*) FROM skill_targets WHERE student_id = s.id AND completed = FALSE),
+        NOW()
+    FROM students s
+    WHERE s.id = p_student_id
+    ON CONFLICT (student_id) DO UPDATE SET
+        assessment_count = EXCLUDED.assessment_count,
+        badge_count = EXCLUDED.badge_count,
+        active_target_count = EXCLUDED.active_target_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- TRIGGERS: Apply insert/delete deltas once per statement
+-- ============================================================================
+-- Statement-level with transition tables, so a batch insert of 17 assessments
+-- for one data entry bumps the student's row once rather than 17 times.
+-- Students are aggregated in id order to keep lock order consistent.
+CREATE OR REPLACE FUNCTION count_inserted_student_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'assessments' THEN
+        INSERT INTO student_progress_counters AS c (student_id, assessment_count)
+        SELECT student_id, COUNT(*) FROM inserted_rows
+        WHERE student_id IS NOT NULL
+        GROUP BY student_id ORDER BY student_id
+        ON CONFLICT (student_id) DO UPDATE
+        SET assessment_count = c.assessment_count + EXCLUDED.assessment_count, updated_at = NOW();
+    ELSIF TG_TABLE_NAME = 'badges' THEN
+        INSERT INTO student_progress_counters AS c (student_id, badge_count)
+        SELECT student_id, COUNT(*) FROM inserted_rows
+        WHERE student_id IS NOT NULL
+        GROUP BY student_id ORDER BY student_id
+        ON CONFLICT (student_id) DO UPDATE
+        SET badge_count = c.badge_count + EXCLUDED.badge_count, updated_at = NOW();
+    ELSIF TG_TABLE_NAME = 'skill_targets' THEN
+        INSERT INTO student_progress_counters AS c (student_id, active_target_count)
+        SELECT student_id, COUNT(*) FROM inserted_rows
+        WHERE student_id IS NOT NULL AND completed = FALSE
+        GROUP BY student_id ORDER BY student_id
+        ON CONFLICT (student_id) DO UPDATE
+        SET active_target_count = c.active_target_count + EXCLUDED.active_target_count, updated_at = NOW();
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Deletes only update existing rows: when a student is deleted its counters
+-- row is removed by the same cascade, and must not be re-created
+CREATE OR REPLACE FUNCTION count_deleted_student_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'assessments' THEN
+        UPDATE student_progress_counters c
+        SET assessment_count = c.assessment_count - d.n, updated_at = NOW()
+        FROM (SELECT student_id, COUNT(*) AS n FROM deleted_rows GROUP BY student_id) d
+        WHERE c.student_id = d.student_id;
+    ELSIF TG_TABLE_NAME = 'badges' THEN
+        UPDATE student_progress_counters c
+        SET badge_count = c.badge_count - d.n, updated_at = NOW()
+        FROM (SELECT student_id, COUNT(*) AS n FROM deleted_rows GROUP BY student_id) d
+        WHERE c.student_id = d.student_id;
+    ELSIF TG_TABLE_NAME = 'skill_targets' THEN
+        UPDATE student_progress_counters c
+        SET active_target_count = c.active_target_count - d.n, updated_at = NOW()
+        FROM (
+            SELECT student_id, COUNT(*) AS n FROM deleted_rows
+            WHERE completed = FALSE GROUP BY student_id
+        ) d
+        WHERE c.student_id = d.student_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION recount_updated_student_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF OLD.student_id IS NOT NULL THEN
+        PERFORM refresh_student_progress_counters(OLD.student_id);
+    END IF;
+    IF NEW.student_id IS DISTINCT FROM OLD.student_id AND NEW.student_id IS NOT NULL THEN
+        PERFORM refresh_student_progress_counters(NEW.student_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_insert ON assessments;
+CREATE TRIGGER trigger_progress_counters_insert
+AFTER INSERT ON assessments
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_inserted_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_delete ON assessments;
+CREATE TRIGGER trigger_progress_counters_delete
+AFTER DELETE ON assessments
+REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_deleted_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_update ON assessments;
+CREATE TRIGGER trigger_progress_counters_update
+AFTER UPDATE OF student_id ON assessments
+FOR EACH ROW
+WHEN (OLD.student_id IS DISTINCT FROM NEW.student_id)
+EXECUTE FUNCTION recount_updated_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_insert ON badges;
+CREATE TRIGGER trigger_progress_counters_insert
+AFTER INSERT ON badges
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_inserted_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_delete ON badges;
+CREATE TRIGGER trigger_progress_counters_delete
+AFTER DELETE ON badges
+REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_deleted_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_update ON badges;
+CREATE TRIGGER trigger_progress_counters_update
+AFTER UPDATE OF student_id ON badges
+FOR EACH ROW
+WHEN (OLD.student_id IS DISTINCT FROM NEW.student_id)
+EXECUTE FUNCTION recount_updated_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_insert ON skill_targets;
+CREATE TRIGGER trigger_progress_counters_insert
+AFTER INSERT ON skill_targets
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_inserted_student_rows();
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_delete ON skill_targets;
+CREATE TRIGGER trigger_progress_counters_delete
+AFTER DELETE ON skill_targets
+REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION count_deleted_student_rows();
+
+-- Completing (or re-opening) a target changes the active count
+DROP TRIGGER IF EXISTS trigger_progress_counters_update ON skill_targets;
+CREATE TRIGGER trigger_progress_counters_update
+AFTER UPDATE OF student_id, completed ON skill_targets
+FOR EACH ROW
+WHEN (
+    OLD.student_id IS DISTINCT FROM NEW.student_id
+    OR OLD.completed IS DISTINCT FROM NEW.completed
+)
+EXECUTE FUNCTION recount_updated_student_rows();
+
+-- New students start with a zero row
+CREATE OR REPLACE FUNCTION create_student_progress_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO student_progress_counters (student_id)
+    VALUES (NEW.id)
+    ON CONFLICT (student_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_progress_counters_student ON students;
+CREATE TRIGGER trigger_progress_counters_student
+AFTER INSERT ON students
+FOR EACH ROW
+EXECUTE FUNCTION create_student_progress_counters();
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+SELECT refresh_student_progress_counters(id) FROM students;
@@ -0,0 +1,148 @@
+-- Flourish Skills Tracker Migration 007
+-- Per-student data versions for HTTP conditional requests
+-- Every write that can change a student-scoped response moves the student's
+-- version forward, so the API can answer If-None-Match from one primary-key
+-- lookup instead of re-running the endpoint's queries
+
+-- ============================================================================
+-- STUDENT VERSIONS TABLE
+-- ============================================================================
+-- Versions come from one sequence rather than a per-row counter, so a value
+-- is never reused: not after a rollback and not for a re-created student id
+CREATE SEQUENCE IF NOT EXISTS student_version_seq;
+
+CREATE TABLE IF NOT EXISTS student_versions (
+    student_id VARCHAR(10) PRIMARY KEY REFERENCES students(id) ON DELETE CASCADE,
+    version BIGINT NOT NULL DEFAULT nextval('student_version_seq'),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- ============================================================================
+-- FUNCTION: Move students to a new version
+-- ============================================================================
+-- Rows are locked in id order first to keep lock order consistent across
+-- statements touching several students. Only existing rows are updated: when
+-- a student is deleted its row goes with the same cascade.
+CREATE OR REPLACE FUNCTION bump_student_versions(p_student_ids VARCHAR[])
+RETURNS VOID AS $$
+BEGIN
+    PERFORM 1 FROM student_versions
+    WHERE student_id = ANY(p_student_ids)
+    ORDER BY student_id
+    FOR UPDATE;
+
+    UPDATE student_versions
+    SET version = nextval('student_version_seq'), updated_at = NOW()
+    WHERE student_id = ANY(p_student_ids);
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- TRIGGERS: Bump once per statement
+-- ============================================================================
+-- Statement-level with transition tables; inserts and deletes name theirs
+-- changed_rows, updates compare old_rows and new_rows. Corrections carry no
+-- student_id and are resolved through their assessment.
+CREATE OR REPLACE FUNCTION bump_changed_student_versions()
+RETURNS TRIGGER AS $$
+DECLARE
+    student_ids VARCHAR[];
+BEGIN
+    IF TG_TABLE_NAME = 'teacher_corrections' THEN
+        IF TG_OP = 'UPDATE' THEN
+            SELECT array_agg(DISTINCT a.student_id) INTO student_ids
+            FROM assessments a
+            WHERE a.id IN (
+                SELECT assessment_id FROM old_rows
+                UNION SELECT assessment_id FROM new_rows
+            );
+        ELSE
+            SELECT array_agg(DISTINCT a.student_id) INTO student_ids
+            FROM assessments a
+            WHERE a.id IN (SELECT assessment_id FROM changed_rows);
+        END IF;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT student_id) INTO student_ids
+        FROM (
+            SELECT student_id FROM old_rows
+            UNION SELECT student_id FROM new_rows
+        ) changed;
+    ELSE
+        SELECT array_agg(DISTINCT student_id) INTO student_ids
+        FROM changed_rows;
+    END IF;
+
+    IF student_ids IS NOT NULL THEN
+        PERFORM bump_student_versions(student_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    table_name TEXT;
+BEGIN
+    FOREACH table_name IN ARRAY ARRAY['assessments', 'skill_targets', 'badges', 'teacher_corrections']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trigger_student_version_insert ON %I', table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trigger_student_version_insert
+             AFTER INSERT ON %I
+             REFERENCING NEW TABLE AS changed_rows
+             FOR EACH STATEMENT
+             EXECUTE FUNCTION bump_changed_student_versions()',
+            table_name
+        );
+
+        EXECUTE format('DROP TRIGGER IF EXISTS trigger_student_version_update ON %I', table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trigger_student_version_update
+             AFTER UPDATE ON %I
+             REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+             FOR EACH STATEMENT
+             EXECUTE FUNCTION bump_changed_student_versions()',
+            table_name
+        );
+
+        EXECUTE format('DROP TRIGGER IF EXISTS trigger_student_version_delete ON %I', table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trigger_student_version_delete
+             AFTER DELETE ON %I
+             REFERENCING OLD TABLE AS changed_rows
+             FOR EACH STATEMENT
+             EXECUTE FUNCTION bump_changed_student_versions()',
+            table_name
+        );
+    END LOOP;
+END;
+$$;
+
+-- Student rows: new students get a version, and renames or grade changes
+-- show up in progress and profile responses
+CREATE OR REPLACE FUNCTION maintain_student_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO student_versions (student_id)
+        VALUES (NEW.id)
+        ON CONFLICT (student_id) DO NOTHING;
+    ELSE
+        PERFORM bump_student_versions(ARRAY[NEW.id]);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_student_version_student ON students;
+CREATE TRIGGER trigger_student_version_student
+AFTER INSERT OR UPDATE ON students
+FOR EACH ROW
+EXECUTE FUNCTION maintain_student_version();
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+INSERT INTO student_versions (student_id)
+SELECT id FROM students
+ON CONFLICT (student_id) DO NOTHING;
@@ -0,0 +1,30 @@
+-- Flourish Skills Tracker Migration 008
+-- Mark corrected assessments once per statement instead of once per row
+-- trigger_mark_corrected ran one single-row UPDATE of assessments for every
+-- inserted correction, and each of those fired the assessments statement
+-- triggers (student versions) again. A bulk review inserting N corrections
+-- now marks all N assessments with one set-based UPDATE.
+
+-- ============================================================================
+-- TRIGGER: Update assessments.corrected on correction (statement-level)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION mark_assessments_corrected()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE assessments a
+    SET corrected = TRUE, updated_at = NOW()
+    FROM (SELECT DISTINCT assessment_id FROM new_corrections) c
+    WHERE a.id = c.assessment_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_mark_corrected ON teacher_corrections;
+CREATE TRIGGER trigger_mark_corrected
+AFTER INSERT ON teacher_corrections
+REFERENCING NEW TABLE AS new_corrections
+FOR EACH STATEMENT
+EXECUTE FUNCTION mark_assessments_corrected();
+
+-- Superseded by mark_assessments_corrected
+DROP FUNCTION IF EXISTS mark_assessment_corrected();
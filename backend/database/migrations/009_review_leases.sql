@@ -0,0 +1,72 @@
+-- Flourish Skills Tracker Migration 009
+-- Review leases so several teachers can work the review queue at once
+-- A teacher claims a batch of pending assessments with FOR UPDATE SKIP LOCKED
+-- and holds them until claimed_until; other teachers' claims skip them, so no
+-- two reviewers get the same work. Expired leases return to the pool.
+
+-- ============================================================================
+-- LEASE COLUMNS
+-- ============================================================================
+ALTER TABLE assessments ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(10) REFERENCES teachers(id);
+ALTER TABLE assessments ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP;
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+-- Claims walk idx_assessments_review_queue (migration 004) in /pending
+-- order; the lease check is a filter on the rows it walks, most of which are
+-- unclaimed
+
+-- Renewing and releasing a teacher's own leases
+CREATE INDEX IF NOT EXISTS idx_assessments_claimed_by
+    ON assessments(claimed_by)
+    WHERE claimed_by IS NOT NULL AND corrected = FALSE;
+
+-- ============================================================================
+-- STUDENT VERSIONS: ignore lease-only updates
+-- ============================================================================
+-- Claims, renewals and releases only touch the lease columns, which no
+-- student-scoped response includes; they must not invalidate ETags.
+-- Otherwise identical to migration 007.
+CREATE OR REPLACE FUNCTION bump_changed_student_versions()
+RETURNS TRIGGER AS $$
+DECLARE
+    student_ids VARCHAR[];
+BEGIN
+    IF TG_TABLE_NAME = 'teacher_corrections' THEN
+        IF TG_OP = 'UPDATE' THEN
+            SELECT array_agg(DISTINCT a.student_id) INTO student_ids
+            FROM assessments a
+            WHERE a.id IN (
+                SELECT assessment_id FROM old_rows
+                UNION SELECT assessment_id FROM new_rows
+            );
+        ELSE
+            SELECT array_agg(DISTINCT a.student_id) INTO student_ids
+            FROM assessments a
+            WHERE a.id IN (SELECT assessment_id FROM changed_rows);
+        END IF;
+    ELSIF TG_OP = 'UPDATE' AND TG_TABLE_NAME = 'assessments' THEN
+        SELECT array_agg(DISTINCT changed.student_id) INTO student_ids
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (VALUES (o.student_id), (n.student_id)) AS changed(student_id)
+        WHERE to_jsonb(o) - 'claimed_by' - 'claimed_until'
+              IS DISTINCT FROM to_jsonb(n) - 'claimed_by' - 'claimed_until';
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT student_id) INTO student_ids
+        FROM (
+            SELECT student_id FROM old_rows
+            UNION SELECT student_id FROM new_rows
+        ) changed;
+    ELSE
+        SELECT array_agg(DISTINCT student_id) INTO student_ids
+        FROM changed_rows;
+    END IF;
+
+    IF student_ids IS NOT NULL THEN
+        PERFORM bump_student_versions(student_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
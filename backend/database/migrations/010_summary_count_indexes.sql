@@ -0,0 +1,23 @@
+-- Flourish Skills Tracker Migration 010
+-- Covering indexes for the count and summary endpoints
+-- Pending-review and corrections-today counts are answered from these
+-- indexes alone (index-only scans), without reading assessment or
+-- correction rows
+
+-- ============================================================================
+-- PENDING REVIEWS BY STUDENT AND SKILL
+-- ============================================================================
+-- Both columns of the teacher summary's GROUPING SETS live in the index, and
+-- the partial predicate keeps it to the (small) uncorrected set
+CREATE INDEX IF NOT EXISTS idx_assessments_pending_student_skill
+    ON assessments(student_id, skill_name)
+    WHERE corrected = FALSE;
+
+-- ============================================================================
+-- CORRECTIONS BY TEACHER AND DAY
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_corrections_teacher_date
+    ON teacher_corrections(corrected_by, corrected_at);
+
+-- Superseded by idx_corrections_teacher_date
+DROP INDEX IF EXISTS idx_corrections_corrected_by;
@@ -0,0 +1,9 @@
+-- Flourish Skills Tracker Migration 011
+-- Index for the streaming assessment export
+-- GET /api/export/assessments reads assessments in (created_at, id) order
+-- through a server-side cursor, optionally from a `since` timestamp. Walking
+-- this index returns rows already in export order, so the database neither
+-- sorts the table nor materializes the result before the first chunk.
+
+CREATE INDEX IF NOT EXISTS idx_assessments_created
+    ON assessments(created_at, id);
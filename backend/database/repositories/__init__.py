@@ -0,0 +1,11 @@
+"""
+Async repositories for the API routers.
+
+Each module groups the queries for one router. Single statements go through
+the autocommit fetch helpers; multi-statement writes run in one adb()
+transaction. Functions return plain dicts (or None when a row does not
+exist); mapping results to HTTP responses is left to the routers.
+"""
+from . import students, assessments, corrections, badges, teachers
+
+__all__ = ['students', 'assessments', 'corrections', 'badges', 'teachers']
@@ -0,0 +1,399 @@
+"""
+Assessments Repository
+
+Queries for retrieving skill assessments.
+"""
+
+from database.async_connection import adb, fetch, fetchrow, fetchval, stream
+from database.repositories.pagination import decode_cursor, split_page
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+
+ASSESSMENT_COLUMNS = """
+    id, data_entry_id, student_id, skill_name, skill_category,
+    level, confidence_score, justification, source_quote,
+    data_point_count, rubric_version, corrected,
+    created_at::text as created_at
+"""
+
+
+async def list_for_student(
+    student_id: str,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get one page of a student's assessments, newest first
+
+    Pages on (created_at, id) so each page is a bounded range scan of
+    idx_assessments_student_created regardless of history length.
+
+    Args:
+        student_id: Student ID
+        limit: Page size
+        cursor: Cursor from the previous page, or None for the first page
+
+    Returns:
+        (assessment rows, cursor for the next page or None)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    params: List[Any] = [student_id]
+    after = ""
+
+    if cursor:
+        created_at, assessment_id = decode_cursor(cursor, (datetime, int))
+        params += [created_at, assessment_id]
+        after = "AND (created_at, id) < ($2, $3)"
+
+    params.append(limit + 1)
+
+    query = f"""
+        SELECT {ASSESSMENT_COLUMNS}
+        FROM assessments
+        WHERE student_id = $1
+          {after}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ${len(params)}
+    """
+
+    rows = await fetch(query, *params)
+
+    return split_page([dict(row) for row in rows], limit, ('created_at', 'id'))
+
+
+async def list_trend_points(student_id: str) -> List[Dict[str, Any]]:
+    """
+    Get a student's assessments with observation dates, ordered by skill and date
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        List of rows with skill_name, skill_category, level, level_numeric,
+        confidence_score, date
+    """
+    # Index-only scan of idx_assessments_student_skill_observed
+    query = """
+        SELECT
+            skill_name, skill_category, level, level_numeric, confidence_score,
+            observed_on as date
+        FROM assessments
+        WHERE student_id = $1 AND observed_on IS NOT NULL
+        ORDER BY skill_name, observed_on ASC, id ASC
+    """
+
+    rows = await fetch(query, student_id)
+
+    return [dict(row) for row in rows]
+
+
+def _pending_conditions(
+    params: List[Any],
+    min_confidence: Optional[float],
+    max_confidence: Optional[float],
+    student_id: Optional[str],
+    skill_name: Optional[str],
+    teacher_id: Optional[str]
+) -> List[str]:
+    """
+    WHERE conditions for the pending-review filters that are set
+
+    Appends each filter value to params and refers to it by position.
+    """
+    conditions = ["corrected = FALSE"]
+
+    def param(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if min_confidence is not None:
+        conditions.append(f"COALESCE(confidence_score, 0) >= {param(min_confidence)}::numeric")
+    if max_confidence is not None:
+        conditions.append(f"COALESCE(confidence_score, 0) <= {param(max_confidence)}::numeric")
+    if student_id:
+        conditions.append(f"student_id = {param(student_id)}")
+    if skill_name:
+        conditions.append(f"skill_name = {param(skill_name)}")
+    if teacher_id:
+        conditions.append(f"student_id IN (SELECT id FROM students WHERE teacher_id = {param(teacher_id)})")
+
+    return conditions
+
+
+async def list_pending(
+    limit: int,
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+    student_id: Optional[str] = None,
+    skill_name: Optional[str] = None,
+    teacher_id: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get one page of uncorrected assessments, lowest confidence first
+
+    Pages on (confidence, created_at, id) with newest first among equal
+    confidence. Unscored assessments sort as confidence 0. Only the filters
+    that are set are added to the query, so the planner can pick the matching
+    partial index from migration 004.
+
+    Args:
+        limit: Page size
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional filter to the teacher's students
+        cursor: Cursor from the previous page, or None for the first page
+
+    Returns:
+        (assessment rows, cursor for the next page or None)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    params: List[Any] = []
+    conditions = _pending_conditions(
+        params, min_confidence, max_confidence, student_id, skill_name, teacher_id
+    )
+
+    def param(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if cursor:
+        confidence, created_at, assessment_id = decode_cursor(cursor, (Decimal, datetime, int))
+        confidence_param = param(confidence)
+        # The leading >= bounds the index range; the rest skips rows already returned
+        conditions.append(
+            f"COALESCE(confidence_score, 0) >= {confidence_param} AND ("
+            f"COALESCE(confidence_score, 0) > {confidence_param} "
+            f"OR (created_at, id) < ({param(created_at)}, {param(assessment_id)}))"
+        )
+
+    query = f"""
+        SELECT {ASSESSMENT_COLUMNS}, COALESCE(confidence_score, 0) as review_confidence
+        FROM assessments
+        WHERE {' AND '.join(conditions)}
+        ORDER BY COALESCE(confidence_score, 0) ASC, created_at DESC, id DESC
+        LIMIT {param(limit + 1)}
+    """
+
+    rows = await fetch(query, *params)
+
+    page, next_cursor = split_page(
+        [dict(row) for row in rows], limit, ('review_confidence', 'created_at', 'id')
+    )
+
+    for row in page:
+        del row['review_confidence']
+
+    return page, next_cursor
+
+
+async def count_pending(
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+    student_id: Optional[str] = None,
+    skill_name: Optional[str] = None,
+    teacher_id: Optional[str] = None,
+    available_to: Optional[str] = None
+) -> int:
+    """
+    Count uncorrected assessments matching the same filters as list_pending
+
+    Args:
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional filter to the teacher's students
+        available_to: Optional reviewer; leaves out assessments another
+            teacher holds an unexpired review lease on
+
+    Returns:
+        Number of matching assessments
+    """
+    params: List[Any] = []
+    conditions = _pending_conditions(
+        params, min_confidence, max_confidence, student_id, skill_name, teacher_id
+    )
+
+    if available_to:
+        params.append(available_to)
+        conditions.append(
+            f"(claimed_until IS NULL OR claimed_until <= NOW() OR claimed_by = ${len(params)})"
+        )
+
+    query = f"""
+        SELECT COUNT(*)
+        FROM assessments
+        WHERE {' AND '.join(conditions)}
+    """
+
+    return await fetchval(query, *params)
+
+
+async def claim_pending(
+    claimed_by: str,
+    limit: int,
+    lease_seconds: int,
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+    student_id: Optional[str] = None,
+    skill_name: Optional[str] = None,
+    teacher_id: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], datetime]:
+    """
+    Lease the next uncorrected assessments to a reviewer
+
+    Takes up to limit assessments in /pending order (least confident first)
+    that nobody holds an unexpired lease on. FOR UPDATE SKIP LOCKED lets concurrent claims
+    pass over rows another claim is taking instead of waiting for it, and a
+    claim committed first changes the lease columns, so the row no longer
+    qualifies when a later claim reaches it. The reviewer's other unexpired
+    leases are renewed to the same expiry in the same transaction.
+
+    Args:
+        claimed_by: Reviewing teacher's ID
+        limit: Maximum number of assessments to claim
+        lease_seconds: How long the leases last
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional filter to the teacher's students
+
+    Returns:
+        (claimed assessment rows in priority order, lease expiry)
+    """
+    params: List[Any] = []
+    conditions = _pending_conditions(
+        params, min_confidence, max_confidence, student_id, skill_name, teacher_id
+    )
+    conditions.append("(claimed_until IS NULL OR claimed_until <= NOW())")
+
+    def param(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    async with adb() as conn:
+        # NOW() is the transaction start, so renewals and claims share one expiry
+        claimed_until = await conn.fetchval(
+            "SELECT NOW()::timestamp + make_interval(secs => $1)", lease_seconds
+        )
+
+        await conn.execute(
+            """
+            UPDATE assessments
+            SET claimed_until = $2
+            WHERE claimed_by = $1 AND claimed_until > NOW() AND corrected = FALSE
+            """,
+            claimed_by, claimed_until
+        )
+
+        query = f"""
+            WITH candidates AS (
+                SELECT id
+                FROM assessments
+                WHERE {' AND '.join(conditions)}
+                ORDER BY COALESCE(confidence_score, 0) ASC, created_at DESC, id DESC
+                LIMIT {param(limit)}
+                FOR UPDATE SKIP LOCKED
+            ), claimed AS (
+                UPDATE assessments a
+                SET claimed_by = {param(claimed_by)}, claimed_until = {param(claimed_until)}
+                FROM candidates
+                WHERE a.id = candidates.id
+                RETURNING a.*
+            )
+            SELECT {ASSESSMENT_COLUMNS}
+            FROM claimed
+            ORDER BY COALESCE(claimed.confidence_score, 0) ASC, claimed.created_at DESC, claimed.id DESC
+        """
+
+        rows = await conn.fetch(query, *params)
+
+    return [dict(row) for row in rows], claimed_until
+
+
+async def release_claims(claimed_by: str, assessment_ids: Optional[List[int]] = None) -> int:
+    """
+    Give up a reviewer's leases so other teachers can claim the assessments
+
+    Args:
+        claimed_by: Reviewing teacher's ID
+        assessment_ids: Leases to release, or None for all of the reviewer's
+
+    Returns:
+        Number of leases released
+    """
+    query = """
+        WITH released AS (
+            UPDATE assessments
+            SET claimed_by = NULL, claimed_until = NULL
+            WHERE claimed_by = $1 AND corrected = FALSE
+              AND ($2::int[] IS NULL OR id = ANY($2::int[]))
+            RETURNING id
+        )
+        SELECT COUNT(*) FROM released
+    """
+
+    return await fetchval(query, claimed_by, assessment_ids)
+
+
+async def get_by_id(assessment_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a single assessment
+
+    Args:
+        assessment_id: Assessment ID
+
+    Returns:
+        Assessment row, or None if it does not exist
+    """
+    query = f"""
+        SELECT {ASSESSMENT_COLUMNS}
+        FROM assessments
+        WHERE id = $1
+    """
+
+    row = await fetchrow(query, assessment_id)
+
+    return dict(row) if row else None
+
+
+def stream_for_export(
+    since: Optional[datetime] = None,
+    chunk_size: int = 1000
+) -> AsyncIterator[List[Any]]:
+    """
+    Stream every assessment, oldest first, in chunks
+
+    Rows are read through a server-side cursor over idx_assessments_created,
+    so memory use does not grow with the number of assessments.
+
+    Args:
+        since: Only assessments created at or after this time
+        chunk_size: Rows per chunk
+
+    Returns:
+        Async iterator of lists of records with the ASSESSMENT_COLUMNS
+    """
+    params = []
+    where = ""
+    if since is not None:
+        params.append(since)
+        where = "WHERE created_at >= $1"
+
+    query = f"""
+        SELECT {ASSESSMENT_COLUMNS}
+        FROM assessments
+        {where}
+        ORDER BY created_at, id
+    """
+
+    return stream(query, *params, chunk_size=chunk_size)
@@ -0,0 +1,132 @@
+"""
+Badges Repository
+
+Queries for badge collections and grants.
+"""
+
+import asyncio
+
+from database.async_connection import adb, fetch
+from datetime import date
+from typing import List, Optional, Dict, Any
+
+
+async def list_for_student(student_id: str) -> List[Dict[str, Any]]:
+    """
+    Get a student's earned badges, most recent first
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        List of badge rows
+    """
+    query = """
+        SELECT
+            id, student_id, skill_name, skill_category, level_achieved,
+            badge_type, granted_by, earned_date::text as earned_date,
+            created_at::text as created_at
+        FROM badges
+        WHERE student_id = $1
+        ORDER BY earned_date DESC
+    """
+
+    rows = await fetch(query, student_id)
+
+    return [dict(row) for row in rows]
+
+
+async def create_badge(
+    student_id: str,
+    skill_name: str,
+    skill_category: str,
+    level_achieved: str,
+    badge_type: str,
+    granted_by: str,
+    earned_date: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Grant a badge unless the student already holds it at this level
+
+    Args:
+        student_id: Student ID
+        skill_name: Skill name
+        skill_category: SEL, EF, or 21st Century
+        level_achieved: Developing, Proficient, or Advanced
+        badge_type: bronze, silver, or gold
+        granted_by: Teacher ID
+        earned_date: YYYY-MM-DD
+
+    Returns:
+        Dict with id and created_at, or None if the badge already exists
+    """
+    insert_sql = """
+        INSERT INTO badges (
+            student_id, skill_name, skill_category, level_achieved,
+            badge_type, granted_by, earned_date
+        )
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        RETURNING id, created_at::text as created_at
+    """
+
+    async with adb() as conn:
+        existing = await conn.fetchval(
+            """
+            SELECT id FROM badges
+            WHERE student_id = $1 AND skill_name = $2 AND level_achieved = $3
+            """,
+            student_id, skill_name, level_achieved
+        )
+
+        if existing is not None:
+            return None
+
+        row = await conn.fetchrow(
+            insert_sql,
+            student_id,
+            skill_name,
+            skill_category,
+            level_achieved,
+            badge_type,
+            granted_by,
+            date.fromisoformat(earned_date)
+        )
+
+    return dict(row)
+
+
+async def count_by_category_and_type(student_id: str) -> Dict[str, Dict[str, int]]:
+    """
+    Count a student's badges by category and by badge type
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        {'by_category': {category: count}, 'by_type': {badge_type: count}}
+    """
+    category_rows, type_rows = await asyncio.gather(
+        fetch(
+            """
+            SELECT skill_category, COUNT(*) as count
+            FROM badges
+            WHERE student_id = $1
+            GROUP BY skill_category
+            """,
+            student_id
+        ),
+        fetch(
+            """
+            SELECT badge_type, COUNT(*) as count
+            FROM badges
+            WHERE student_id = $1
+            GROUP BY badge_type
+            """,
+            student_id
+        )
+    )
+
+    return {
+        'by_category': {row['skill_category']: row['count'] for row in category_rows},
+        'by_type': {row['badge_type']: row['count'] for row in type_rows}
+    }
@@ -0,0 +1,207 @@
+"""
+Corrections Repository
+
+Queries for teacher corrections and approvals of AI assessments.
+"""
+
+from database.async_connection import adb, fetch, fetchrow, fetchval
+from typing import List, Optional, Dict, Any
+
+
+class AssessmentsNotFoundError(LookupError):
+    """Raised when a bulk review names assessments that do not exist"""
+
+
+async def create_correction(
+    assessment_id: int,
+    corrected_level: str,
+    corrected_justification: Optional[str],
+    teacher_notes: Optional[str],
+    corrected_by: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Record a correction; trigger_mark_corrected marks the assessment corrected
+
+    The original level and justification are copied from the assessment in
+    the same statement; the original justification is kept when no corrected
+    one is given.
+
+    Args:
+        assessment_id: Assessment being corrected
+        corrected_level: Teacher's level
+        corrected_justification: Optional replacement justification
+        teacher_notes: Optional notes
+        corrected_by: Teacher ID
+
+    Returns:
+        Dict with the new correction id and the assessment's student_id,
+        or None if the assessment does not exist
+    """
+    query = """
+        WITH original AS (
+            SELECT id, student_id, level, justification
+            FROM assessments
+            WHERE id = $1
+        ), inserted AS (
+            INSERT INTO teacher_corrections (
+                assessment_id, original_level, corrected_level,
+                original_justification, corrected_justification,
+                teacher_notes, corrected_by
+            )
+            SELECT
+                id, level, $2,
+                justification, COALESCE(NULLIF($3, ''), justification),
+                $4, $5
+            FROM original
+            RETURNING id
+        )
+        SELECT inserted.id, original.student_id
+        FROM inserted, original
+    """
+
+    row = await fetchrow(
+        query, assessment_id, corrected_level, corrected_justification, teacher_notes, corrected_by
+    )
+
+    return dict(row) if row else None
+
+
+async def approve_assessment(assessment_id: int) -> Optional[str]:
+    """
+    Mark an assessment as reviewed without changes
+
+    Args:
+        assessment_id: Assessment ID
+
+    Returns:
+        The assessment's student_id, or None if the assessment does not exist
+    """
+    return await fetchval(
+        "UPDATE assessments SET corrected = TRUE, updated_at = NOW() WHERE id = $1 RETURNING student_id",
+        assessment_id
+    )
+
+
+async def apply_bulk_review(
+    approvals: List[int],
+    corrections: List[Dict[str, Any]],
+    skip_missing: bool = False
+) -> Dict[str, Any]:
+    """
+    Apply a batch of approvals and corrections in one transaction
+
+    Each kind is a single set-based statement: one UPDATE for all approvals
+    and one INSERT ... SELECT for all corrections, which also copies the
+    original level and justification. The statement-level
+    trigger_mark_corrected then marks every corrected assessment with one
+    UPDATE. The assessments are locked in id order first, so concurrent
+    batches over overlapping assessments wait instead of deadlocking.
+
+    Args:
+        approvals: Assessment IDs to mark reviewed without changes
+        corrections: Dicts with assessment_id, corrected_level,
+            corrected_justification, teacher_notes and corrected_by
+        skip_missing: Apply the decisions for assessments that still exist
+            and report the others in missing_ids instead of failing
+
+    Returns:
+        Dict with approved_ids, correction_ids (in request order), the
+        distinct student_ids affected and the missing_ids skipped
+
+    Raises:
+        AssessmentsNotFoundError: If any assessment does not exist and
+            skip_missing is False; nothing is applied
+    """
+    requested = approvals + [c['assessment_id'] for c in corrections]
+
+    insert_sql = """
+        INSERT INTO teacher_corrections (
+            assessment_id, original_level, corrected_level,
+            original_justification, corrected_justification,
+            teacher_notes, corrected_by
+        )
+        SELECT
+            a.id, a.level, c.corrected_level,
+            a.justification, COALESCE(NULLIF(c.corrected_justification, ''), a.justification),
+            c.teacher_notes, c.corrected_by
+        FROM unnest($1::int[], $2::varchar[], $3::text[], $4::text[], $5::varchar[])
+            WITH ORDINALITY AS c(
+                assessment_id, corrected_level, corrected_justification,
+                teacher_notes, corrected_by, position
+            )
+        JOIN assessments a ON a.id = c.assessment_id
+        ORDER BY c.position
+        RETURNING id
+    """
+
+    async with adb() as conn:
+        rows = await conn.fetch(
+            "SELECT id, student_id FROM assessments WHERE id = ANY($1::int[]) ORDER BY id FOR UPDATE",
+            requested
+        )
+
+        found = {row['id'] for row in rows}
+        missing = sorted(set(requested) - found)
+        if missing and not skip_missing:
+            raise AssessmentsNotFoundError(
+                f"Assessments not found: {', '.join(map(str, missing))}"
+            )
+
+        approvals = [assessment_id for assessment_id in approvals if assessment_id in found]
+        corrections = [c for c in corrections if c['assessment_id'] in found]
+
+        if approvals:
+            await conn.execute(
+                "UPDATE assessments SET corrected = TRUE, updated_at = NOW() WHERE id = ANY($1::int[])", approvals
+            )
+
+        correction_ids = []
+        if corrections:
+            inserted = await conn.fetch(
+                insert_sql,
+                [c['assessment_id'] for c in corrections],
+                [c['corrected_level'] for c in corrections],
+                [c.get('corrected_justification') for c in corrections],
+                [c.get('teacher_notes') for c in corrections],
+                [c['corrected_by'] for c in corrections]
+            )
+            correction_ids = [row['id'] for row in inserted]
+
+    return {
+        'approved_ids': approvals,
+        'correction_ids': correction_ids,
+        'student_ids': sorted({row['student_id'] for row in rows}),
+        'missing_ids': missing
+    }
+
+
+async def list_recent(limit: int) -> List[Dict[str, Any]]:
+    """
+    Get the most recent corrections with assessment details
+
+    Args:
+        limit: Maximum number of rows
+
+    Returns:
+        List of correction rows
+    """
+    query = """
+        SELECT
+            tc.id,
+            tc.assessment_id,
+            a.student_id,
+            a.skill_name,
+            tc.original_level,
+            tc.corrected_level,
+            tc.teacher_notes,
+            tc.corrected_by,
+            tc.corrected_at::text as corrected_at
+        FROM teacher_corrections tc
+        JOIN assessments a ON tc.assessment_id = a.id
+        ORDER BY tc.corrected_at DESC
+        LIMIT $1
+    """
+
+    rows = await fetch(query, limit)
+
+    return [dict(row) for row in rows]
@@ -0,0 +1,101 @@
+"""
+Keyset Pagination
+
+Opaque cursors for listings that page on a sort key instead of OFFSET.
+
+A cursor is the sort-key values of the last row on a page, JSON-encoded and
+base64url'd so clients treat it as an opaque token. The next page starts
+strictly after that row, so each page costs the same index range scan no
+matter how deep the client has paged.
+"""
+
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode sort-key values as an opaque cursor
+
+    Args:
+        values: Sort-key values of the last row returned (str, int, Decimal or datetime)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([
+        value.isoformat() if isinstance(value, datetime) else
+        str(value) if isinstance(value, Decimal) else
+        value
+        for value in values
+    ], separators=(',', ':'))
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from a previous page
+        types: Expected type of each sort-key value (str, int, Decimal or datetime)
+
+    Returns:
+        Tuple of sort-key values converted to the expected types
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the expected keys
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+    decoded = []
+    for value, value_type in zip(values, types):
+        try:
+            if value_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            else:
+                decoded.append(value_type(value))
+        except (ValueError, TypeError, ArithmeticError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+    return tuple(decoded)
+
+
+def split_page(
+    rows: List[Dict[str, Any]],
+    limit: int,
+    key_columns: Sequence[str]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Trim a limit + 1 fetch to one page and build the cursor for the next one
+
+    Args:
+        rows: Rows fetched with LIMIT limit + 1
+        limit: Page size requested by the client
+        key_columns: Sort-key columns, in ORDER BY order
+
+    Returns:
+        (page rows, next cursor or None when this is the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    last = page[-1]
+
+    return page, encode_cursor([last[column] for column in key_columns])
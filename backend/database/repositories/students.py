@@ -0,0 +1,259 @@
+"""
+Students Repository
+
+Queries for students, progress metrics, and skill targets.
+"""
+
+import json
+
+from database.async_connection import adb, fetch, fetchrow, fetchval
+from typing import List, Optional, Dict, Any
+
+# Most recent level change of up to 5 skills for the student aliased "s",
+# as a JSON array of {skill_name, from_level, to_level, date}
+RECENT_GROWTH_JSON = """
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'skill_name', g.skill_name,
+            'from_level', g.previous_level,
+            'to_level', g.latest_level,
+            'date', g.level_changed_on
+        ) ORDER BY g.level_changed_on DESC)
+        FROM (
+            SELECT skill_name, previous_level, latest_level, level_changed_on
+            FROM student_skill_state
+            WHERE student_id = s.id AND previous_level IS NOT NULL
+            ORDER BY level_changed_on DESC
+            LIMIT 5
+        ) g
+    ), '[]')
+"""
+
+TARGET_COLUMNS = """
+    id, student_id, skill_name, starting_level, target_level,
+    assigned_by, assigned_at::text as assigned_at, completed,
+    completed_at::text as completed_at
+"""
+
+
+async def list_students(teacher_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get all students ordered by name, optionally filtered by teacher
+
+    Args:
+        teacher_id: Optional teacher ID
+
+    Returns:
+        List of student rows
+    """
+    if teacher_id:
+        rows = await fetch(
+            """
+            SELECT id, name, grade, teacher_id, created_at::text as created_at
+            FROM students
+            WHERE teacher_id = $1
+            ORDER BY name ASC
+            """,
+            teacher_id
+        )
+    else:
+        rows = await fetch(
+            """
+            SELECT id, name, grade, teacher_id, created_at::text as created_at
+            FROM students
+            ORDER BY name ASC
+            """
+        )
+
+    return [dict(row) for row in rows]
+
+
+async def student_exists(student_id: str) -> bool:
+    """
+    Check whether a student exists
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        True if the student exists
+    """
+    return await fetchval("SELECT EXISTS (SELECT 1 FROM students WHERE id = $1)", student_id)
+
+
+async def get_version(student_id: str) -> Optional[int]:
+    """
+    Get a student's data version
+
+    The version moves forward on every write to the student's assessments,
+    targets, badges or corrections (see migration 007).
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        Current version, or None if the student does not exist
+    """
+    return await fetchval(
+        "SELECT version FROM student_versions WHERE student_id = $1", student_id
+    )
+
+
+async def get_progress(student_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get progress metrics for a student in one statement
+
+    Counts come from student_progress_counters and recent growth from
+    student_skill_state, both maintained by triggers.
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        Dict with student_name, total_assessments, total_badges, active_targets
+        and recent_growth (most recent level change of up to 5 skills),
+        or None if the student does not exist
+    """
+    query = f"""
+        SELECT
+            s.name as student_name,
+            COALESCE(c.assessment_count, 0) as total_assessments,
+            COALESCE(c.badge_count, 0) as total_badges,
+            COALESCE(c.active_target_count, 0) as active_targets,
+            {RECENT_GROWTH_JSON} as recent_growth
+        FROM students s
+        LEFT JOIN student_progress_counters c ON c.student_id = s.id
+        WHERE s.id = $1
+    """
+
+    row = await fetchrow(query, student_id)
+
+    if row is None:
+        return None
+
+    return {
+        **dict(row),
+        'recent_growth': json.loads(row['recent_growth'])
+    }
+
+
+async def create_target(
+    student_id: str,
+    skill_name: str,
+    starting_level: str,
+    target_level: str,
+    assigned_by: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Create a skill target unless an active one already exists for the skill
+
+    Args:
+        student_id: Student ID
+        skill_name: Skill to target
+        starting_level: Level at assignment
+        target_level: Goal level
+        assigned_by: Teacher ID
+
+    Returns:
+        Dict with id and assigned_at, or None if an active target already exists
+    """
+    insert_sql = """
+        INSERT INTO skill_targets (
+            student_id, skill_name, starting_level, target_level, assigned_by
+        )
+        VALUES ($1, $2, $3, $4, $5)
+        RETURNING id, assigned_at::text as assigned_at
+    """
+
+    async with adb() as conn:
+        existing = await conn.fetchval(
+            """
+            SELECT id FROM skill_targets
+            WHERE student_id = $1 AND skill_name = $2 AND completed = FALSE
+            """,
+            student_id, skill_name
+        )
+
+        if existing is not None:
+            return None
+
+        row = await conn.fetchrow(
+            insert_sql, student_id, skill_name, starting_level, target_level, assigned_by
+        )
+
+    return dict(row)
+
+
+async def list_targets(student_id: str, completed: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    Get a student's skill targets, newest first
+
+    Args:
+        student_id: Student ID
+        completed: Optional filter for completed/active targets
+
+    Returns:
+        List of target rows
+    """
+    query = f"""
+        SELECT {TARGET_COLUMNS}
+        FROM skill_targets
+        WHERE student_id = $1
+          AND ($2::boolean IS NULL OR completed = $2)
+        ORDER BY assigned_at DESC
+    """
+
+    rows = await fetch(query, student_id, completed)
+
+    return [dict(row) for row in rows]
+
+
+async def complete_target(target_id: int) -> Optional[str]:
+    """
+    Mark a skill target as completed
+
+    Args:
+        target_id: Target ID
+
+    Returns:
+        The target's student_id, or None if the target does not exist
+    """
+    return await fetchval(
+        """
+        UPDATE skill_targets
+        SET completed = TRUE, completed_at = NOW()
+        WHERE id = $1
+        RETURNING student_id
+        """,
+        target_id
+    )
+
+
+async def list_active_skill_progress(student_id: str) -> List[Dict[str, Any]]:
+    """
+    Get current and target levels for each active targeted skill
+
+    Args:
+        student_id: Student ID
+
+    Returns:
+        List of rows matching ActiveSkillProgressResponse
+    """
+    query = """
+        SELECT
+            st.skill_name,
+            COALESCE(ss.skill_category, 'Unknown') as skill_category,
+            st.target_level,
+            COALESCE(ss.latest_level, st.starting_level) as current_level,
+            COALESCE(ss.latest_level_numeric, level_to_numeric(st.starting_level), 0) as current_level_numeric,
+            COALESCE(level_to_numeric(st.target_level), 0) as target_level_numeric
+        FROM skill_targets st
+        LEFT JOIN student_skill_state ss
+            ON ss.student_id = st.student_id AND ss.skill_name = st.skill_name
+        WHERE st.student_id = $1 AND st.completed = FALSE
+        ORDER BY st.skill_name ASC
+    """
+
+    rows = await fetch(query, student_id)
+
+    return [dict(row) for row in rows]
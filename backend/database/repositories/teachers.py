@@ -0,0 +1,195 @@
+"""
+Teachers Repository
+
+Class-wide queries for the teacher dashboard.
+"""
+
+import asyncio
+import json
+
+from database.async_connection import fetch, fetchrow, fetchval
+from database.repositories.students import RECENT_GROWTH_JSON, TARGET_COLUMNS
+from typing import List, Optional, Dict, Any
+
+
+async def get_dashboard(teacher_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get every student in a teacher's class with progress, targets and review counts
+
+    Three set-based reads run concurrently regardless of class size: the
+    teacher, one row per student (counters, pending reviews, recent growth),
+    and all active targets for the class.
+
+    Args:
+        teacher_id: Teacher ID
+
+    Returns:
+        Dict with teacher_name and students (each with total_assessments,
+        total_badges, active_targets, pending_reviews, recent_growth and
+        targets), or None if the teacher does not exist
+    """
+    students_query = f"""
+        SELECT
+            s.id, s.name, s.grade,
+            COALESCE(c.assessment_count, 0) as total_assessments,
+            COALESCE(c.badge_count, 0) as total_badges,
+            COALESCE(c.active_target_count, 0) as active_targets,
+            COALESCE(p.pending_reviews, 0) as pending_reviews,
+            {RECENT_GROWTH_JSON} as recent_growth
+        FROM students s
+        LEFT JOIN student_progress_counters c ON c.student_id = s.id
+        LEFT JOIN (
+            SELECT student_id, COUNT(*) as pending_reviews
+            FROM assessments
+            WHERE corrected = FALSE
+              AND student_id IN (SELECT id FROM students WHERE teacher_id = $1)
+            GROUP BY student_id
+        ) p ON p.student_id = s.id
+        WHERE s.teacher_id = $1
+        ORDER BY s.name ASC
+    """
+
+    targets_query = f"""
+        SELECT {TARGET_COLUMNS}
+        FROM skill_targets
+        WHERE completed = FALSE
+          AND student_id IN (SELECT id FROM students WHERE teacher_id = $1)
+        ORDER BY assigned_at DESC
+    """
+
+    teacher, student_rows, target_rows = await asyncio.gather(
+        fetchrow("SELECT name FROM teachers WHERE id = $1", teacher_id),
+        fetch(students_query, teacher_id),
+        fetch(targets_query, teacher_id)
+    )
+
+    if teacher is None:
+        return None
+
+    targets_by_student: Dict[str, List[Dict[str, Any]]] = {}
+    for row in target_rows:
+        targets_by_student.setdefault(row['student_id'], []).append(dict(row))
+
+    students = [
+        {
+            **dict(row),
+            'recent_growth': json.loads(row['recent_growth']),
+            'targets': targets_by_student.get(row['id'], [])
+        }
+        for row in student_rows
+    ]
+
+    return {
+        'teacher_name': teacher['name'],
+        'students': students
+    }
+
+
+async def get_summary(teacher_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a teacher's headline counts without loading any assessment rows
+
+    Four small reads run concurrently: class size and target totals from
+    student_progress_counters, pending reviews by student and by skill in one
+    grouped pass over idx_assessments_pending_student_skill, today's
+    corrections from idx_corrections_teacher_date, and active targets whose
+    student has already reached the target level (due for completion).
+
+    Args:
+        teacher_id: Teacher ID
+
+    Returns:
+        Dict with teacher_name, total_students, active_targets,
+        students_with_active_targets, pending_by_student, pending_by_skill,
+        corrections_today and targets_due, or None if the teacher does not exist
+    """
+    class_query = """
+        SELECT
+            t.name as teacher_name,
+            COUNT(s.id) as total_students,
+            COALESCE(SUM(c.active_target_count), 0)::int as active_targets,
+            COUNT(*) FILTER (WHERE c.active_target_count > 0) as students_with_active_targets
+        FROM teachers t
+        LEFT JOIN students s ON s.teacher_id = t.id
+        LEFT JOIN student_progress_counters c ON c.student_id = s.id
+        WHERE t.id = $1
+        GROUP BY t.name
+    """
+
+    pending_query = """
+        SELECT student_id, skill_name, COUNT(*) as pending
+        FROM assessments
+        WHERE corrected = FALSE
+          AND student_id IN (SELECT id FROM students WHERE teacher_id = $1)
+        GROUP BY GROUPING SETS ((student_id), (skill_name))
+    """
+
+    corrections_query = """
+        SELECT COUNT(*)
+        FROM teacher_corrections
+        WHERE corrected_by = $1 AND corrected_at >= CURRENT_DATE
+    """
+
+    due_query = """
+        SELECT COUNT(*)
+        FROM skill_targets st
+        JOIN student_skill_state ss
+          ON ss.student_id = st.student_id AND ss.skill_name = st.skill_name
+        WHERE st.completed = FALSE
+          AND st.student_id IN (SELECT id FROM students WHERE teacher_id = $1)
+          AND ss.latest_level_numeric >= level_to_numeric(st.target_level)
+    """
+
+    class_row, pending_rows, corrections_today, targets_due = await asyncio.gather(
+        fetchrow(class_query, teacher_id),
+        fetch(pending_query, teacher_id),
+        fetchval(corrections_query, teacher_id),
+        fetchval(due_query, teacher_id)
+    )
+
+    if class_row is None:
+        return None
+
+    return {
+        **dict(class_row),
+        'pending_by_student': {
+            row['student_id']: row['pending'] for row in pending_rows if row['student_id'] is not None
+        },
+        'pending_by_skill': {
+            row['skill_name']: row['pending'] for row in pending_rows if row['skill_name'] is not None
+        },
+        'corrections_today': corrections_today,
+        'targets_due': targets_due
+    }
+
+
+async def list_class_versions(teacher_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get the data version of every student in a teacher's class
+
+    Args:
+        teacher_id: Teacher ID
+
+    Returns:
+        List of {student_id, version} ordered by student ID,
+        or None if the teacher does not exist
+    """
+    rows = await fetch(
+        """
+        SELECT t.id as teacher_id, s.id as student_id, v.version
+        FROM teachers t
+        LEFT JOIN students s ON s.teacher_id = t.id
+        LEFT JOIN student_versions v ON v.student_id = s.id
+        WHERE t.id = $1
+        ORDER BY s.id
+        """,
+        teacher_id
+    )
+
+    if not rows:
+        return None
+
+    return [
+        {'student_id': row['student_id'], 'version': row['version']}
+        for row in rows if row['student_id'] is not None
+    ]
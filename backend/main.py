@@ -8,10 +8,13 @@ from fastapi.middleware.cors import CORSMiddleware
 import os
 import logging
 import subprocess
-from database import test_connection
+from database import test_connection, db, get_pool_stats, get_async_pool_stats
+from cache import get_cache_stats
+from compression import CompressionMiddleware
+from serialization import FastJSONResponse
 
 # Import all routers
-from routers import data_ingest, assessments, corrections, students, badges
+from routers import data_ingest, assessments, corrections, students, badges, teachers, export
 
 # Configure logging
 logging.basicConfig(
@@ -26,7 +29,8 @@ app = FastAPI(
     description="AI-powered soft skills assessment system with 15+ endpoints for data ingestion, assessment retrieval, teacher corrections, student progress, and badge management",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse
 )
 
 # CORS configuration for Streamlit frontend
@@ -43,14 +47,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Brotli/gzip for bodies above COMPRESSION_MIN_SIZE (see compression.py)
+app.add_middleware(CompressionMiddleware)
+
 # Include all routers
 app.include_router(data_ingest.router)
 app.include_router(assessments.router)
 app.include_router(corrections.router)
 app.include_router(students.router)
 app.include_router(badges.router)
+app.include_router(teachers.router)
+app.include_router(export.router)
 
 logger.info("All routers registered successfully")
 
@@ -66,8 +76,10 @@ async def root():
     }
 
 
+# Sync endpoints: FastAPI runs them in its threadpool, so waiting on the
+# psycopg2 pool never stalls the event loop.
 @app.get("/health")
-async def health_check():
+def health_check():
     """
     Lightweight health check endpoint for Render monitoring.
 
@@ -96,48 +108,38 @@ async def health_check():
 
 
 @app.get("/api/status")
-async def detailed_status():
+def detailed_status():
     """
     Detailed status endpoint with full database stats.
     Use this for monitoring dashboards, not for health checks.
     """
-    from database.connection import get_db_connection, return_db_connection
-
     db_status = "disconnected"
     tables_exist = False
     student_count = 0
     assessment_count = 0
-    conn = None
 
     try:
         if test_connection():
             db_status = "connected"
 
             # Check if tables exist and get counts
-            conn = get_db_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_name = 'students'
-                )
-            """)
-            tables_exist = cursor.fetchone()[0]
-
-            if tables_exist:
-                cursor.execute("SELECT COUNT(*) FROM students")
-                student_count = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM assessments")
-                assessment_count = cursor.fetchone()[0]
-
-            cursor.close()
-            return_db_connection(conn)
+            with db() as cursor:
+                cursor.execute("""
+                    SELECT EXISTS (
+                        SELECT FROM information_schema.tables
+                        WHERE table_schema = 'public' AND table_name = 'students'
+                    ) as exists
+                """)
+                tables_exist = cursor.fetchone()['exists']
+
+                if tables_exist:
+                    cursor.execute("SELECT COUNT(*) as count FROM students")
+                    student_count = cursor.fetchone()['count']
+
+                    cursor.execute("SELECT COUNT(*) as count FROM assessments")
+                    assessment_count = cursor.fetchone()['count']
     except Exception as e:
         logger.error(f"Status check error: {e}")
-        if conn:
-            return_db_connection(conn)
 
     return {
         "status": "healthy" if db_status == "connected" and tables_exist else "degraded",
@@ -150,6 +152,22 @@ async def detailed_status():
     }
 
 
+@app.get("/api/metrics")
+async def metrics():
+    """
+    Runtime metrics for monitoring dashboards.
+
+    Reports usage and acquisition wait times for both database pools:
+    the sync pool (ingestion, AI) and the async pool (API routers),
+    and hit ratios for the response cache.
+    """
+    return {
+        "db_pool": get_pool_stats(),
+        "db_async_pool": get_async_pool_stats(),
+        "response_cache": get_cache_stats()
+    }
+
+
 @app.post("/api/admin/initialize-data")
 async def initialize_data(admin_key: str):
     """
@@ -251,6 +269,13 @@ async def startup_event():
     else:
         logger.error("✗ Database connection failed!")
 
+    # Create the async pool used by the API routers
+    try:
+        from database.async_connection import init_async_pool
+        await init_async_pool()
+    except Exception as e:
+        logger.error(f"✗ Async database pool failed to initialize: {e}")
+
     # Check OpenAI API key
     api_key = os.getenv('OPENAI_API_KEY')
     if api_key:
@@ -267,6 +292,7 @@ async def startup_event():
     logger.info("  → Corrections: /api/corrections/*")
     logger.info("  → Students: /api/students/*")
     logger.info("  → Badges: /api/badges/*")
+    logger.info("  → Teachers: /api/teachers/*")
     logger.info("=" * 80)
     logger.info("API Documentation: http://localhost:8000/docs")
 
@@ -288,3 +314,9 @@ async def shutdown_event():
         close_all_connections()
     except Exception as e:
         logger.error(f"Error closing connections: {e}")
+
+    try:
+        from database.async_connection import close_async_pool
+        await close_async_pool()
+    except Exception as e:
+        logger.error(f"Error closing async pool: {e}")
@@ -3,5 +3,6 @@ Pydantic models for request/response validation
 """
 
 from .schemas import *
+from .levels import LEVEL_NAMES, LEVEL_NUMERIC, normalize_level, level_to_numeric
 
-__all__ = ['schemas']
+__all__ = ['schemas', 'levels']
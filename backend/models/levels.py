@@ -0,0 +1,60 @@
+"""
+Proficiency Levels
+
+Canonical names and numeric values for the four rubric proficiency levels.
+
+Levels arrive as full names (seed data, teacher input) or as single letters
+(AI inference output). They are normalized to the full name, and stored with
+their numeric value, before being written to the database. The SQL function
+level_to_numeric() in migration 003 applies the same mapping.
+"""
+
+from typing import Dict, Tuple
+
+# Ordered lowest to highest; numeric values are 1-based positions
+LEVEL_NAMES: Tuple[str, ...] = ('Emerging', 'Developing', 'Proficient', 'Advanced')
+
+LEVEL_NUMERIC: Dict[str, int] = {
+    name: position for position, name in enumerate(LEVEL_NAMES, start=1)
+}
+
+# Accepted spellings (case-insensitive) -> canonical name
+_LEVEL_ALIASES: Dict[str, str] = {
+    **{name.lower(): name for name in LEVEL_NAMES},
+    **{name[0].lower(): name for name in LEVEL_NAMES}
+}
+
+
+def normalize_level(level: str) -> str:
+    """
+    Map a level label to its canonical full name
+
+    Args:
+        level: Full name or single-letter abbreviation (e.g. "P", "proficient")
+
+    Returns:
+        Canonical level name (e.g. "Proficient")
+
+    Raises:
+        ValueError: If the label is not a known proficiency level
+    """
+    canonical = _LEVEL_ALIASES.get(str(level).strip().lower())
+    if canonical is None:
+        raise ValueError(f"Unknown proficiency level: {level!r}")
+    return canonical
+
+
+def level_to_numeric(level: str) -> int:
+    """
+    Numeric value of a level (1=Emerging ... 4=Advanced)
+
+    Args:
+        level: Full name or single-letter abbreviation
+
+    Returns:
+        Integer 1-4
+
+    Raises:
+        ValueError: If the label is not a known proficiency level
+    """
+    return LEVEL_NUMERIC[normalize_level(level)]
@@ -4,10 +4,12 @@ Pydantic Schemas for API Request/Response Validation
 This module defines all data models used in the Flourish Skills Tracker API.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .levels import normalize_level
+
 
 # ============================================================================
 # DATA INGESTION SCHEMAS
@@ -85,6 +87,24 @@ class AssessmentResponse(BaseModel):
     created_at: str
 
 
+class ReviewClaimResponse(BaseModel):
+    """
+    Response schema for assessments leased to a reviewer
+    """
+    claimed_by: str
+    claimed_until: str  # Lease expiry for these and the reviewer's other leases
+    assessments: List[AssessmentResponse]  # Priority order; empty when nothing is left
+    available: int  # Matching assessments not leased to another teacher
+
+
+class ReviewReleaseRequest(BaseModel):
+    """
+    Request schema for giving up review leases
+    """
+    claimed_by: str = Field(..., example="T001")
+    assessment_ids: Optional[List[int]] = Field(None, example=[1, 2], description="Omit to release all")
+
+
 class SkillTrendResponse(BaseModel):
     """
     Response schema for skill trend data (for charting)
@@ -124,11 +144,11 @@ class CorrectionRequest(BaseModel):
     @classmethod
     def validate_level(cls, v):
         """Validate level is one of: E, D, P, A"""
-        if v not in ['E', 'D', 'P', 'A', 'Emerging', 'Developing', 'Proficient', 'Advanced']:
+        try:
+            # Normalize to full names
+            return normalize_level(v)
+        except ValueError:
             raise ValueError('Level must be one of: E, D, P, A, Emerging, Developing, Proficient, Advanced')
-        # Normalize to full names
-        level_map = {'E': 'Emerging', 'D': 'Developing', 'P': 'Proficient', 'A': 'Advanced'}
-        return level_map.get(v, v)
 
 
 class CorrectionResponse(BaseModel):
@@ -137,6 +157,7 @@ class CorrectionResponse(BaseModel):
     """
     success: bool
     correction_id: int
+    student_id: Optional[str] = None  # Student whose assessment was corrected
     message: str
 
 
@@ -148,6 +169,47 @@ class ApprovalRequest(BaseModel):
     approved_by: str = Field(..., example="T001")
 
 
+# Largest batch accepted by POST /api/corrections/bulk
+BULK_REVIEW_MAX_ITEMS = 500
+
+
+class BulkReviewRequest(BaseModel):
+    """
+    Request schema for applying a batch of review decisions at once
+
+    Each assessment may appear only once across approvals and corrections.
+    By default the batch is rejected if any assessment no longer exists;
+    with skip_missing the rest are applied and the missing ones reported.
+    """
+    approvals: List[ApprovalRequest] = Field(default_factory=list)
+    corrections: List[CorrectionRequest] = Field(default_factory=list)
+    skip_missing: bool = False
+
+    @model_validator(mode='after')
+    def validate_batch(self):
+        """Validate the batch is non-empty, bounded and names each assessment once"""
+        assessment_ids = [a.assessment_id for a in self.approvals] + [c.assessment_id for c in self.corrections]
+        if not assessment_ids:
+            raise ValueError('Batch must contain at least one approval or correction')
+        if len(assessment_ids) > BULK_REVIEW_MAX_ITEMS:
+            raise ValueError(f'Batch may contain at most {BULK_REVIEW_MAX_ITEMS} decisions')
+        if len(set(assessment_ids)) != len(assessment_ids):
+            raise ValueError('Each assessment may appear only once per batch')
+        return self
+
+
+class BulkReviewResponse(BaseModel):
+    """
+    Response schema for a batch of review decisions
+    """
+    success: bool
+    approved_ids: List[int]
+    correction_ids: List[int]  # In the order the corrections were submitted
+    student_ids: List[str]  # Students whose assessments were reviewed
+    missing_ids: List[int] = Field(default_factory=list)  # Skipped: no longer exist
+    message: str
+
+
 # ============================================================================
 # STUDENT & TARGET SCHEMAS
 # ============================================================================
@@ -175,6 +237,19 @@ class StudentProgressResponse(BaseModel):
     recent_growth: List[Dict[str, Any]]  # [{skill_name, from_level, to_level, date}, ...]
 
 
+class StudentProfileResponse(BaseModel):
+    """
+    Response schema for a student's combined profile
+
+    Sections not requested via ?include= are omitted from the response.
+    """
+    student_id: str
+    trends: Optional[List[Dict[str, Any]]] = None  # SkillTrendResponse items
+    progress: Optional[Dict[str, Any]] = None  # StudentProgressResponse
+    targets: Optional[List[Dict[str, Any]]] = None  # Active TargetResponse items
+    badges: Optional[Dict[str, Any]] = None  # BadgeCollectionResponse
+
+
 class TargetAssignmentRequest(BaseModel):
     """
     Request schema for assigning a skill target to a student
@@ -189,9 +264,10 @@ class TargetAssignmentRequest(BaseModel):
     @classmethod
     def validate_level(cls, v):
         """Validate levels"""
-        if v not in ['Emerging', 'Developing', 'Proficient', 'Advanced']:
+        try:
+            return normalize_level(v)
+        except ValueError:
             raise ValueError('Level must be: Emerging, Developing, Proficient, or Advanced')
-        return v
 
 
 class TargetResponse(BaseModel):
@@ -243,10 +319,13 @@ class BadgeGrantRequest(BaseModel):
     @classmethod
     def validate_level(cls, v):
         """Validate level is D, P, or A (no badges for Emerging)"""
-        if v not in ['Developing', 'Proficient', 'Advanced', 'D', 'P', 'A']:
+        try:
+            level = normalize_level(v)
+        except ValueError:
+            level = None
+        if level not in ['Developing', 'Proficient', 'Advanced']:
             raise ValueError('Badge level must be: Developing, Proficient, or Advanced')
-        level_map = {'D': 'Developing', 'P': 'Proficient', 'A': 'Advanced'}
-        return level_map.get(v, v)
+        return level
     
     @field_validator('skill_category')
     @classmethod
@@ -268,6 +347,61 @@ class BadgeCollectionResponse(BaseModel):
     total_possible: int
 
 
+# ============================================================================
+# TEACHER DASHBOARD SCHEMAS
+# ============================================================================
+
+class DashboardStudentResponse(BaseModel):
+    """
+    One student's row on the teacher dashboard
+    """
+    id: str
+    name: str
+    grade: int
+    total_assessments: int
+    total_badges: int
+    active_targets: int
+    pending_reviews: int
+    recent_growth: List[Dict[str, Any]]  # [{skill_name, from_level, to_level, date}, ...]
+    targets: List[TargetResponse]  # Active (uncompleted) targets, newest first
+
+
+class TeacherDashboardResponse(BaseModel):
+    """
+    Response schema for a teacher's class dashboard
+    """
+    teacher_id: str
+    teacher_name: str
+    total_students: int
+    total_assessments: int
+    pending_reviews: int
+    students_with_active_targets: int
+    students: List[DashboardStudentResponse]
+
+
+class TeacherSummaryResponse(BaseModel):
+    """
+    Response schema for a teacher's headline counts
+    """
+    teacher_id: str
+    teacher_name: str
+    total_students: int
+    pending_reviews: int
+    pending_by_student: Dict[str, int]  # Students with no pending reviews are omitted
+    pending_by_skill: Dict[str, int]  # Skills with no pending reviews are omitted
+    corrections_today: int  # Corrections made by this teacher since midnight
+    active_targets: int
+    students_with_active_targets: int
+    targets_due: int  # Active targets the student has already reached
+
+
+class PendingCountResponse(BaseModel):
+    """
+    Response schema for a count of pending assessments
+    """
+    count: int
+
+
 # ============================================================================
 # ERROR RESPONSE SCHEMA
 # ============================================================================
@@ -2,4 +2,4 @@
 API Routers for Flourish Skills Tracker
 """
 
-__all__ = ['data_ingest', 'assessments', 'corrections', 'students', 'badges']
+__all__ = ['data_ingest', 'assessments', 'corrections', 'students', 'badges', 'teachers']
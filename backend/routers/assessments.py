@@ -4,188 +4,187 @@ Assessments Router
 Handles retrieval and viewing of skill assessments.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from models.schemas import AssessmentResponse, SkillTrendResponse
-from database.connection import get_db_connection, return_db_connection
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from models.schemas import (
+    AssessmentResponse, ReviewClaimResponse, ReviewReleaseRequest,
+    PendingCountResponse,
+    SkillTrendResponse
+)
+from database.repositories import assessments as assessments_repo
+from database.repositories.pagination import InvalidCursorError
+from cache import cached
+from serialization import rows_response
+from conditional import student_etag
 from typing import List, Optional
+import asyncpg
 import logging
 
 # Router setup
 router = APIRouter(prefix="/api/assessments", tags=["Assessments"])
 logger = logging.getLogger(__name__)
 
+# Paginated listings return the cursor for the next page in this header
+# (absent on the last page) so the response body stays a plain list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
 
-@router.get("/student/{student_id}", response_model=List[AssessmentResponse])
-async def get_student_assessments(student_id: str):
+# Review leases: largest claim, and lease length bounds in seconds
+MAX_CLAIM_SIZE = 100
+DEFAULT_LEASE_SECONDS = 900
+MAX_LEASE_SECONDS = 3600
+
+
+@router.get(
+    "/student/{student_id}",
+    response_model=List[AssessmentResponse],
+    dependencies=[Depends(student_etag)]
+)
+async def get_student_assessments(
+    student_id: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page")
+):
     """
-    Get all assessments for a specific student
-    
+    Get a page of assessments for a specific student
+
     Args:
         student_id: Student ID (e.g., "S001")
-        
+        limit: Page size (default 100)
+        cursor: Cursor from the previous page's X-Next-Cursor header
+
     Returns:
-        List of AssessmentResponse objects ordered by date (newest first)
+        List of AssessmentResponse objects ordered by creation time (newest first)
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                id, data_entry_id, student_id, skill_name, skill_category,
-                level, confidence_score, justification, source_quote,
-                data_point_count, rubric_version, corrected,
-                created_at::text as created_at
-            FROM assessments
-            WHERE student_id = %s
-            ORDER BY created_at DESC
-        """
-        
-        cursor.execute(query, (student_id,))
-        results = cursor.fetchall()
-        
-        assessments = [
-            AssessmentResponse(**dict(row)) for row in results
-        ]
-        
-        logger.info(f"Retrieved {len(assessments)} assessments for student {student_id}")
-        return assessments
-        
+        results, next_cursor = await assessments_repo.list_for_student(student_id, limit, cursor)
+
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+        logger.info(f"Retrieved {len(results)} assessments for student {student_id}")
+        return rows_response(AssessmentResponse, results, response)
+
+    except HTTPException:
+        raise
+
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     except Exception as e:
         logger.error(f"Error retrieving assessments: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve assessments: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
-@router.get("/skill-trends/{student_id}", response_model=List[SkillTrendResponse])
+@router.get(
+    "/skill-trends/{student_id}",
+    response_model=List[SkillTrendResponse],
+    dependencies=[Depends(student_etag)]
+)
+@cached("skill_trends")
 async def get_skill_trends(student_id: str):
     """
     Get skill trend data for charting student progress over time
-    
+
     Groups assessments by skill and returns chronological data for each skill.
-    
+
     Args:
         student_id: Student ID
-        
+
     Returns:
         List of SkillTrendResponse objects with assessment history per skill
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                skill_name, skill_category, level, confidence_score,
-                de.date
-            FROM assessments a
-            JOIN data_entries de ON a.data_entry_id = de.id
-            WHERE a.student_id = %s
-            ORDER BY skill_name, de.date ASC
-        """
-        
-        cursor.execute(query, (student_id,))
-        results = cursor.fetchall()
-        
+        results = await assessments_repo.list_trend_points(student_id)
+
         # Group by skill
         skills_data = {}
-        level_map = {'Emerging': 1, 'Developing': 2, 'Proficient': 3, 'Advanced': 4}
-        
+
         for row in results:
             skill_name = row['skill_name']
-            
+
             if skill_name not in skills_data:
                 skills_data[skill_name] = {
                     'skill_name': skill_name,
                     'skill_category': row['skill_category'],
                     'assessments': []
                 }
-            
+
             skills_data[skill_name]['assessments'].append({
                 'date': row['date'],
                 'level': row['level'],
-                'level_numeric': level_map.get(row['level'], 0),
+                'level_numeric': row['level_numeric'] or 0,
                 'confidence': row['confidence_score']
             })
-        
+
         trends = [
             SkillTrendResponse(**data) for data in skills_data.values()
         ]
-        
+
         logger.info(f"Retrieved trends for {len(trends)} skills for student {student_id}")
         return trends
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error retrieving skill trends: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve skill trends: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
 @router.get("/pending", response_model=List[AssessmentResponse])
 async def get_pending_assessments(
-    limit: int = Query(50, description="Maximum number of assessments to return"),
-    min_confidence: Optional[float] = Query(None, description="Filter by minimum confidence score")
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of assessments to return"),
+    min_confidence: Optional[float] = Query(None, description="Filter by minimum confidence score"),
+    max_confidence: Optional[float] = Query(None, description="Filter by maximum confidence score"),
+    student_id: Optional[str] = Query(None, description="Filter by student"),
+    skill_name: Optional[str] = Query(None, description="Filter by skill"),
+    teacher_id: Optional[str] = Query(None, description="Filter to a teacher's students"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page")
 ):
     """
     Get pending (uncorrected) assessments that need teacher review
-    
+
     Sorted by confidence score (lowest first) to prioritize uncertain assessments.
-    
+    Filters are applied in the database; when more rows match than fit in one
+    page, the X-Next-Cursor response header holds the cursor for the next page.
+
     Args:
         limit: Maximum number to return (default 50)
-        min_confidence: Optional filter for confidence threshold
-        
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional teacher filter
+        cursor: Cursor from the previous page's X-Next-Cursor header
+
     Returns:
         List of uncorrected AssessmentResponse objects
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        base_query = """
-            SELECT 
-                id, data_entry_id, student_id, skill_name, skill_category,
-                level, confidence_score, justification, source_quote,
-                data_point_count, rubric_version, corrected,
-                created_at::text as created_at
-            FROM assessments
-            WHERE corrected = FALSE
-        """
-        
-        if min_confidence is not None:
-            base_query += f" AND confidence_score >= {min_confidence}"
-        
-        base_query += " ORDER BY confidence_score ASC, created_at DESC LIMIT %s"
-        
-        cursor.execute(base_query, (limit,))
-        results = cursor.fetchall()
-        
-        assessments = [
-            AssessmentResponse(**dict(row)) for row in results
-        ]
-        
-        logger.info(f"Retrieved {len(assessments)} pending assessments")
-        return assessments
-        
+        results, next_cursor = await assessments_repo.list_pending(
+            limit,
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            student_id=student_id,
+            skill_name=skill_name,
+            teacher_id=teacher_id,
+            cursor=cursor
+        )
+
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+        logger.info(f"Retrieved {len(results)} pending assessments")
+        return rows_response(AssessmentResponse, results, response)
+
+    except HTTPException:
+        raise
+
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error retrieving pending assessments: {error_msg}", exc_info=True)
@@ -198,59 +197,163 @@ async def get_pending_assessments(
             )
 
         raise HTTPException(status_code=500, detail=f"Failed to retrieve pending assessments: {error_msg}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
+
+
+@router.get("/pending/count", response_model=PendingCountResponse)
+async def count_pending_assessments(
+    min_confidence: Optional[float] = Query(None, description="Filter by minimum confidence score"),
+    max_confidence: Optional[float] = Query(None, description="Filter by maximum confidence score"),
+    student_id: Optional[str] = Query(None, description="Filter by student"),
+    skill_name: Optional[str] = Query(None, description="Filter by skill"),
+    teacher_id: Optional[str] = Query(None, description="Filter to a teacher's students")
+):
+    """
+    Count pending (uncorrected) assessments matching the /pending filters
+
+    Args:
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional teacher filter
+
+    Returns:
+        PendingCountResponse with the number of matching assessments
+    """
+    try:
+        count = await assessments_repo.count_pending(
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            student_id=student_id,
+            skill_name=skill_name,
+            teacher_id=teacher_id
+        )
+
+        return PendingCountResponse(count=count)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error counting pending assessments: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to count pending assessments: {str(e)}")
+
+
+@router.post("/pending/claim", response_model=ReviewClaimResponse)
+async def claim_pending_assessments(
+    claimed_by: str = Query(..., description="Teacher claiming the assessments"),
+    n: int = Query(20, ge=1, le=MAX_CLAIM_SIZE, description="Number of assessments to claim"),
+    lease_seconds: int = Query(DEFAULT_LEASE_SECONDS, ge=60, le=MAX_LEASE_SECONDS, description="Lease length"),
+    min_confidence: Optional[float] = Query(None, description="Filter by minimum confidence score"),
+    max_confidence: Optional[float] = Query(None, description="Filter by maximum confidence score"),
+    student_id: Optional[str] = Query(None, description="Filter by student"),
+    skill_name: Optional[str] = Query(None, description="Filter by skill"),
+    teacher_id: Optional[str] = Query(None, description="Filter to a teacher's students")
+):
+    """
+    Lease the next pending assessments to a reviewer
+
+    Concurrent reviewers each get different assessments: claimed ones are
+    skipped by other teachers' claims until the lease expires or is released.
+    Each claim also renews the reviewer's other leases. Claim again for more
+    work; an empty list means nothing matching is left unclaimed.
+
+    Args:
+        claimed_by: Reviewing teacher's ID
+        n: Number of assessments to claim (default 20)
+        lease_seconds: Lease length (default 900)
+        min_confidence: Optional minimum confidence score (inclusive)
+        max_confidence: Optional maximum confidence score (inclusive)
+        student_id: Optional student filter
+        skill_name: Optional skill filter
+        teacher_id: Optional teacher filter
+
+    Returns:
+        ReviewClaimResponse with the claimed assessments, lowest priority score first
+    """
+    filters = {
+        'min_confidence': min_confidence,
+        'max_confidence': max_confidence,
+        'student_id': student_id,
+        'skill_name': skill_name,
+        'teacher_id': teacher_id
+    }
+
+    try:
+        results, claimed_until = await assessments_repo.claim_pending(
+            claimed_by, n, lease_seconds, **filters
+        )
+        available = await assessments_repo.count_pending(available_to=claimed_by, **filters)
+
+        logger.info(f"Teacher {claimed_by} claimed {len(results)} assessments for review")
+        return ReviewClaimResponse(
+            claimed_by=claimed_by,
+            claimed_until=claimed_until.isoformat(),
+            assessments=[AssessmentResponse(**row) for row in results],
+            available=available
+        )
+
+    except HTTPException:
+        raise
+
+    except asyncpg.ForeignKeyViolationError:
+        raise HTTPException(status_code=404, detail=f"Teacher {claimed_by} not found")
+
+    except Exception as e:
+        logger.error(f"Error claiming assessments: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to claim assessments: {str(e)}")
+
+
+@router.post("/pending/release")
+async def release_pending_assessments(release: ReviewReleaseRequest):
+    """
+    Release a reviewer's leases so other teachers can claim the assessments
+
+    Args:
+        release: ReviewReleaseRequest with the teacher and optional assessment IDs
+
+    Returns:
+        Success message with the number of leases released
+    """
+    try:
+        released = await assessments_repo.release_claims(release.claimed_by, release.assessment_ids)
+
+        logger.info(f"Teacher {release.claimed_by} released {released} review leases")
+        return {
+            "success": True,
+            "released": released
+        }
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error releasing review leases: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to release review leases: {str(e)}")
 
 
 @router.get("/{assessment_id}", response_model=AssessmentResponse)
 async def get_assessment_by_id(assessment_id: int):
     """
     Get a specific assessment by ID
-    
+
     Args:
         assessment_id: Assessment ID
-        
+
     Returns:
         AssessmentResponse object
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                id, data_entry_id, student_id, skill_name, skill_category,
-                level, confidence_score, justification, source_quote,
-                data_point_count, rubric_version, corrected,
-                created_at::text as created_at
-            FROM assessments
-            WHERE id = %s
-        """
-        
-        cursor.execute(query, (assessment_id,))
-        result = cursor.fetchone()
-        
+        result = await assessments_repo.get_by_id(assessment_id)
+
         if not result:
             raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
-        
-        return AssessmentResponse(**dict(result))
-        
+
+        return AssessmentResponse(**result)
+
     except HTTPException:
         raise
-    
+
     except Exception as e:
         logger.error(f"Error retrieving assessment: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve assessment: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
@@ -4,9 +4,11 @@ Badges Router
 Handles badge management and gamification features.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from models.schemas import BadgeResponse, BadgeGrantRequest, BadgeCollectionResponse
-from database.connection import get_db_connection, return_db_connection
+from database.repositories import badges as badges_repo
+from cache import cached, response_cache
+from conditional import student_etag
 from typing import List, Dict, Any
 import logging
 
@@ -31,7 +33,12 @@ ALL_SKILLS = {
 }
 
 
-@router.get("/students/{student_id}/badges", response_model=BadgeCollectionResponse)
+@router.get(
+    "/students/{student_id}/badges",
+    response_model=BadgeCollectionResponse,
+    dependencies=[Depends(student_etag)]
+)
+@cached("student_badges")
 async def get_student_badges(student_id: str):
     """
     Get a student's complete badge collection (earned and locked)
@@ -42,27 +49,11 @@ async def get_student_badges(student_id: str):
     Returns:
         BadgeCollectionResponse with earned and locked badges
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Get earned badges
-        query = """
-            SELECT 
-                id, student_id, skill_name, skill_category, level_achieved,
-                badge_type, granted_by, earned_date, created_at::text as created_at
-            FROM badges
-            WHERE student_id = %s
-            ORDER BY earned_date DESC
-        """
+        results = await badges_repo.list_for_student(student_id)
         
-        cursor.execute(query, (student_id,))
-        results = cursor.fetchall()
-        
-        earned_badges = [BadgeResponse(**dict(row)) for row in results]
+        earned_badges = [BadgeResponse(**row) for row in results]
         
         # Generate all possible badges (17 skills × 3 levels = 51 possible badges)
         all_possible_badges = []
@@ -100,15 +91,12 @@ async def get_student_badges(student_id: str):
             total_possible=len(all_possible_badges)
         )
         
+    except HTTPException:
+        raise
+    
     except Exception as e:
         logger.error(f"Error retrieving badges: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve badges: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
 @router.post("/grant", response_model=BadgeResponse)
@@ -124,9 +112,6 @@ async def grant_badge(badge: BadgeGrantRequest):
     Returns:
         BadgeResponse with the granted badge
     """
-    conn = None
-    cursor = None
-    
     try:
         # Determine badge type from level
         badge_type_map = {
@@ -143,47 +128,23 @@ async def grant_badge(badge: BadgeGrantRequest):
                 detail="Invalid level. Badges can only be granted for Developing, Proficient, or Advanced"
             )
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        conn.autocommit = False
-        
-        # Check if badge already exists
-        cursor.execute(
-            """
-            SELECT id FROM badges 
-            WHERE student_id = %s AND skill_name = %s AND level_achieved = %s
-            """,
-            (badge.student_id, badge.skill_name, badge.level_achieved)
+        result = await badges_repo.create_badge(
+            student_id=badge.student_id,
+            skill_name=badge.skill_name,
+            skill_category=badge.skill_category,
+            level_achieved=badge.level_achieved,
+            badge_type=badge_type,
+            granted_by=badge.granted_by,
+            earned_date=badge.earned_date
         )
         
-        if cursor.fetchone():
+        if result is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Badge already granted for {badge.skill_name} at {badge.level_achieved} level"
             )
         
-        # Insert badge
-        insert_sql = """
-            INSERT INTO badges (
-                student_id, skill_name, skill_category, level_achieved,
-                badge_type, granted_by, earned_date
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id, created_at::text as created_at
-        """
-        
-        cursor.execute(insert_sql, (
-            badge.student_id,
-            badge.skill_name,
-            badge.skill_category,
-            badge.level_achieved,
-            badge_type,
-            badge.granted_by,
-            badge.earned_date
-        ))
-        
-        result = cursor.fetchone()
-        conn.commit()
+        response_cache.invalidate_student(badge.student_id)
         
         logger.info(f"Badge granted: {badge.skill_name} ({badge_type}) to {badge.student_id}")
         
@@ -200,24 +161,17 @@ async def grant_badge(badge: BadgeGrantRequest):
         )
         
     except HTTPException:
-        if conn:
-            conn.rollback()
         raise
     
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error granting badge: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to grant badge: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
-@router.get("/students/{student_id}/badge-progress")
+@router.get(
+    "/students/{student_id}/badge-progress",
+    dependencies=[Depends(student_etag)]
+)
 async def get_badge_progress(student_id: str) -> Dict[str, Any]:
     """
     Get badge progress statistics for a student
@@ -230,38 +184,10 @@ async def get_badge_progress(student_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with badge progress metrics
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Count by category
-        cursor.execute(
-            """
-            SELECT skill_category, COUNT(*) as count
-            FROM badges
-            WHERE student_id = %s
-            GROUP BY skill_category
-            """,
-            (student_id,)
-        )
-        
-        category_counts = {row['skill_category']: row['count'] for row in cursor.fetchall()}
-        
-        # Count by badge type
-        cursor.execute(
-            """
-            SELECT badge_type, COUNT(*) as count
-            FROM badges
-            WHERE student_id = %s
-            GROUP BY badge_type
-            """,
-            (student_id,)
-        )
-        
-        badge_type_counts = {row['badge_type']: row['count'] for row in cursor.fetchall()}
+        counts = await badges_repo.count_by_category_and_type(student_id)
+        category_counts = counts['by_category']
+        badge_type_counts = counts['by_type']
         
         # Total counts
         total_earned = sum(category_counts.values())
@@ -284,12 +210,9 @@ async def get_badge_progress(student_id: str) -> Dict[str, Any]:
             }
         }
         
+    except HTTPException:
+        raise
+    
     except Exception as e:
         logger.error(f"Error retrieving badge progress: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve badge progress: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
@@ -5,8 +5,13 @@ Handles teacher corrections and approvals of AI assessments.
 """
 
 from fastapi import APIRouter, HTTPException
-from models.schemas import CorrectionRequest, CorrectionResponse, ApprovalRequest
-from database.connection import get_db_connection, return_db_connection
+from models.schemas import (
+    CorrectionRequest, CorrectionResponse, ApprovalRequest,
+    BulkReviewRequest, BulkReviewResponse
+)
+from database.repositories import corrections as corrections_repo
+from database.repositories.corrections import AssessmentsNotFoundError
+from cache import response_cache
 from typing import List, Dict, Any
 import logging
 
@@ -19,201 +24,161 @@ logger = logging.getLogger(__name__)
 async def submit_correction(correction: CorrectionRequest):
     """
     Submit a teacher correction for an AI-generated assessment
-    
+
     The correction will be stored and used as a few-shot learning example
     for future AI inferences.
-    
+
     Args:
         correction: CorrectionRequest with corrected level and justification
-        
+
     Returns:
         CorrectionResponse with success status and correction ID
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        conn.autocommit = False
-        
-        # Verify assessment exists
-        cursor.execute("SELECT level, justification FROM assessments WHERE id = %s", 
-                      (correction.assessment_id,))
-        result = cursor.fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, 
-                              detail=f"Assessment {correction.assessment_id} not found")
-        
-        original_level = result['level']
-        original_justification = result['justification']
-        
-        # Insert correction
-        insert_sql = """
-            INSERT INTO teacher_corrections (
-                assessment_id, original_level, corrected_level,
-                original_justification, corrected_justification,
-                teacher_notes, corrected_by
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """
-        
-        cursor.execute(insert_sql, (
-            correction.assessment_id,
-            original_level,
-            correction.corrected_level,
-            original_justification,
-            correction.corrected_justification or original_justification,
-            correction.teacher_notes,
-            correction.corrected_by
-        ))
-        
-        correction_id = cursor.fetchone()['id']
-        
-        # Update assessment as corrected
-        cursor.execute(
-            "UPDATE assessments SET corrected = TRUE WHERE id = %s",
-            (correction.assessment_id,)
+        result = await corrections_repo.create_correction(
+            assessment_id=correction.assessment_id,
+            corrected_level=correction.corrected_level,
+            corrected_justification=correction.corrected_justification,
+            teacher_notes=correction.teacher_notes,
+            corrected_by=correction.corrected_by
         )
-        
-        conn.commit()
-        
+
+        if result is None:
+            raise HTTPException(status_code=404,
+                              detail=f"Assessment {correction.assessment_id} not found")
+
+        correction_id = result['id']
+        response_cache.invalidate_student(result['student_id'])
+
         logger.info(f"Correction {correction_id} submitted for assessment {correction.assessment_id}")
-        
+
         return CorrectionResponse(
             success=True,
             correction_id=correction_id,
+            student_id=result['student_id'],
             message="Correction submitted successfully"
         )
-        
+
     except HTTPException:
-        if conn:
-            conn.rollback()
         raise
-    
+
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error submitting correction: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to submit correction: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
 @router.post("/assessments/{assessment_id}/approve")
 async def approve_assessment(assessment_id: int, approval: ApprovalRequest):
     """
     Approve an AI assessment as correct without making changes
-    
+
     This marks the assessment as reviewed and validated by a teacher.
-    
+
     Args:
         assessment_id: Assessment ID to approve
         approval: ApprovalRequest with teacher ID
-        
+
     Returns:
         Success message
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Verify assessment exists
-        cursor.execute("SELECT id FROM assessments WHERE id = %s", (assessment_id,))
-        if not cursor.fetchone():
+        student_id = await corrections_repo.approve_assessment(assessment_id)
+
+        if student_id is None:
             raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
-        
-        # Mark as corrected (approved)
-        cursor.execute(
-            "UPDATE assessments SET corrected = TRUE WHERE id = %s",
-            (assessment_id,)
-        )
-        
-        conn.commit()
-        
+
+        response_cache.invalidate_student(student_id)
+
         logger.info(f"Assessment {assessment_id} approved by {approval.approved_by}")
-        
+
         return {
             "success": True,
+            "student_id": student_id,
             "message": f"Assessment {assessment_id} approved successfully"
         }
-        
+
     except HTTPException:
         raise
-    
+
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error approving assessment: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to approve assessment: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
+
+
+@router.post("/bulk", response_model=BulkReviewResponse)
+async def submit_bulk_review(batch: BulkReviewRequest):
+    """
+    Apply a batch of approvals and corrections in one transaction
+
+    Lets the review page queue decisions and send them together. Either every
+    decision in the batch is applied or none is; with skip_missing, decisions
+    for assessments that no longer exist are left out and reported instead.
+
+    Args:
+        batch: BulkReviewRequest with approvals and corrections
+
+    Returns:
+        BulkReviewResponse with the approved assessment IDs, new correction IDs,
+        affected students and skipped assessment IDs
+    """
+    try:
+        result = await corrections_repo.apply_bulk_review(
+            approvals=[approval.assessment_id for approval in batch.approvals],
+            corrections=[correction.model_dump() for correction in batch.corrections],
+            skip_missing=batch.skip_missing
+        )
+
+        for student_id in result['student_ids']:
+            response_cache.invalidate_student(student_id)
+
+        message = (
+            f"Applied {len(result['approved_ids'])} approvals and "
+            f"{len(result['correction_ids'])} corrections"
+        )
+        if result['missing_ids']:
+            message += f"; skipped {len(result['missing_ids'])} missing assessments"
+
+        logger.info(f"Bulk review: {message}")
+
+        return BulkReviewResponse(
+            success=True,
+            message=message,
+            **result
+        )
+
+    except HTTPException:
+        raise
+
+    except AssessmentsNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except Exception as e:
+        logger.error(f"Error applying bulk review: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to apply bulk review: {str(e)}")
 
 
 @router.get("/recent")
 async def get_recent_corrections(limit: int = 10) -> List[Dict[str, Any]]:
     """
     Get recent teacher corrections
-    
+
     Shows recent corrections with both original and corrected values.
-    
+
     Args:
         limit: Maximum number of corrections to return (default 10)
-        
+
     Returns:
         List of correction objects with assessment details
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                tc.id,
-                tc.assessment_id,
-                a.student_id,
-                a.skill_name,
-                tc.original_level,
-                tc.corrected_level,
-                tc.teacher_notes,
-                tc.corrected_by,
-                tc.corrected_at::text as corrected_at
-            FROM teacher_corrections tc
-            JOIN assessments a ON tc.assessment_id = a.id
-            ORDER BY tc.corrected_at DESC
-            LIMIT %s
-        """
-        
-        cursor.execute(query, (limit,))
-        results = cursor.fetchall()
-        
-        corrections = [dict(row) for row in results]
-        
+        corrections = await corrections_repo.list_recent(limit)
+
         logger.info(f"Retrieved {len(corrections)} recent corrections")
         return corrections
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error retrieving corrections: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve corrections: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
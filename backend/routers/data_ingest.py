@@ -6,7 +6,9 @@ Handles ingestion of student data and AI-powered skill assessment generation.
 
 from fastapi import APIRouter, HTTPException
 from models.schemas import DataEntryRequest, DataEntryResponse
-from database.connection import get_db_connection, return_db_connection
+from models.levels import normalize_level, level_to_numeric
+from database.connection import db
+from cache import response_cache
 from ai import SkillInferenceEngine, load_rubric, FewShotManager
 import os
 import logging
@@ -18,8 +20,10 @@ router = APIRouter(prefix="/api/data", tags=["Data Ingestion"])
 logger = logging.getLogger(__name__)
 
 
+# Sync endpoint: FastAPI runs it in its threadpool, so the blocking
+# psycopg2 and LLM calls below never stall the event loop.
 @router.post("/ingest", response_model=DataEntryResponse)
-async def ingest_data_entry(entry: DataEntryRequest):
+def ingest_data_entry(entry: DataEntryRequest):
     """
     Ingest a new student data entry and generate AI skill assessments
     
@@ -35,17 +39,7 @@ async def ingest_data_entry(entry: DataEntryRequest):
     Returns:
         DataEntryResponse with success status and assessment IDs
     """
-    conn = None
-    cursor = None
-    
     try:
-        # Connect to database
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Begin transaction
-        conn.autocommit = False
-        
         # Insert data entry
         logger.info(f"Ingesting data entry: {entry.data_entry_id}")
         
@@ -55,25 +49,23 @@ async def ingest_data_entry(entry: DataEntryRequest):
         """
         
         try:
-            cursor.execute(insert_entry_sql, (
-                entry.data_entry_id,
-                entry.student_id,
-                entry.teacher_id,
-                entry.type,
-                entry.date,
-                entry.content,
-                json.dumps(entry.metadata)
-            ))
+            with db() as cursor:
+                cursor.execute(insert_entry_sql, (
+                    entry.data_entry_id,
+                    entry.student_id,
+                    entry.teacher_id,
+                    entry.type,
+                    entry.date,
+                    entry.content,
+                    json.dumps(entry.metadata)
+                ))
         except IntegrityError as e:
-            conn.rollback()
             logger.error(f"Duplicate entry ID: {entry.data_entry_id}")
             raise HTTPException(status_code=400, detail=f"Data entry {entry.data_entry_id} already exists")
         
-        # Commit the data entry insertion
-        conn.commit()
         logger.info(f"Data entry saved: {entry.data_entry_id}")
         
-        # Run AI inference
+        # Run AI inference (no pooled connection is held during the API call)
         logger.info("Starting AI inference...")
         
         # Load rubric
@@ -116,33 +108,51 @@ async def ingest_data_entry(entry: DataEntryRequest):
             insert_assessment_sql = """
                 INSERT INTO assessments (
                     data_entry_id, student_id, skill_name, skill_category, 
-                    level, confidence_score, justification, source_quote, 
-                    data_point_count, rubric_version
+                    level, level_numeric, confidence_score, justification, source_quote, 
+                    data_point_count, rubric_version, observed_on
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING id
             """
             
-            for assessment in assessments:
-                cursor.execute(insert_assessment_sql, (
-                    entry.data_entry_id,
-                    entry.student_id,
-                    assessment['skill_name'],
-                    assessment['skill_category'],
-                    assessment['level'],
-                    assessment.get('confidence_score', 0.5),
-                    assessment['justification'],
-                    assessment['source_quote'],
-                    assessment.get('data_point_count', 1),
-                    assessment.get('rubric_version', '1.0')
-                ))
+            with db() as cursor:
+                # Stamp assessments with the latest registered rubric version
+                # (see scripts/rescore_rubric_changes.py)
+                cursor.execute("SELECT version FROM rubric_versions ORDER BY created_at DESC LIMIT 1")
+                version_row = cursor.fetchone()
+                rubric_version = version_row['version'] if version_row else '1.0'
                 
-                result = cursor.fetchone()
-                assessment_ids.append(result['id'])
+                for assessment in assessments:
+                    # Store the canonical level name (the model answers E/D/P/A)
+                    try:
+                        level = normalize_level(assessment.get('level'))
+                    except ValueError:
+                        logger.warning(
+                            f"Skipping {assessment.get('skill_name')} assessment with "
+                            f"unknown level {assessment.get('level')!r}"
+                        )
+                        continue
+                    
+                    cursor.execute(insert_assessment_sql, (
+                        entry.data_entry_id,
+                        entry.student_id,
+                        assessment['skill_name'],
+                        assessment['skill_category'],
+                        level,
+                        level_to_numeric(level),
+                        assessment.get('confidence_score', 0.5),
+                        assessment['justification'],
+                        assessment['source_quote'],
+                        assessment.get('data_point_count', 1),
+                        assessment.get('rubric_version', rubric_version),
+                        entry.date
+                    ))
+                    
+                    result = cursor.fetchone()
+                    assessment_ids.append(result['id'])
             
-            # Commit assessments
-            conn.commit()
             logger.info(f"Saved {len(assessment_ids)} assessments to database")
+            response_cache.invalidate_student(entry.student_id)
         
         # Return success response
         return DataEntryResponse(
@@ -157,16 +167,5 @@ async def ingest_data_entry(entry: DataEntryRequest):
         raise
     
     except Exception as e:
-        # Rollback on any error
-        if conn:
-            conn.rollback()
-        
         logger.error(f"Error during data ingestion: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Data ingestion failed: {str(e)}")
-    
-    finally:
-        # Clean up
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
@@ -0,0 +1,139 @@
+"""
+Export Router
+
+Bulk exports for reporting jobs.
+
+Exports stream: rows are read from a server-side cursor a chunk at a time
+and written to the response as each chunk arrives, so memory use stays flat
+however many rows the district has.
+"""
+
+import csv
+import io
+import logging
+import os
+from datetime import date, datetime, time, timezone
+from typing import AsyncIterator, List, Optional, Union
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from database.repositories import assessments as assessments_repo
+from models.schemas import AssessmentResponse
+from serialization import dumps
+
+# Router setup
+router = APIRouter(prefix="/api/export", tags=["Export"])
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the cursor, and written to the response, per chunk
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    # Starlette adds "; charset=utf-8" to text/* types itself
+    "csv": "text/csv",
+}
+
+ASSESSMENT_EXPORT_FIELDS = list(AssessmentResponse.model_fields)
+
+
+def encode_ndjson(rows: List, header: bool) -> bytes:
+    """One JSON object per line"""
+    return b"".join(dumps(dict(row)) + b"\n" for row in rows)
+
+
+def encode_csv(rows: List, header: bool) -> bytes:
+    """CSV lines, preceded by the column names on the first chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(ASSESSMENT_EXPORT_FIELDS)
+    writer.writerows([row[name] for name in ASSESSMENT_EXPORT_FIELDS] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+EXPORT_ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+}
+
+
+async def encode_chunks(chunks: AsyncIterator[List], first: List, encode) -> AsyncIterator[bytes]:
+    """Encode the already-fetched first chunk, then the rest as they arrive"""
+    exported = len(first)
+    try:
+        yield encode(first, header=True)
+        async for rows in chunks:
+            exported += len(rows)
+            yield encode(rows, header=False)
+    except Exception as e:
+        # The status line is already sent; the client sees a truncated body
+        logger.error(f"Assessment export failed after {exported} rows: {str(e)}", exc_info=True)
+        raise
+    finally:
+        await chunks.aclose()
+
+    logger.info(f"Exported {exported} assessments")
+
+
+@router.get("/assessments")
+async def export_assessments(
+    format: str = Query("ndjson", description="Output format: ndjson or csv"),
+    since: Optional[Union[datetime, date]] = Query(
+        None,
+        description="Only assessments created at or after this ISO 8601 time or date "
+                    "(UTC unless an offset is given; a date means midnight UTC)"
+    )
+):
+    """
+    Stream all assessments as NDJSON or CSV
+
+    Rows are ordered by creation time (oldest first) with the same fields as
+    AssessmentResponse, and all come from one database snapshot. A reporting
+    job can pass the latest created_at it has seen as `since` to fetch only
+    newer assessments (the boundary row is repeated; dedupe on id).
+
+    Args:
+        format: "ndjson" (one JSON object per line) or "csv" (with a header row)
+        since: Optional lower bound on created_at (inclusive); a date
+            alone starts at midnight UTC
+
+    Returns:
+        StreamingResponse with the export as an attachment
+    """
+    if format not in EXPORT_ENCODERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported export format '{format}'; use one of: {', '.join(EXPORT_ENCODERS)}"
+        )
+
+    # created_at is a UTC timestamp without time zone
+    if isinstance(since, date) and not isinstance(since, datetime):
+        since = datetime.combine(since, time.min)
+    elif since is not None and since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    try:
+        chunks = assessments_repo.stream_for_export(since, EXPORT_CHUNK_SIZE)
+
+        # Fetch the first chunk before responding, so connection and query
+        # errors still produce an error status instead of a truncated 200
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = []
+
+        filename = f"assessments-{date.today().isoformat()}.{format}"
+
+        return StreamingResponse(
+            encode_chunks(chunks, first, EXPORT_ENCODERS[format]),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error starting assessment export: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to export assessments: {str(e)}")
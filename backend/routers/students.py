@@ -4,61 +4,54 @@ Students Router
 Handles student data, progress tracking, and skill target management.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from models.schemas import (
     StudentResponse, StudentProgressResponse,
     TargetAssignmentRequest, TargetResponse,
-    ActiveSkillProgressResponse
+    ActiveSkillProgressResponse, StudentProfileResponse
 )
-from database.connection import get_db_connection, return_db_connection
+from database.repositories import students as students_repo
+from routers import assessments, badges
+from cache import cached, response_cache
+from conditional import student_etag
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 
 # Router setup
 router = APIRouter(prefix="/api/students", tags=["Students"])
 logger = logging.getLogger(__name__)
 
+# Sections available from /{student_id}/profile
+PROFILE_SECTIONS = ('trends', 'progress', 'targets', 'badges')
+
+# The roster only changes through data loads, so it can be cached for longer
+STUDENTS_CACHE_TTL = 300
+
 
 @router.get("/", response_model=List[StudentResponse])
+@cached("students", ttl=STUDENTS_CACHE_TTL)
 async def get_students(teacher_id: Optional[str] = Query(None, description="Filter by teacher ID")):
     """
     Get all students, optionally filtered by teacher
-    
+
     Args:
         teacher_id: Optional teacher ID to filter students
-        
+
     Returns:
         List of StudentResponse objects
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if teacher_id:
-            query = """
-                SELECT id, name, grade, teacher_id, created_at::text as created_at
-                FROM students
-                WHERE teacher_id = %s
-                ORDER BY name ASC
-            """
-            cursor.execute(query, (teacher_id,))
-        else:
-            query = """
-                SELECT id, name, grade, teacher_id, created_at::text as created_at
-                FROM students
-                ORDER BY name ASC
-            """
-            cursor.execute(query)
-        
-        results = cursor.fetchall()
-        students = [StudentResponse(**dict(row)) for row in results]
-        
+        results = await students_repo.list_students(teacher_id)
+
+        students = [StudentResponse(**row) for row in results]
+
         logger.info(f"Retrieved {len(students)} students")
         return students
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error retrieving students: {error_msg}", exc_info=True)
@@ -71,166 +64,86 @@ async def get_students(teacher_id: Optional[str] = Query(None, description="Filt
             )
 
         raise HTTPException(status_code=500, detail=f"Failed to retrieve students: {error_msg}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
-@router.get("/{student_id}/progress", response_model=StudentProgressResponse)
+@router.get(
+    "/{student_id}/progress",
+    response_model=StudentProgressResponse,
+    dependencies=[Depends(student_etag)]
+)
+@cached("student_progress")
 async def get_student_progress(student_id: str):
     """
     Get comprehensive progress metrics for a student
-    
+
     Includes total assessments, badges, active targets, and recent growth.
-    
+
     Args:
         student_id: Student ID
-        
+
     Returns:
         StudentProgressResponse with progress metrics
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get student info
-        cursor.execute("SELECT name FROM students WHERE id = %s", (student_id,))
-        student = cursor.fetchone()
-        
-        if not student:
+        progress = await students_repo.get_progress(student_id)
+
+        if progress is None:
             raise HTTPException(status_code=404, detail=f"Student {student_id} not found")
-        
-        student_name = student['name']
-        
-        # Count total assessments
-        cursor.execute("SELECT COUNT(*) as count FROM assessments WHERE student_id = %s", (student_id,))
-        total_assessments = cursor.fetchone()['count']
-        
-        # Count total badges
-        cursor.execute("SELECT COUNT(*) as count FROM badges WHERE student_id = %s", (student_id,))
-        total_badges = cursor.fetchone()['count']
-        
-        # Count active targets
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM skill_targets WHERE student_id = %s AND completed = FALSE",
-            (student_id,)
-        )
-        active_targets = cursor.fetchone()['count']
-        
-        # Get recent growth (last 5 skill level changes)
-        growth_query = """
-            WITH ranked_assessments AS (
-                SELECT 
-                    skill_name, level, 
-                    de.date,
-                    LAG(level) OVER (PARTITION BY skill_name ORDER BY de.date) as prev_level
-                FROM assessments a
-                JOIN data_entries de ON a.data_entry_id = de.id
-                WHERE a.student_id = %s
-            )
-            SELECT skill_name, prev_level as from_level, level as to_level, date
-            FROM ranked_assessments
-            WHERE prev_level IS NOT NULL AND prev_level != level
-            ORDER BY date DESC
-            LIMIT 5
-        """
-        
-        cursor.execute(growth_query, (student_id,))
-        growth_results = cursor.fetchall()
-        recent_growth = [dict(row) for row in growth_results]
-        
+
         return StudentProgressResponse(
             student_id=student_id,
-            student_name=student_name,
-            total_assessments=total_assessments,
-            total_badges=total_badges,
-            active_targets=active_targets,
-            recent_growth=recent_growth
+            student_name=progress['student_name'],
+            total_assessments=progress['total_assessments'],
+            total_badges=progress['total_badges'],
+            active_targets=progress['active_targets'],
+            recent_growth=progress['recent_growth']
         )
-        
+
     except HTTPException:
         raise
-    
+
     except Exception as e:
         logger.error(f"Error retrieving student progress: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve student progress: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
 @router.post("/{student_id}/target-skill", response_model=TargetResponse)
 async def assign_target_skill(student_id: str, target: TargetAssignmentRequest):
     """
     Assign a skill growth target to a student
-    
+
     Sets a goal for the student to grow from a starting level to a target level.
-    
+
     Args:
         student_id: Student ID
         target: TargetAssignmentRequest with skill and level details
-        
+
     Returns:
         TargetResponse with the created target
     """
-    conn = None
-    cursor = None
-    
     try:
         # Validate student_id matches
         if student_id != target.student_id:
             raise HTTPException(status_code=400, detail="Student ID mismatch")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        conn.autocommit = False
-        
-        # Check if active target already exists for this skill
-        cursor.execute(
-            """
-            SELECT id FROM skill_targets 
-            WHERE student_id = %s AND skill_name = %s AND completed = FALSE
-            """,
-            (student_id, target.skill_name)
+
+        result = await students_repo.create_target(
+            student_id=target.student_id,
+            skill_name=target.skill_name,
+            starting_level=target.starting_level,
+            target_level=target.target_level,
+            assigned_by=target.assigned_by
         )
-        
-        if cursor.fetchone():
+
+        if result is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Active target already exists for skill '{target.skill_name}'"
             )
-        
-        # Insert new target
-        insert_sql = """
-            INSERT INTO skill_targets (
-                student_id, skill_name, starting_level, target_level, assigned_by
-            )
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id, assigned_at::text as assigned_at
-        """
-        
-        cursor.execute(insert_sql, (
-            target.student_id,
-            target.skill_name,
-            target.starting_level,
-            target.target_level,
-            target.assigned_by
-        ))
-        
-        result = cursor.fetchone()
-        conn.commit()
-        
+
+        response_cache.invalidate_student(student_id)
+
         logger.info(f"Target assigned: {target.skill_name} for student {student_id}")
-        
+
         return TargetResponse(
             id=result['id'],
             student_id=target.student_id,
@@ -242,119 +155,75 @@ async def assign_target_skill(student_id: str, target: TargetAssignmentRequest):
             completed=False,
             completed_at=None
         )
-        
+
     except HTTPException:
-        if conn:
-            conn.rollback()
         raise
-    
+
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error assigning target: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to assign target: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
-@router.get("/{student_id}/targets", response_model=List[TargetResponse])
+@router.get(
+    "/{student_id}/targets",
+    response_model=List[TargetResponse],
+    dependencies=[Depends(student_etag)]
+)
+@cached("student_targets")
 async def get_student_targets(
     student_id: str,
     completed: Optional[bool] = Query(None, description="Filter by completion status")
 ):
     """
     Get all skill targets for a student
-    
+
     Args:
         student_id: Student ID
         completed: Optional filter for completed/active targets
-        
+
     Returns:
         List of TargetResponse objects
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        base_query = """
-            SELECT 
-                id, student_id, skill_name, starting_level, target_level,
-                assigned_by, assigned_at::text as assigned_at, completed,
-                completed_at::text as completed_at
-            FROM skill_targets
-            WHERE student_id = %s
-        """
-        
-        if completed is not None:
-            base_query += f" AND completed = {completed}"
-        
-        base_query += " ORDER BY assigned_at DESC"
-        
-        cursor.execute(base_query, (student_id,))
-        results = cursor.fetchall()
-        
-        targets = [TargetResponse(**dict(row)) for row in results]
-        
+        results = await students_repo.list_targets(student_id, completed)
+
+        targets = [TargetResponse(**row) for row in results]
+
         logger.info(f"Retrieved {len(targets)} targets for student {student_id}")
         return targets
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error retrieving targets: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve targets: {str(e)}")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
 
 @router.put("/targets/{target_id}/complete")
 async def complete_target(target_id: int):
     """
     Mark a skill target as completed
-    
+
     Args:
         target_id: Target ID to complete
-        
+
     Returns:
         Success message
     """
-    conn = None
-    cursor = None
-    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            UPDATE skill_targets 
-            SET completed = TRUE, completed_at = NOW()
-            WHERE id = %s
-            RETURNING id
-            """,
-            (target_id,)
-        )
-        
-        result = cursor.fetchone()
-        
-        if not result:
+        student_id = await students_repo.complete_target(target_id)
+
+        if student_id is None:
             raise HTTPException(status_code=404, detail=f"Target {target_id} not found")
-        
-        conn.commit()
-        
+
+        response_cache.invalidate_student(student_id)
+
         logger.info(f"Target {target_id} marked as completed")
 
         return {
             "success": True,
+            "student_id": student_id,
             "message": f"Target {target_id} completed successfully"
         }
 
@@ -362,19 +231,16 @@ async def complete_target(target_id: int):
         raise
 
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error completing target: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to complete target: {str(e)}")
 
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
 
-
-@router.get("/{student_id}/active-skills-progress", response_model=List[ActiveSkillProgressResponse])
+@router.get(
+    "/{student_id}/active-skills-progress",
+    response_model=List[ActiveSkillProgressResponse],
+    dependencies=[Depends(student_etag)]
+)
+@cached("active_skills_progress")
 async def get_active_skills_progress(student_id: str):
     """
     Get current proficiency levels for all active targeted skills
@@ -388,90 +254,117 @@ async def get_active_skills_progress(student_id: str):
     Returns:
         List of ActiveSkillProgressResponse objects with current and target levels
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Get active targets with current proficiency levels
-        query = """
-            WITH recent_assessments AS (
-                SELECT
-                    a.skill_name,
-                    a.skill_category,
-                    a.level,
-                    de.date,
-                    ROW_NUMBER() OVER (PARTITION BY a.skill_name ORDER BY de.date DESC) as rn
-                FROM assessments a
-                JOIN data_entries de ON a.data_entry_id = de.id
-                WHERE a.student_id = %s
-            ),
-            avg_levels AS (
-                SELECT
-                    skill_name,
-                    skill_category,
-                    CASE
-                        WHEN level = 'E' THEN 'Emerging'
-                        WHEN level = 'D' THEN 'Developing'
-                        WHEN level = 'P' THEN 'Proficient'
-                        WHEN level = 'A' THEN 'Advanced'
-                        ELSE level
-                    END as current_level,
-                    CASE
-                        WHEN level IN ('Emerging', 'E') THEN 1
-                        WHEN level IN ('Developing', 'D') THEN 2
-                        WHEN level IN ('Proficient', 'P') THEN 3
-                        WHEN level IN ('Advanced', 'A') THEN 4
-                        ELSE 0
-                    END as current_level_numeric
-                FROM recent_assessments
-                WHERE rn = 1
-            )
-            SELECT
-                st.skill_name,
-                COALESCE(al.skill_category, 'Unknown') as skill_category,
-                st.target_level,
-                COALESCE(al.current_level, st.starting_level) as current_level,
-                COALESCE(al.current_level_numeric,
-                    CASE
-                        WHEN st.starting_level = 'Emerging' THEN 1
-                        WHEN st.starting_level = 'Developing' THEN 2
-                        WHEN st.starting_level = 'Proficient' THEN 3
-                        WHEN st.starting_level = 'Advanced' THEN 4
-                        ELSE 0
-                    END
-                ) as current_level_numeric,
-                CASE
-                    WHEN st.target_level = 'Emerging' THEN 1
-                    WHEN st.target_level = 'Developing' THEN 2
-                    WHEN st.target_level = 'Proficient' THEN 3
-                    WHEN st.target_level = 'Advanced' THEN 4
-                    ELSE 0
-                END as target_level_numeric
-            FROM skill_targets st
-            LEFT JOIN avg_levels al ON st.skill_name = al.skill_name
-            WHERE st.student_id = %s AND st.completed = FALSE
-            ORDER BY st.skill_name ASC
-        """
-
-        cursor.execute(query, (student_id, student_id))
-        results = cursor.fetchall()
+        results = await students_repo.list_active_skill_progress(student_id)
 
         progress = [
-            ActiveSkillProgressResponse(**dict(row)) for row in results
+            ActiveSkillProgressResponse(**row) for row in results
         ]
 
         logger.info(f"Retrieved progress for {len(progress)} active skills for student {student_id}")
         return progress
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error retrieving active skills progress: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve active skills progress: {str(e)}")
 
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            return_db_connection(conn)
+
+def _select_fields(section: Any, fields: List[str]) -> Any:
+    """
+    Keep only the named keys of a profile section (or of each item in a list section)
+    """
+    if isinstance(section, list):
+        return [_select_fields(item, fields) for item in section]
+    return {key: value for key, value in section.items() if key in fields}
+
+
+@router.get(
+    "/{student_id}/profile",
+    response_model=StudentProfileResponse,
+    response_model_exclude_none=True,
+    dependencies=[Depends(student_etag)]
+)
+async def get_student_profile(
+    student_id: str,
+    include: str = Query(
+        ",".join(PROFILE_SECTIONS),
+        description="Comma-separated sections: trends, progress, targets, badges"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated section.field names to return, e.g. targets.skill_name,progress.total_badges"
+    )
+):
+    """
+    Get several views of a student in one response
+
+    Student pages need trends, progress, active targets and badges; this
+    builds the requested sections concurrently, each exactly as its own
+    endpoint would return it, so a page costs one round trip.
+
+    Args:
+        student_id: Student ID
+        include: Sections to build (default: all)
+        fields: Optional field selection; sections without a selector are returned whole
+
+    Returns:
+        StudentProfileResponse with the requested sections
+    """
+    sections = [name.strip() for name in include.split(",") if name.strip()]
+    unknown = [name for name in sections if name not in PROFILE_SECTIONS]
+    if unknown or not sections:
+        raise HTTPException(
+            status_code=400,
+            detail=f"include must list sections from: {', '.join(PROFILE_SECTIONS)}"
+        )
+
+    field_selection: Dict[str, List[str]] = {}
+    for selector in (fields or "").split(","):
+        if not selector.strip():
+            continue
+        section, _, field = selector.strip().partition(".")
+        if section not in sections or not field:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid field selector '{selector.strip()}': use section.field for an included section"
+            )
+        field_selection.setdefault(section, []).append(field)
+
+    try:
+        builders = {
+            'trends': lambda: assessments.get_skill_trends(student_id),
+            'progress': lambda: get_student_progress(student_id),
+            'targets': lambda: get_student_targets(student_id, completed=False),
+            'badges': lambda: badges.get_student_badges(student_id)
+        }
+
+        exists, *results = await asyncio.gather(
+            students_repo.student_exists(student_id),
+            *(builders[name]() for name in sections)
+        )
+
+        if not exists:
+            raise HTTPException(status_code=404, detail=f"Student {student_id} not found")
+
+        profile: Dict[str, Any] = {}
+        for name, result in zip(sections, results):
+            section = (
+                [item.model_dump() for item in result] if isinstance(result, list)
+                else result.model_dump()
+            )
+            if name in field_selection:
+                section = _select_fields(section, field_selection[name])
+            profile[name] = section
+
+        logger.info(f"Retrieved profile ({', '.join(sections)}) for student {student_id}")
+        return StudentProfileResponse(student_id=student_id, **profile)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error retrieving student profile: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve student profile: {str(e)}")
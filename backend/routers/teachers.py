@@ -0,0 +1,106 @@
+"""
+Teachers Router
+
+Handles class-level views for teachers.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from models.schemas import TeacherDashboardResponse, DashboardStudentResponse, TeacherSummaryResponse
+from database.repositories import teachers as teachers_repo
+from cache import cached, student_tag, teacher_tag
+from conditional import teacher_etag
+import logging
+
+# Router setup
+router = APIRouter(prefix="/api/teachers", tags=["Teachers"])
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/{teacher_id}/dashboard",
+    response_model=TeacherDashboardResponse,
+    dependencies=[Depends(teacher_etag)]
+)
+# Dropped whenever any student in the class is written to, or the class
+# gains or loses a student
+@cached(
+    "teacher_dashboard",
+    tags=lambda args, result: [teacher_tag(args['teacher_id'])] + [student_tag(s.id) for s in result.students]
+)
+async def get_teacher_dashboard(teacher_id: str):
+    """
+    Get a teacher's whole class in one response
+
+    Replaces per-student progress and target requests on the dashboard pages:
+    every student comes back with progress metrics, active targets,
+    pending-review counts and recent growth, plus class totals.
+
+    Args:
+        teacher_id: Teacher ID (e.g., "T001")
+
+    Returns:
+        TeacherDashboardResponse with one entry per student, ordered by name
+    """
+    try:
+        dashboard = await teachers_repo.get_dashboard(teacher_id)
+
+        if dashboard is None:
+            raise HTTPException(status_code=404, detail=f"Teacher {teacher_id} not found")
+
+        students = [DashboardStudentResponse(**row) for row in dashboard['students']]
+
+        logger.info(f"Retrieved dashboard for teacher {teacher_id} ({len(students)} students)")
+
+        return TeacherDashboardResponse(
+            teacher_id=teacher_id,
+            teacher_name=dashboard['teacher_name'],
+            total_students=len(students),
+            total_assessments=sum(s.total_assessments for s in students),
+            pending_reviews=sum(s.pending_reviews for s in students),
+            students_with_active_targets=sum(1 for s in students if s.active_targets > 0),
+            students=students
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error retrieving teacher dashboard: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve teacher dashboard: {str(e)}")
+
+
+@router.get("/{teacher_id}/summary", response_model=TeacherSummaryResponse)
+async def get_teacher_summary(teacher_id: str):
+    """
+    Get a teacher's headline counts
+
+    For pages that only display numbers: pending reviews (in total, by student
+    and by skill), corrections made today, and active and due targets, all
+    counted in the database instead of by fetching the rows.
+
+    Args:
+        teacher_id: Teacher ID (e.g., "T001")
+
+    Returns:
+        TeacherSummaryResponse
+    """
+    try:
+        summary = await teachers_repo.get_summary(teacher_id)
+
+        if summary is None:
+            raise HTTPException(status_code=404, detail=f"Teacher {teacher_id} not found")
+
+        logger.info(f"Retrieved summary for teacher {teacher_id}")
+
+        return TeacherSummaryResponse(
+            teacher_id=teacher_id,
+            pending_reviews=sum(summary['pending_by_student'].values()),
+            **summary
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.error(f"Error retrieving teacher summary: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve teacher summary: {str(e)}")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Confidence Scoring Micro-Benchmark - Flourish Skills Tracker
+
+Compares the per-assessment scorer (calculate_confidence_score) with the
+batch scorer (calculate_confidence_scores) on synthetic historical data,
+and verifies that both produce identical scores.
+
+Usage:
+    python scripts/benchmark_confidence_scoring.py [--entries N] [--per-entry N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add backend root to path so the ai package is importable from scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.confidence_scoring import (
+    RUBRIC_KEYWORDS,
+    calculate_confidence_score,
+    calculate_confidence_scores
+)
+
+FILLER_WORDS = (
+    "student group discussion project peers shared idea notes teacher asked "
+    "listened explained planned organized reflected presented questions team"
+).split()
+
+
+def build_dataset(entry_count: int, per_entry: int, seed: int = 42):
+    """Build parallel lists of data entries and assessments resembling ingested history"""
+    rng = random.Random(seed)
+    data_entries = []
+    assessments = []
+
+    for _ in range(entry_count):
+        entry = {'content': ' '.join(rng.choices(FILLER_WORDS, k=rng.randint(40, 400)))}
+        for _ in range(per_entry):
+            phrases = rng.sample(RUBRIC_KEYWORDS, k=rng.randint(0, 5))
+            justification_words = rng.choices(FILLER_WORDS, k=rng.randint(10, 60)) + phrases
+            rng.shuffle(justification_words)
+            assessments.append({
+                'source_quote': ' '.join(rng.choices(FILLER_WORDS, k=rng.randint(3, 30))),
+                'justification': ' '.join(justification_words).capitalize(),
+                'data_point_count': rng.randint(1, 5)
+            })
+            data_entries.append(entry)
+
+    return data_entries, assessments
+
+
+def time_call(func, repeat: int) -> float:
+    """Return the best wall-clock time of func() over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark single vs batch confidence scoring")
+    parser.add_argument('--entries', type=int, default=5000, help='Number of data entries (default: 5000)')
+    parser.add_argument('--per-entry', type=int, default=6, help='Assessments per entry (default: 6)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repetitions, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    data_entries, assessments = build_dataset(args.entries, args.per_entry)
+    print(f"Scoring {len(assessments)} assessments over {args.entries} entries")
+
+    single = [calculate_confidence_score(e, a) for e, a in zip(data_entries, assessments)]
+    batch = calculate_confidence_scores(data_entries, assessments)
+    mismatches = sum(1 for s, b in zip(single, batch) if s != b)
+    if mismatches:
+        print(f"❌ {mismatches} scores differ between single and batch scorers")
+        sys.exit(1)
+    print("✅ Batch scores identical to single scorer")
+
+    single_time = time_call(
+        lambda: [calculate_confidence_score(e, a) for e, a in zip(data_entries, assessments)],
+        args.repeat
+    )
+    batch_time = time_call(lambda: calculate_confidence_scores(data_entries, assessments), args.repeat)
+
+    print(f"Single scorer: {single_time * 1000:8.1f} ms ({len(assessments) / single_time:,.0f} assessments/s)")
+    print(f"Batch scorer:  {batch_time * 1000:8.1f} ms ({len(assessments) / batch_time:,.0f} assessments/s)")
+    print(f"Speedup:       {single_time / batch_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
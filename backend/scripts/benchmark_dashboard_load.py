@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Dashboard Load Benchmark - Flourish Skills Tracker
+
+Replays the API calls made by the teacher dashboard (Home.py and
+01_Student_Overview.py) from many concurrent simulated teachers against a
+running backend, and reports dashboard throughput and request latency.
+
+To compare two backends (e.g. before/after a change), save the first run
+and pass it as the baseline for the second:
+
+    python scripts/benchmark_dashboard_load.py --backend-url http://localhost:8000 --save before.json
+    python scripts/benchmark_dashboard_load.py --backend-url http://localhost:8001 --baseline before.json
+
+Usage:
+    python scripts/benchmark_dashboard_load.py [--backend-url URL] [--teacher-id ID]
+        [--concurrency N] [--duration SECONDS] [--save FILE] [--baseline FILE]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+
+
+def percentile(values, fraction: float) -> float:
+    """Return the given percentile (0-1) of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def timed_get(client: httpx.AsyncClient, path: str, latencies: list, errors: list, **params):
+    """GET a path, recording latency and any non-200 response"""
+    start = time.perf_counter()
+    response = await client.get(path, params=params or None)
+    latencies.append(time.perf_counter() - start)
+    if response.status_code != 200:
+        errors.append(f"{response.status_code} {path}")
+        return None
+    return response.json()
+
+
+async def load_dashboard(client: httpx.AsyncClient, teacher_id: str, latencies: list, errors: list):
+    """Issue the requests of one teacher dashboard load"""
+    students, _pending, _corrections = await asyncio.gather(
+        timed_get(client, "/api/students/", latencies, errors, teacher_id=teacher_id),
+        timed_get(client, "/api/assessments/pending", latencies, errors, limit=100),
+        timed_get(client, "/api/corrections/recent", latencies, errors, limit=10)
+    )
+
+    # The dashboard pages fetch per-student data one student at a time
+    for student in students or []:
+        await timed_get(client, f"/api/students/{student['id']}/targets", latencies, errors, completed="false")
+        await timed_get(client, f"/api/students/{student['id']}/progress", latencies, errors)
+        await timed_get(client, f"/api/assessments/skill-trends/{student['id']}", latencies, errors)
+
+
+async def run_benchmark(backend_url: str, teacher_id: str, concurrency: int, duration: float) -> dict:
+    """Run concurrent simulated teachers for a fixed duration"""
+    latencies = []
+    errors = []
+    dashboards = 0
+    deadline = time.perf_counter() + duration
+
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2)
+    async with httpx.AsyncClient(base_url=backend_url, timeout=60, limits=limits) as client:
+        # Warm up connections and caches before timing
+        await load_dashboard(client, teacher_id, [], [])
+
+        async def teacher():
+            nonlocal dashboards
+            while time.perf_counter() < deadline:
+                await load_dashboard(client, teacher_id, latencies, errors)
+                dashboards += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(teacher() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        'backend_url': backend_url,
+        'concurrency': concurrency,
+        'elapsed_s': round(elapsed, 2),
+        'dashboards': dashboards,
+        'dashboards_per_s': round(dashboards / elapsed, 2),
+        'requests': len(latencies),
+        'requests_per_s': round(len(latencies) / elapsed, 1),
+        'latency_ms_p50': round(percentile(latencies, 0.50) * 1000, 1),
+        'latency_ms_p95': round(percentile(latencies, 0.95) * 1000, 1),
+        'latency_ms_max': round(max(latencies, default=0.0) * 1000, 1),
+        'errors': len(errors)
+    }
+
+
+def print_results(results: dict, baseline: dict = None):
+    """Print results, with the change relative to a baseline run if given"""
+    rows = [
+        ('Dashboards/s', 'dashboards_per_s', True),
+        ('Requests/s', 'requests_per_s', True),
+        ('Latency p50 (ms)', 'latency_ms_p50', False),
+        ('Latency p95 (ms)', 'latency_ms_p95', False),
+        ('Latency max (ms)', 'latency_ms_max', False),
+        ('Errors', 'errors', False),
+    ]
+
+    print(f"\n{results['dashboards']} dashboard loads, {results['requests']} requests "
+          f"in {results['elapsed_s']}s at concurrency {results['concurrency']}")
+
+    for label, key, higher_is_better in rows:
+        line = f"  {label:<18} {results[key]:>10}"
+        if baseline and baseline.get(key):
+            ratio = results[key] / baseline[key]
+            better = ratio >= 1 if higher_is_better else ratio <= 1
+            line += f"   baseline {baseline[key]:>10}   {ratio:5.2f}x {'✅' if better else '⚠️'}"
+        print(line)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent teacher dashboard loads")
+    parser.add_argument('--backend-url', default='http://localhost:8000', help='Backend URL (default: http://localhost:8000)')
+    parser.add_argument('--teacher-id', default='T001', help='Teacher whose dashboard is loaded (default: T001)')
+    parser.add_argument('--concurrency', type=int, default=20, help='Simulated concurrent teachers (default: 20)')
+    parser.add_argument('--duration', type=float, default=20, help='Seconds to run (default: 20)')
+    parser.add_argument('--save', help='Write results as JSON to this file')
+    parser.add_argument('--baseline', help='Compare against results saved by a previous run')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"Loading dashboards for {args.teacher_id} from {args.backend_url} "
+          f"({args.concurrency} concurrent teachers, {args.duration:.0f}s)...")
+
+    try:
+        results = asyncio.run(run_benchmark(args.backend_url, args.teacher_id, args.concurrency, args.duration))
+    except httpx.HTTPError as e:
+        print(f"❌ Backend request failed: {e}")
+        sys.exit(1)
+
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+
+    sys.exit(1 if results['errors'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Response Serialization Benchmark - Flourish Skills Tracker
+
+Measures how long it takes to turn a large assessment listing into response
+bytes, and how big those bytes are, with and without the fast path:
+
+    legacy      One AssessmentResponse per row, response_model validation,
+                stdlib json (how the list endpoints used to respond)
+    fast        rows_response() rendered with orjson
+    fast+gzip   fast, compressed by CompressionMiddleware for a gzip client
+    fast+br     fast, compressed by CompressionMiddleware for a Brotli client
+
+Rows are synthetic but shaped exactly like the assessments repository's
+output, so no database is needed. Each variant is requested in-process
+through the ASGI stack (FastAPI routing, serialization, middleware), which
+isolates the serialization cost from network and query time.
+
+Usage:
+    python scripts/benchmark_response_serialization.py [--rows N] [--iterations N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from compression import CompressionMiddleware
+from models.schemas import AssessmentResponse
+from serialization import FastJSONResponse, rows_response
+
+SKILLS = [
+    ('Communication', 'SEL'),
+    ('Organization', 'EF'),
+    ('Planning', 'EF'),
+    ('Self-Awareness', 'SEL'),
+    ('Collaboration', 'SEL'),
+]
+LEVELS = ['Emerging', 'Developing', 'Proficient', 'Advanced']
+
+
+def percentile(values, fraction: float) -> float:
+    """Return the given percentile (0-1) of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def make_rows(count: int) -> List[dict]:
+    """Synthetic assessment rows in the repository's shape (NUMERIC as Decimal)"""
+    rng = random.Random(42)
+    start = datetime(2025, 9, 1, 8, 0, 0)
+    rows = []
+
+    for i in range(count):
+        skill_name, skill_category = SKILLS[i % len(SKILLS)]
+        confidence = Decimal(f"{rng.uniform(0.4, 0.99):.2f}")
+        rows.append({
+            'id': i + 1,
+            'data_entry_id': f"DE{i // 3:06d}",
+            'student_id': 'S001',
+            'skill_name': skill_name,
+            'skill_category': skill_category,
+            'level': rng.choice(LEVELS),
+            'confidence_score': confidence,
+            'justification': (
+                f"The student showed {skill_name.lower()} when working with peers on the "
+                f"group project, explaining their reasoning and responding to feedback."
+            ),
+            'source_quote': "I think we should split the tasks so everyone has a part they can finish.",
+            'data_point_count': rng.randint(1, 6),
+            'rubric_version': '1.0',
+            'corrected': False,
+            'created_at': str(start + timedelta(minutes=17 * i)),
+            # Sort key the pending query also returns; not part of the schema
+            'review_confidence': confidence,
+        })
+
+    return rows
+
+
+def build_apps(rows: List[dict]):
+    """The legacy and fast list endpoints over the same rows"""
+    legacy = FastAPI()
+
+    @legacy.get("/assessments", response_model=List[AssessmentResponse])
+    async def legacy_assessments():
+        return [AssessmentResponse(**row) for row in rows]
+
+    fast = FastAPI(default_response_class=FastJSONResponse)
+    fast.add_middleware(CompressionMiddleware)
+
+    @fast.get("/assessments", response_model=List[AssessmentResponse])
+    async def fast_assessments():
+        return rows_response(AssessmentResponse, rows)
+
+    return legacy, fast
+
+
+def measure(client: TestClient, accept_encoding: str, iterations: int) -> dict:
+    """Request the listing repeatedly, recording latency and wire size"""
+    headers = {"Accept-Encoding": accept_encoding}
+
+    # Warm up
+    response = client.get("/assessments", headers=headers)
+    response.raise_for_status()
+    parsed = response.json()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.get("/assessments", headers=headers)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        'payload_bytes': int(response.headers["content-length"]),
+        'encoding': response.headers.get("content-encoding", "identity"),
+        'latency_ms_p50': round(percentile(latencies, 0.50) * 1000, 1),
+        'latency_ms_p95': round(percentile(latencies, 0.95) * 1000, 1),
+        'rows': len(parsed),
+        'body': parsed,
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark assessment list serialization and compression")
+    parser.add_argument('--rows', type=int, default=10000, help='Assessments per response (default: 10000)')
+    parser.add_argument('--iterations', type=int, default=30, help='Timed requests per variant (default: 30)')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    legacy_app, fast_app = build_apps(rows)
+
+    print(f"Serializing {args.rows} assessments, {args.iterations} requests per variant...")
+
+    with TestClient(legacy_app) as legacy_client, TestClient(fast_app) as fast_client:
+        results = {
+            'legacy': measure(legacy_client, "identity", args.iterations),
+            'fast': measure(fast_client, "identity", args.iterations),
+            'fast+gzip': measure(fast_client, "gzip", args.iterations),
+            'fast+br': measure(fast_client, "br", args.iterations),
+        }
+
+    baseline = results['legacy']
+
+    # The fast path must produce the same document as the legacy one
+    mismatched = [name for name, result in results.items() if result['body'] != baseline['body']]
+
+    print(f"\n  {'Variant':<10} {'Encoding':<9} {'Payload (KB)':>12} {'p50 (ms)':>9} {'p95 (ms)':>9}   vs legacy")
+    for name, result in results.items():
+        size_ratio = result['payload_bytes'] / baseline['payload_bytes']
+        speedup = baseline['latency_ms_p95'] / result['latency_ms_p95'] if result['latency_ms_p95'] else 0.0
+        print(f"  {name:<10} {result['encoding']:<9} {result['payload_bytes'] / 1024:>12.1f} "
+              f"{result['latency_ms_p50']:>9} {result['latency_ms_p95']:>9}   "
+              f"{size_ratio:5.1%} size, {speedup:4.1f}x p95")
+
+    if mismatched:
+        print(f"\n❌ Response bodies differ from legacy: {', '.join(mismatched)}")
+        sys.exit(1)
+
+    print("\n✅ All variants return the same assessments")
+
+
+if __name__ == "__main__":
+    main()
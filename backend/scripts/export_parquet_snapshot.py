@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Parquet Snapshot Job - Flourish Skills Tracker
+
+Exports assessments, data entry metadata, skill targets and badges to
+partitioned Parquet files (by month and teacher) for analysts, who then read
+them with analytics.read_table() instead of querying the production
+database.
+
+Each run appends only the rows changed since the previous run, so it is
+cheap to schedule nightly (off-peak). Point DATABASE_URL at a read replica,
+if there is one, to keep the export itself off the primary.
+
+Usage:
+    python scripts/export_parquet_snapshot.py [--output DIR] [--tables assessments badges ...] [--full]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add backend root to path so backend packages are importable from scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import SNAPSHOT_DIR, SNAPSHOT_TABLES, run_snapshot, snapshot_info
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Export analytics snapshots as partitioned Parquet")
+    parser.add_argument(
+        '--output',
+        default=str(SNAPSHOT_DIR),
+        help=f'Snapshot directory (default: {SNAPSHOT_DIR}, or ANALYTICS_SNAPSHOT_DIR)'
+    )
+    parser.add_argument(
+        '--tables',
+        nargs='+',
+        choices=list(SNAPSHOT_TABLES),
+        help='Tables to export (default: all)'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Discard the existing snapshot of each table and export every row again'
+    )
+    args = parser.parse_args()
+
+    start = time.time()
+    try:
+        written = run_snapshot(args.output, tables=args.tables, full=args.full)
+    except Exception as e:
+        logger.error(f"❌ Snapshot failed: {e}", exc_info=True)
+        sys.exit(1)
+
+    info = snapshot_info(args.output)
+    print(f"\nSnapshot written to {args.output} in {time.time() - start:.1f}s")
+    for table, rows in written.items():
+        print(f"  {table:<14} {rows:>8} rows   watermark {info[table]['watermark']}")
+
+
+if __name__ == "__main__":
+    main()
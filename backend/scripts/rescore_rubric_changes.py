@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Rubric Re-Scoring Pipeline - Flourish Skills Tracker
+
+Re-assesses historical data entries after the rubric (Docs/Rubric.md) changes.
+
+The pipeline:
+1. Registers the current rubric under a new version with a hash per skill section
+2. Diffs those hashes against the previous version to find the affected skills
+3. Streams entries assessed on affected skills through a server-side cursor
+4. Re-runs inference (in parallel) only for entries whose prompt inputs changed
+5. Replaces each entry's unreviewed assessments with the new version set in bulk
+
+Teacher-reviewed (corrected or approved) assessments are kept as they are.
+Progress is recorded per batch in inference_fingerprints, so an interrupted
+run can simply be started again with the same version.
+
+Usage:
+    python scripts/rescore_rubric_changes.py --version 1.0 --register-only
+    python scripts/rescore_rubric_changes.py --version 1.1 [--workers 4] [--batch-size 20] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Iterator
+
+from psycopg2.extras import Json, execute_values
+
+# Add backend root to path so backend packages are importable from scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai import SkillInferenceEngine, FewShotManager, load_rubric, hash_rubric_sections, diff_rubric_sections
+from ai.prompts import build_user_prompt
+from ai.rubric_loader import RUBRIC_GLOBAL_SECTION
+from database.connection import get_db_connection, return_db_connection
+from models.levels import normalize_level, level_to_numeric
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 20
+CURSOR_ITERSIZE = 200
+
+
+def register_rubric_version(cursor, version: str, section_hashes: Dict[str, str]):
+    """
+    Register the rubric section hashes under a version (idempotent)
+
+    Raises:
+        ValueError: If the version is already registered with different content
+    """
+    cursor.execute(
+        """
+        INSERT INTO rubric_versions (version, section_hashes)
+        VALUES (%s, %s)
+        ON CONFLICT (version) DO NOTHING
+        """,
+        (version, Json(section_hashes))
+    )
+    cursor.execute("SELECT section_hashes FROM rubric_versions WHERE version = %s", (version,))
+    registered = cursor.fetchone()['section_hashes']
+
+    if registered != section_hashes:
+        raise ValueError(
+            f"Rubric version {version} is already registered with different content - "
+            f"choose a new version string"
+        )
+
+
+def get_previous_version(cursor, version: str) -> Optional[Dict]:
+    """Get the rubric version registered immediately before the given version"""
+    cursor.execute(
+        """
+        SELECT version, section_hashes
+        FROM rubric_versions
+        WHERE created_at < (SELECT created_at FROM rubric_versions WHERE version = %s)
+        ORDER BY created_at DESC
+        LIMIT 1
+        """,
+        (version,)
+    )
+    return cursor.fetchone()
+
+
+def get_all_version_hashes(cursor) -> Dict[str, Dict[str, str]]:
+    """Get section hashes for every registered rubric version"""
+    cursor.execute("SELECT version, section_hashes FROM rubric_versions")
+    return {row['version']: row['section_hashes'] for row in cursor.fetchall()}
+
+
+def build_student_data(entry: Dict) -> Dict:
+    """Build the inference input for an entry exactly as the ingestion endpoint does"""
+    metadata = entry['metadata'] or {}
+    return {
+        "content": entry['content'],
+        "metadata": {
+            "type": entry['type'],
+            "date": entry['date'],
+            "context": metadata.get("context", "N/A")
+        }
+    }
+
+
+def compute_prompt_fingerprint(student_data: Dict, skills: List[str], section_hashes: Dict[str, str]) -> str:
+    """
+    Hash the prompt inputs that determine an entry's assessments
+
+    Covers the user prompt plus the rubric sections that apply to the entry
+    (the global section and the section of every skill assessed on it).
+    """
+    digest = hashlib.sha256(build_user_prompt(student_data).encode('utf-8'))
+    for section in [RUBRIC_GLOBAL_SECTION] + sorted(skills):
+        digest.update(f"\n{section}={section_hashes.get(section, '')}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def stream_candidate_entries(conn, affected_skills: Set[str], version: str) -> Iterator[Dict]:
+    """
+    Stream entries with at least one assessment on an affected skill
+
+    Uses a named (server-side) cursor so memory stays flat regardless of
+    history size. Entries already fingerprinted for this version are skipped.
+    """
+    cursor = conn.cursor(name="rescore_candidate_entries")
+    cursor.itersize = CURSOR_ITERSIZE
+
+    try:
+        cursor.execute(
+            """
+            SELECT
+                de.id, de.student_id, de.type, de.date::text as date,
+                de.content, de.metadata,
+                array_agg(DISTINCT a.skill_name) as skills,
+                (array_agg(a.rubric_version ORDER BY a.created_at DESC))[1] as rubric_version,
+                f.prompt_hash
+            FROM data_entries de
+            JOIN assessments a ON a.data_entry_id = de.id
+            LEFT JOIN inference_fingerprints f ON f.data_entry_id = de.id
+            WHERE f.rubric_version IS DISTINCT FROM %s
+              AND EXISTS (
+                  SELECT 1 FROM assessments x
+                  WHERE x.data_entry_id = de.id AND x.skill_name = ANY(%s)
+              )
+            GROUP BY de.id, f.prompt_hash
+            ORDER BY de.id
+            """,
+            (version, sorted(affected_skills))
+        )
+        for row in cursor:
+            yield row
+    finally:
+        cursor.close()
+
+
+def write_batch(conn, results: List[Dict], version: str):
+    """
+    Replace unreviewed assessments for a batch of entries in one transaction
+
+    Skills that already carry a teacher-reviewed assessment on the same entry
+    are not re-inserted, so validated work is never duplicated or overwritten.
+    """
+    cursor = conn.cursor()
+    entry_ids = [result['entry']['id'] for result in results]
+
+    try:
+        cursor.execute(
+            "DELETE FROM assessments WHERE data_entry_id = ANY(%s) AND corrected = FALSE",
+            (entry_ids,)
+        )
+
+        cursor.execute(
+            "SELECT data_entry_id, skill_name FROM assessments WHERE data_entry_id = ANY(%s)",
+            (entry_ids,)
+        )
+        reviewed = {(row['data_entry_id'], row['skill_name']) for row in cursor.fetchall()}
+
+        assessment_rows = []
+        for result in results:
+            for assessment in result['assessments']:
+                if (result['entry']['id'], assessment['skill_name']) in reviewed:
+                    continue
+                try:
+                    level = normalize_level(assessment.get('level'))
+                except ValueError:
+                    logger.warning(
+                        f"Skipping {assessment.get('skill_name')} on {result['entry']['id']}: "
+                        f"unknown level {assessment.get('level')!r}"
+                    )
+                    continue
+                assessment_rows.append((
+                    result['entry']['id'],
+                    result['entry']['student_id'],
+                    assessment['skill_name'],
+                    assessment['skill_category'],
+                    level,
+                    level_to_numeric(level),
+                    assessment.get('confidence_score', 0.5),
+                    assessment['justification'],
+                    assessment['source_quote'],
+                    assessment.get('data_point_count', 1),
+                    version,
+                    result['entry']['date']
+                ))
+
+        if assessment_rows:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO assessments (
+                    data_entry_id, student_id, skill_name, skill_category,
+                    level, level_numeric, confidence_score, justification, source_quote,
+                    data_point_count, rubric_version, observed_on
+                )
+                VALUES %s
+                """,
+                assessment_rows
+            )
+
+        execute_values(
+            cursor,
+            """
+            INSERT INTO inference_fingerprints (data_entry_id, rubric_version, prompt_hash)
+            VALUES %s
+            ON CONFLICT (data_entry_id) DO UPDATE
+            SET rubric_version = EXCLUDED.rubric_version,
+                prompt_hash = EXCLUDED.prompt_hash,
+                updated_at = NOW()
+            """,
+            [(result['entry']['id'], version, result['fingerprint']) for result in results]
+        )
+
+        conn.commit()
+        return len(assessment_rows)
+
+    except Exception:
+        conn.rollback()
+        raise
+
+    finally:
+        cursor.close()
+
+
+def assess_entry(engine: SkillInferenceEngine, candidate: Dict) -> Dict:
+    """Run inference for one candidate entry (executed on a worker thread)"""
+    try:
+        assessments = engine.assess_skills(candidate['student_data'])
+        if not assessments:
+            return {**candidate, 'success': False, 'error': 'no assessments returned'}
+        return {**candidate, 'success': True, 'assessments': assessments}
+    except Exception as e:
+        return {**candidate, 'success': False, 'error': str(e)}
+
+
+def process_batch(executor, engine, write_conn, batch: List[Dict], version: str, stats: Dict):
+    """Re-assess a batch of candidates in parallel and persist the successful ones"""
+    results = list(executor.map(lambda candidate: assess_entry(engine, candidate), batch))
+
+    succeeded = [result for result in results if result['success']]
+    for result in results:
+        if not result['success']:
+            stats['failed'] += 1
+            logger.warning(f"  ✗ {result['entry']['id']}: {result['error']} (will retry on next run)")
+
+    if succeeded:
+        stats['assessments_written'] += write_batch(write_conn, succeeded, version)
+        stats['reassessed'] += len(succeeded)
+
+    logger.info(
+        f"Batch done: {stats['reassessed']} re-assessed, {stats['skipped']} unchanged, "
+        f"{stats['failed']} failed"
+    )
+
+
+def rescore(version: str, workers: int, batch_size: int, dry_run: bool = False) -> Dict:
+    """
+    Run the re-scoring pipeline for the current rubric under the given version
+
+    Returns:
+        Summary dictionary with counts and elapsed time
+    """
+    start_time = time.time()
+    stats = {'candidates': 0, 'skipped': 0, 'reassessed': 0, 'failed': 0, 'assessments_written': 0}
+
+    rubric = load_rubric()
+    new_hashes = hash_rubric_sections(rubric)
+
+    read_conn = get_db_connection()
+    write_conn = get_db_connection()
+
+    try:
+        cursor = write_conn.cursor()
+        register_rubric_version(cursor, version, new_hashes)
+        previous = get_previous_version(cursor, version)
+        version_hashes = get_all_version_hashes(cursor)
+        cursor.close()
+
+        if dry_run:
+            write_conn.rollback()
+        else:
+            write_conn.commit()
+
+        if previous is None:
+            logger.error(
+                f"No rubric version registered before {version}. Register the rubric the existing "
+                f"assessments were produced with first (--register-only)."
+            )
+            return {'success': False, 'error': 'no_previous_version', **stats}
+
+        affected_skills = diff_rubric_sections(previous['section_hashes'], new_hashes)
+        logger.info(f"Rubric {previous['version']} → {version}: {len(affected_skills)} affected skills")
+        for skill in sorted(affected_skills):
+            logger.info(f"  - {skill}")
+
+        if not affected_skills:
+            return {'success': True, **stats, 'elapsed_time': time.time() - start_time}
+
+        engine = None
+        if not dry_run:
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
+                logger.error("OPENAI_API_KEY not found in environment")
+                return {'success': False, 'error': 'missing_api_key', **stats}
+
+            few_shot_examples = FewShotManager().get_recent_corrections(limit=5)
+            engine = SkillInferenceEngine(api_key=api_key, rubric=rubric, few_shot_examples=few_shot_examples)
+
+        batch = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for entry in stream_candidate_entries(read_conn, affected_skills, version):
+                stats['candidates'] += 1
+                student_data = build_student_data(entry)
+                new_fingerprint = compute_prompt_fingerprint(student_data, entry['skills'], new_hashes)
+
+                stored_fingerprint = entry['prompt_hash']
+                if stored_fingerprint is None and entry['rubric_version'] in version_hashes:
+                    stored_fingerprint = compute_prompt_fingerprint(
+                        student_data, entry['skills'], version_hashes[entry['rubric_version']]
+                    )
+
+                if stored_fingerprint == new_fingerprint:
+                    stats['skipped'] += 1
+                    continue
+
+                if dry_run:
+                    logger.info(f"  would re-assess {entry['id']} ({', '.join(entry['skills'])})")
+                    continue
+
+                batch.append({'entry': entry, 'student_data': student_data, 'fingerprint': new_fingerprint})
+                if len(batch) >= batch_size:
+                    process_batch(executor, engine, write_conn, batch, version, stats)
+                    batch = []
+
+            if batch:
+                process_batch(executor, engine, write_conn, batch, version, stats)
+
+    finally:
+        read_conn.rollback()
+        return_db_connection(read_conn)
+        return_db_connection(write_conn)
+
+    elapsed_time = time.time() - start_time
+
+    logger.info("\n" + "=" * 60)
+    logger.info("RE-SCORING SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"Candidate entries: {stats['candidates']}")
+    logger.info(f"⏭️  Unchanged prompt inputs: {stats['skipped']}")
+    logger.info(f"✅ Re-assessed: {stats['reassessed']}")
+    logger.info(f"❌ Failed: {stats['failed']}")
+    logger.info(f"📊 Assessments written: {stats['assessments_written']}")
+    logger.info(f"⏱️  Time elapsed: {elapsed_time:.1f}s")
+    logger.info("=" * 60)
+
+    return {'success': stats['failed'] == 0, **stats, 'elapsed_time': elapsed_time}
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Re-assess historical entries affected by a rubric change")
+    parser.add_argument(
+        '--version',
+        required=True,
+        help='Version string for the current Docs/Rubric.md (max 10 characters, e.g. 1.1)'
+    )
+    parser.add_argument(
+        '--register-only',
+        action='store_true',
+        help='Only register the current rubric under --version (use once for the baseline rubric)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Parallel inference workers (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'Entries written per transaction (default: {DEFAULT_BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show affected skills and entries without running inference or writing'
+    )
+
+    args = parser.parse_args()
+
+    if len(args.version) > 10:
+        parser.error("--version must be at most 10 characters")
+
+    if args.register_only:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            register_rubric_version(cursor, args.version, hash_rubric_sections(load_rubric()))
+            conn.commit()
+            cursor.close()
+            logger.info(f"✅ Registered current rubric as version {args.version}")
+        finally:
+            return_db_connection(conn)
+        sys.exit(0)
+
+    summary = rescore(args.version, args.workers, args.batch_size, args.dry_run)
+
+    # Exit with appropriate code
+    if summary.get('success', False):
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
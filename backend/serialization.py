@@ -0,0 +1,90 @@
+"""
+Response Serialization
+
+Fast JSON rendering for the API.
+
+Every response is rendered with orjson: FastJSONResponse is the app's
+default_response_class, so routes that return Pydantic models only swap the
+final json.dumps for a native encoder.
+
+List endpoints that return many assessment rows can also skip response-model
+validation. Repository rows already carry the column types their schema
+declares, so building one Pydantic model per row, validating it again
+against the route's response_model and then dumping it through
+jsonable_encoder costs far more than the query on long histories.
+rows_response() projects each row onto the schema's fields and hands the
+list straight to orjson; the route keeps its response_model so the OpenAPI
+docs are unchanged. Use it only for rows read from the database, never for
+request input.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode types orjson does not handle natively (NUMERIC columns)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode a value as compact JSON with orjson
+
+    Accepts everything JSONResponse does, plus Decimal values, which are
+    written as numbers the way the Pydantic float fields would.
+    """
+    return orjson.dumps(content, default=_encode_default)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (see dumps)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def project_rows(model: Type[BaseModel], rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reduce database rows to the fields of a response schema
+
+    Extra columns (e.g. the pending queue's sort key) are dropped, as the
+    response model would drop them.
+    """
+    fields = tuple(model.model_fields)
+    return [{name: row[name] for name in fields} for row in rows]
+
+
+def rows_response(
+    model: Type[BaseModel],
+    rows: Iterable[Mapping[str, Any]],
+    response: Optional[Response] = None
+) -> FastJSONResponse:
+    """
+    Serialize trusted database rows as a JSON list of the given schema
+
+    Args:
+        model: Response schema the rows conform to
+        rows: Rows from a repository
+        response: The route's injected Response, whose headers (ETag,
+            X-Next-Cursor) are carried over; FastAPI drops them when a
+            route returns a Response of its own
+
+    Returns:
+        FastJSONResponse with the projected rows
+    """
+    fast_response = FastJSONResponse(project_rows(model, rows))
+
+    if response is not None:
+        for key, value in response.headers.items():
+            if key != "content-length":
+                fast_response.headers[key] = value
+
+    return fast_response
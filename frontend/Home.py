@@ -75,45 +75,22 @@ st.markdown("---")
 st.markdown("### 📊 Quick Overview")
 
 try:
-    # Fetch data
-    students = APIClient.get_students(teacher_id=teacher_id)
-    pending_assessments = APIClient.get_pending_assessments(limit=100)
-
-    # Calculate stats
-    total_students = len(students)
-    pending_count = len(pending_assessments)
-
-    # Count students with active targets
-    students_with_targets = 0
-    for student in students:
-        try:
-            targets = APIClient.get_student_targets(student["id"], completed=False)
-            if targets:
-                students_with_targets += 1
-        except:
-            pass
+    summary = APIClient.get_teacher_summary(teacher_id)
 
     # Display metrics
     metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
 
     with metric_col1:
-        st.metric("Your Students", total_students)
+        st.metric("Your Students", summary["total_students"])
 
     with metric_col2:
-        st.metric("Pending Reviews", pending_count)
+        st.metric("Pending Reviews", summary["pending_reviews"])
 
     with metric_col3:
-        st.metric("Active Targets", students_with_targets)
+        st.metric("Active Targets", summary["students_with_active_targets"])
 
     with metric_col4:
-        # Recent corrections
-        try:
-            corrections = APIClient.get_recent_corrections(limit=10)
-            recent_corrections = len([c for c in corrections if c.get("corrected_by") == teacher_id])
-        except:
-            recent_corrections = 0
-
-        st.metric("Your Corrections", recent_corrections)
+        st.metric("Corrections Today", summary["corrections_today"])
 
 except Exception as e:
     st.warning("⚠️ Could not load statistics. Make sure the backend is running.")
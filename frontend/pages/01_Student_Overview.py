@@ -69,7 +69,9 @@ st.markdown("---")
 # Fetch students
 try:
     with st.spinner("Loading students..."):
-        students = APIClient.get_students(teacher_id=st.session_state.teacher_id)
+        # One request returns every student with their progress metrics
+        dashboard = APIClient.get_teacher_dashboard(st.session_state.teacher_id)
+        students = dashboard["students"]
 
     if not students:
         st.warning(f"No students found for {st.session_state.teacher_name}")
@@ -83,19 +85,8 @@ try:
         st.metric("Total Students", len(students))
 
     # Calculate statistics
-    students_with_targets = 0
-    total_assessments = 0
-
-    for student in students:
-        try:
-            progress = APIClient.get_student_progress(student["id"])
-            total_assessments += progress.get("total_assessments", 0)
-            if progress.get("active_targets", 0) > 0:
-                students_with_targets += 1
-        except:
-            pass
-
-    avg_assessments = total_assessments / len(students) if students else 0
+    students_with_targets = dashboard["students_with_active_targets"]
+    avg_assessments = dashboard["total_assessments"] / len(students) if students else 0
 
     with stat_col2:
         st.metric("Avg Assessments", f"{avg_assessments:.1f}")
@@ -104,8 +95,7 @@ try:
         st.metric("Students with Active Targets", students_with_targets)
 
     with stat_col4:
-        pending_assessments = len(APIClient.get_pending_assessments(limit=100))
-        st.metric("Pending Reviews", pending_assessments)
+        st.metric("Pending Reviews", dashboard["pending_reviews"])
 
     st.markdown("---")
 
@@ -175,9 +165,9 @@ try:
                         </div>
                         """, unsafe_allow_html=True)
 
-                        # Fetch student progress
+                        # Progress metrics came with the dashboard
                         try:
-                            progress = APIClient.get_student_progress(student["id"])
+                            progress = student
 
                             # Display metrics
                             metric_col1, metric_col2 = st.columns(2)
@@ -18,6 +18,7 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from utils.api_client import APIClient
+from utils.fetch_utils import fetch_all
 from utils.session_utils import initialize_session_state, get_selected_student
 from utils.badge_utils import get_level_numeric, get_progress_color, render_badge_html
 from utils.icon_utils import render_icon, get_page_icon
@@ -95,8 +96,10 @@ st.markdown("---")
 # Fetch active skills progress
 try:
     with st.spinner(f"Loading active skills progress for {student_name}..."):
-        active_skills = APIClient.get_active_skills_progress(selected_student)
-        progress = APIClient.get_student_progress(selected_student)
+        active_skills, progress = fetch_all(
+            lambda: APIClient.get_active_skills_progress(selected_student),
+            lambda: APIClient.get_student_progress(selected_student)
+        )
 
     if not active_skills:
         st.warning(f"No active skill targets found for {student_name}")
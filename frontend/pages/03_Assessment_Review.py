@@ -16,8 +16,13 @@ if parent_dir not in sys.path:
 from utils.api_client import APIClient
 from utils.session_utils import (
     initialize_session_state, get_teacher,
-    increment_review_stat, advance_review_index, go_to_previous_review,
-    get_review_progress, reset_review_state
+    increment_review_stat, go_to_previous_review,
+    get_review_progress
+)
+from utils.review_queue import (
+    start_review_queue, prefetch_next_page, collect_prefetched_page,
+    has_more_reviews, advance_review, end_review_queue,
+    queue_review_decision, flush_review_decisions, pending_decision_count
 )
 from utils.badge_utils import get_badge_color, get_level_emoji
 from utils.icon_utils import render_icon, get_page_icon
@@ -50,6 +55,7 @@ st.markdown("---")
 st.sidebar.markdown("### 🔍 Filters")
 
 # Fetch students for filter
+teacher_id = None
 try:
     teacher_id, _ = get_teacher()
     students = APIClient.get_students(teacher_id=teacher_id)
@@ -98,28 +104,23 @@ confidence_threshold = st.sidebar.slider(
 if st.sidebar.button("🔍 Apply Filters", use_container_width=True):
     with st.spinner("Loading assessments..."):
         try:
-            # Fetch pending assessments
-            limit = 100
-            min_conf = confidence_threshold if not low_confidence_only else 0.0
-
-            assessments = APIClient.get_pending_assessments(
-                limit=limit,
-                min_confidence=min_conf
-            )
-
-            # Apply client-side filters
-            if filter_student != "All":
-                assessments = [a for a in assessments if a["student_id"] == filter_student]
+            # Save decisions from the previous queue so the new one excludes them
+            flush_review_decisions()
+
+            # Filters are applied by the backend; assessments are claimed a batch
+            # at a time so teachers reviewing concurrently get different ones
+            min_conf = confidence_threshold if not low_confidence_only else None
+            reviewer, _ = get_teacher()
+
+            total_pending = start_review_queue(reviewer, {
+                "min_confidence": min_conf,
+                # Scores have two decimals, so <= 0.69 means below 0.7
+                "max_confidence": 0.69 if low_confidence_only else None,
+                "student_id": filter_student if filter_student != "All" else None,
+                "skill_name": filter_skill if filter_skill != "All" else None,
+                "teacher_id": teacher_id if filter_student == "All" else None
+            })
 
-            if filter_skill != "All":
-                assessments = [a for a in assessments if a["skill_name"] == filter_skill]
-
-            if low_confidence_only:
-                assessments = [a for a in assessments if a["confidence_score"] < 0.7]
-
-            # Store in session state
-            st.session_state.assessments_to_review = assessments
-            st.session_state.review_index = 0
             st.session_state.filters_applied = True
 
             # Reset stats
@@ -127,18 +128,24 @@ if st.sidebar.button("🔍 Apply Filters", use_container_width=True):
             st.session_state.reviews_corrected = 0
             st.session_state.reviews_skipped = 0
 
-            st.success(f"Found {len(assessments)} assessments to review")
+            st.success(f"Found {total_pending} assessments to review")
             st.rerun()
 
         except Exception as e:
             st.error(f"Error loading assessments: {str(e)}")
 
 if st.sidebar.button("🔄 Reset Filters"):
-    reset_review_state()
+    # Always resets; decisions that fail to save stay queued for the next save
+    end_review_queue()
     st.rerun()
 
 st.markdown("---")
 
+# Outcome of the last save (e.g. decisions dropped for deleted assessments)
+if st.session_state.review_notice:
+    st.warning(st.session_state.review_notice)
+    st.session_state.review_notice = None
+
 # Main review area
 if not st.session_state.filters_applied or not st.session_state.assessments_to_review:
     st.info("👈 Apply filters in the sidebar to load assessments for review")
@@ -157,9 +164,15 @@ if not st.session_state.filters_applied or not st.session_state.assessments_to_r
     """)
     st.stop()
 
+# Pick up the next page if it arrived since the last run, and start fetching
+# it in the background when the teacher gets close to the end of this one
+collect_prefetched_page()
+prefetch_next_page()
+
 # Get current assessment
 progress = get_review_progress()
 assessments = st.session_state.assessments_to_review
+queue_size = max(st.session_state.review_total or 0, len(assessments))
 
 if progress["current_index"] >= len(assessments):
     # Completed review
@@ -175,7 +188,7 @@ if progress["current_index"] >= len(assessments):
     """)
 
     if st.button("Review More Assessments"):
-        reset_review_state()
+        end_review_queue()
         st.rerun()
 
     st.stop()
@@ -183,12 +196,12 @@ if progress["current_index"] >= len(assessments):
 current_assessment = assessments[progress["current_index"]]
 
 # Progress indicator
-st.markdown(f"### Assessment {progress['current_index'] + 1} of {len(assessments)}")
+st.markdown(f"### Assessment {progress['current_index'] + 1} of {queue_size}")
 
 prog_col1, prog_col2 = st.columns([3, 1])
 
 with prog_col1:
-    progress_pct = ((progress["current_index"] + 1) / len(assessments)) * 100
+    progress_pct = ((progress["current_index"] + 1) / queue_size) * 100
     st.progress(progress_pct / 100)
 
 with prog_col2:
@@ -266,6 +279,17 @@ with col_right:
     st.metric("✏️ Corrected", progress['corrected'])
     st.metric("⏭️ Skipped", progress['skipped'])
 
+    # Approvals and corrections are saved in batches
+    unsaved = pending_decision_count()
+    if unsaved:
+        st.caption(f"{unsaved} decision(s) waiting to be saved")
+        if st.button("💾 Save Now", key="save_decisions_btn"):
+            try:
+                flush_review_decisions()
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error saving review decisions: {str(e)}")
+
 st.markdown("---")
 
 # AI Justification
@@ -330,13 +354,12 @@ with action_tabs[0]:
     if st.button("✅ Approve Assessment", key="approve_btn", use_container_width=True):
         try:
             teacher_id, _ = get_teacher()
-            APIClient.approve_assessment(
-                assessment_id=current_assessment['id'],
-                approved_by=teacher_id
-            )
 
             increment_review_stat("approved")
-            advance_review_index()
+            queue_review_decision("approval", {
+                "assessment_id": current_assessment['id'],
+                "approved_by": teacher_id
+            })
 
             st.success("✅ Assessment approved!")
             st.rerun()
@@ -397,10 +420,8 @@ with action_tabs[1]:
                     "corrected_by": teacher_id
                 }
 
-                APIClient.submit_correction(correction_data)
-
                 increment_review_stat("corrected")
-                advance_review_index()
+                queue_review_decision("correction", correction_data)
 
                 st.success("✏️ Correction submitted!")
                 st.rerun()
@@ -418,7 +439,7 @@ with action_tabs[2]:
 
     if st.button("⏭️ Skip to Next", key="skip_btn", use_container_width=True):
         increment_review_stat("skipped")
-        advance_review_index()
+        advance_review()
         st.rerun()
 
 st.markdown("---")
@@ -432,8 +453,8 @@ with nav_col1:
         st.rerun()
 
 with nav_col3:
-    if st.button("Next →", disabled=(progress["current_index"] >= len(assessments) - 1)):
-        advance_review_index()
+    if st.button("Next →", disabled=not has_more_reviews()):
+        advance_review()
         st.rerun()
 
 # Footer
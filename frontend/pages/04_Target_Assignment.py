@@ -14,6 +14,7 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from utils.api_client import APIClient
+from utils.fetch_utils import fetch_all
 from utils.session_utils import initialize_session_state, get_teacher
 from utils.badge_utils import format_level_transition, get_badge_color, get_level_emoji
 from utils.icon_utils import render_icon, get_page_icon
@@ -88,9 +89,11 @@ for skills in ALL_SKILLS_BY_CATEGORY.values():
 # Fetch current targets and assessments
 try:
     with st.spinner("Loading student data..."):
-        active_targets = APIClient.get_student_targets(selected_student, completed=False)
-        completed_targets = APIClient.get_student_targets(selected_student, completed=True)
-        skill_trends = APIClient.get_skill_trends(selected_student)
+        active_targets, completed_targets, skill_trends = fetch_all(
+            lambda: APIClient.get_student_targets(selected_student, completed=False),
+            lambda: APIClient.get_student_targets(selected_student, completed=True),
+            lambda: APIClient.get_skill_trends(selected_student)
+        )
 
 except Exception as e:
     st.error(f"Error loading data: {str(e)}")
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent))
 from utils.api_client import APIClient
+from utils.static_assets import AVATARS, avatar_url
 
 # Page config
 st.set_page_config(
@@ -21,6 +22,27 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def load_avatar_catalog() -> list:
+    """
+    Avatar choices with thumbnail URLs, built once per process.
+
+    Thumbnails are served as static files with long-lived cache headers, so
+    the browser downloads each one once instead of receiving every avatar as
+    base64 on every rerun. A missing image gets an empty URL.
+    """
+    catalog = []
+    for name, file in AVATARS:
+        try:
+            url = avatar_url(file)
+        except FileNotFoundError:
+            logger.error(f"Avatar image not found: {file}")
+            url = ""
+        catalog.append({"name": name, "file": file, "url": url})
+    return catalog
+
+
 # Custom CSS for hand-drawn theme with earth tones
 st.markdown("""
 <style>
@@ -213,47 +235,11 @@ try:
             st.markdown("---")
             st.markdown(f"### 🎨 Awesome, {student['name']}! Pick your avatar:")
 
-            # Avatar options with local images
-            import base64
-            from pathlib import Path
-
-            def get_image_base64(img_path):
-                """Convert image to base64 for embedding"""
-                with open(img_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode()
-
-            assets_path = Path(__file__).parent.parent / "assets" / "avatars"
-
-            avatar_styles = [
-                {
-                    "name": "Boy",
-                    "file": "avatar1.png",
-                    "path": assets_path / "avatar1.png"
-                },
-                {
-                    "name": "Girl",
-                    "file": "avatar2.png",
-                    "path": assets_path / "avatar2.png"
-                },
-                {
-                    "name": "Robot",
-                    "file": "avatar3.png",
-                    "path": assets_path / "avatar3.png"
-                },
-                {
-                    "name": "Axolotl",
-                    "file": "avatar4.png",
-                    "path": assets_path / "avatar4.png"
-                }
-            ]
-
-            # Convert images to base64 for embedding
+            # Avatar thumbnails are built once per process and served as static files
+            avatar_styles = load_avatar_catalog()
             for avatar in avatar_styles:
-                if avatar['path'].exists():
-                    avatar['url'] = f"data:image/png;base64,{get_image_base64(avatar['path'])}"
-                else:
-                    st.error(f"Avatar image not found: {avatar['path']}")
-                    avatar['url'] = ""
+                if not avatar['url']:
+                    st.error(f"Avatar image not found: {avatar['file']}")
 
             # Display clickable avatars
             avatar_urls = [avatar['url'] for avatar in avatar_styles]
@@ -7,6 +7,7 @@ from pathlib import Path
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.api_client import APIClient
+from utils.static_assets import road_map_background_url
 
 # Page config
 st.set_page_config(
@@ -16,6 +17,30 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def load_road_map_shell() -> str:
+    """
+    Road to Skills map HTML with skill tips, visual config and background filled in.
+
+    None of these depend on the student, so the shell is built once per process
+    and shared by every session. The background is served as a cacheable static
+    file rather than inlined, so the browser downloads it once.
+    """
+    frontend_dir = Path(__file__).parent.parent
+
+    with open(frontend_dir / 'data' / 'skill_tips.json', 'r') as f:
+        skill_tips_data = json.load(f)
+    with open(frontend_dir / 'data' / 'skill_visuals.json', 'r') as f:
+        visual_config_data = json.load(f)
+    with open(frontend_dir / 'components' / 'road_to_skills_enhanced.html', 'r') as f:
+        component_html = f.read()
+
+    component_html = component_html.replace('%SKILL_TIPS_DATA%', json.dumps(skill_tips_data))
+    component_html = component_html.replace('%VISUAL_CONFIG_DATA%', json.dumps(visual_config_data))
+    return component_html.replace('%BACKGROUND_IMAGE%', road_map_background_url())
+
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -269,9 +294,12 @@ st.markdown("---")
 # Fetch student data
 try:
     with st.spinner("Loading your amazing progress..."):
-        skill_trends = APIClient.get_skill_trends(student_id)
-        progress_data = APIClient.get_student_progress(student_id)
-        active_targets = APIClient.get_student_targets(student_id, completed=False)
+        profile = APIClient.get_student_profile(
+            student_id, include=["trends", "progress", "targets"]
+        )
+        skill_trends = profile["trends"]
+        progress_data = profile["progress"]
+        active_targets = profile["targets"]
 
     if not skill_trends:
         st.info("Your journey is just beginning! Ask your teacher to add some activities.")
@@ -279,32 +307,8 @@ try:
 
     # Conditional rendering based on view mode
     if st.session_state.journey_view_mode == 'road':
-        # Load Road to Skills interactive map (enhanced version with background)
-        component_path = Path(__file__).parent.parent / 'components' / 'road_to_skills_enhanced.html'
-        skill_tips_path = Path(__file__).parent.parent / 'data' / 'skill_tips.json'
-        visual_config_path = Path(__file__).parent.parent / 'data' / 'skill_visuals.json'
-        background_img_path = Path(__file__).parent.parent / 'assets' / 'backgrounds' / 'road_map_background.png'
-
-        # Load JSON data
-        with open(skill_tips_path, 'r') as f:
-            skill_tips_data = json.load(f)
-        with open(visual_config_path, 'r') as f:
-            visual_config_data = json.load(f)
-
-        # Convert background image to base64
-        import base64
-        with open(background_img_path, 'rb') as f:
-            background_base64 = base64.b64encode(f.read()).decode()
-        background_data_url = f"data:image/png;base64,{background_base64}"
-
-        # Load HTML template
-        with open(component_path, 'r') as f:
-            component_html = f.read()
-
-        # Replace placeholders with actual data
-        component_html = component_html.replace('%SKILL_TIPS_DATA%', json.dumps(skill_tips_data))
-        component_html = component_html.replace('%VISUAL_CONFIG_DATA%', json.dumps(visual_config_data))
-        component_html = component_html.replace('%BACKGROUND_IMAGE%', background_data_url)
+        # Static shell is built once per process; only the student's data changes per render
+        component_html = load_road_map_shell()
 
         # Prepare data for component
         current_goal = active_targets[0] if active_targets else {}
@@ -315,17 +319,13 @@ try:
         <script>
             window.STUDENT_DATA = {json.dumps(skill_trends)};
             window.CURRENT_GOAL = {json.dumps(current_goal)};
-            window.AVATAR_URL = '{avatar_url}';
+            window.AVATAR_URL = {json.dumps(avatar_url)};
         </script>
         """
 
         # Insert data injection before closing body tag
         component_html = component_html.replace('</body>', f'{data_injection}</body>')
 
-        # Add cache-busting meta tag
-        cache_buster = f'<meta http-equiv="Cache-Control" content="no-cache, no-store, must-revalidate" /><meta http-equiv="Pragma" content="no-cache" /><meta http-equiv="Expires" content="0" />'
-        component_html = component_html.replace('<head>', f'<head>{cache_buster}')
-
         # Render component with increased height for scrolling
         components.html(component_html, height=1200, scrolling=True)
 
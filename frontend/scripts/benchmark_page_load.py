@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Page Load Benchmark - Flourish Skills Tracker Frontend
+
+Times the backend calls made by one load of the teacher dashboard (Home.py)
+through the frontend APIClient, the way Streamlit runs them: one after the
+other, in a single script run.
+
+Each load is timed twice: with the APIClient's shared keep-alive session,
+and with the previous behaviour of a new connection per call (bare
+requests.get/post). The read cache and ETag cache are cleared before every
+load so both modes download full responses. Differences are largest against
+a remote HTTPS backend such as Render, where every new connection also pays
+for a TLS handshake.
+
+Usage:
+    python scripts/benchmark_page_load.py [--backend-url URL] [--teacher-id ID] [--loads N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(values, fraction: float) -> float:
+    """Return the given percentile (0-1) of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def load_teacher_dashboard(api_client, teacher_id: str):
+    """Make the calls of one Home.py run"""
+    api_client.APIClient.get_students(teacher_id=teacher_id)
+    api_client.APIClient.get_teacher_dashboard(teacher_id)
+    api_client.APIClient.get_recent_corrections(limit=10)
+
+
+def time_loads(api_client, transport, teacher_id: str, loads: int) -> list:
+    """Time page loads with the given transport (a Session or the requests module)"""
+    api_client._session = transport
+    timings = []
+
+    # Warm up the backend and, for the session, its connection pool
+    load_teacher_dashboard(api_client, teacher_id)
+
+    for _ in range(loads):
+        api_client.st.cache_data.clear()
+        api_client._etag_cache.clear()
+        start = time.perf_counter()
+        load_teacher_dashboard(api_client, teacher_id)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def summarize(timings: list) -> dict:
+    """Page load statistics in milliseconds"""
+    return {
+        'mean': round(sum(timings) / len(timings) * 1000, 1),
+        'p50': round(percentile(timings, 0.50) * 1000, 1),
+        'p95': round(percentile(timings, 0.95) * 1000, 1),
+        'max': round(max(timings) * 1000, 1)
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark teacher dashboard page loads through the APIClient")
+    parser.add_argument('--backend-url', default=os.getenv("BACKEND_URL", "http://localhost:8000"),
+                        help='Backend URL (default: $BACKEND_URL or http://localhost:8000)')
+    parser.add_argument('--teacher-id', default='T001', help='Teacher whose dashboard is loaded (default: T001)')
+    parser.add_argument('--loads', type=int, default=50, help='Page loads per mode (default: 50)')
+    args = parser.parse_args()
+
+    # The client reads BACKEND_URL at import time
+    os.environ["BACKEND_URL"] = args.backend_url
+    from utils import api_client
+
+    print(f"Loading the dashboard for {args.teacher_id} from {args.backend_url} "
+          f"({args.loads} loads per mode)...")
+
+    session = api_client._session
+    try:
+        before = summarize(time_loads(api_client, requests, args.teacher_id, args.loads))
+        after = summarize(time_loads(api_client, session, args.teacher_id, args.loads))
+    except Exception as e:
+        print(f"❌ Backend request failed: {e}")
+        sys.exit(1)
+    finally:
+        api_client._session = session
+
+    print(f"\n  {'Page load (ms)':<16} {'per-request':>12} {'session':>10} {'speedup':>9}")
+    for key in ('mean', 'p50', 'p95', 'max'):
+        ratio = before[key] / after[key] if after[key] else 0.0
+        print(f"  {key:<16} {before[key]:>12} {after[key]:>10} {ratio:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
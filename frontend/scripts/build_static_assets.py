@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Static Asset Build - Flourish Skills Tracker Frontend
+
+Pre-builds the web-optimized images that pages serve from static/ (see
+utils/static_assets.py), so the first page view after a deploy does not
+pay for image conversion. Pages build anything missing on first use, so
+running this is optional outside the Docker build.
+
+Usage:
+    python scripts/build_static_assets.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.static_assets import AVATARS, STATIC_DIR, avatar_url, road_map_background_url
+
+
+def main():
+    """Main entry point"""
+    urls = [road_map_background_url()] + [avatar_url(file) for _, file in AVATARS]
+
+    for url in urls:
+        print(f"✓ {url}")
+
+    total = sum(path.stat().st_size for path in STATIC_DIR.rglob('*') if path.is_file())
+    print(f"\nBuilt {len(urls)} assets in {STATIC_DIR} ({total / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
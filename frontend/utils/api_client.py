@@ -8,17 +8,197 @@ Handles all HTTP requests to the backend REST API.
 import requests
 import os
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import functools
+import inspect
+import streamlit as st
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple
 
 # Configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://backend:8000")
 # Increased timeout for Render free tier cold starts (can take 60+ seconds)
 BACKEND_TIMEOUT = int(os.getenv("BACKEND_TIMEOUT", "90"))
+BACKEND_CONNECT_TIMEOUT = float(os.getenv("BACKEND_CONNECT_TIMEOUT", "5"))
+# Keep-alive connections held per backend host (one per concurrent page run)
+BACKEND_POOL_SIZE = int(os.getenv("BACKEND_POOL_SIZE", "20"))
+BACKEND_RETRIES = int(os.getenv("BACKEND_RETRIES", "4"))
+BACKEND_RETRY_BACKOFF = float(os.getenv("BACKEND_RETRY_BACKOFF", "1.0"))
+
+# (connect, read) timeout for every call. Connects fail fast and are retried
+# with backoff while the backend is unreachable. The read keeps the full cold
+# start budget: a sleeping Render service accepts the connection at once and
+# holds the request while the container boots, so that wait is read time.
+REQUEST_TIMEOUT = (BACKEND_CONNECT_TIMEOUT, BACKEND_TIMEOUT)
 
 logger = logging.getLogger(__name__)
 logger.info(f"API Client initialized - URL: {BACKEND_URL}, Timeout: {BACKEND_TIMEOUT}s")
 
 
+def _create_session() -> requests.Session:
+    """
+    Create the shared HTTP session used for every backend call.
+
+    Connections are kept alive and reused across calls and Streamlit script
+    runs instead of opening a new TCP/TLS connection per request. Refused
+    connections and 502/503/504 responses are retried with exponential
+    backoff, honouring Retry-After. Status retries are limited to idempotent
+    methods, so POSTs are never replayed. Read timeouts are not retried: each
+    request already waits the full BACKEND_TIMEOUT for a cold start.
+    """
+    retry = Retry(
+        total=BACKEND_RETRIES,
+        connect=BACKEND_RETRIES,
+        read=0,
+        status=BACKEND_RETRIES,
+        backoff_factor=BACKEND_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "PUT"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=BACKEND_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+_session = _create_session()
+
+# Responses kept for revalidation with If-None-Match, keyed by full URL
+ETAG_CACHE_MAX_ENTRIES = int(os.getenv("ETAG_CACHE_MAX_ENTRIES", "512"))
+_etag_cache: "OrderedDict[str, Tuple[str, bytes, Dict[str, str]]]" = OrderedDict()
+_etag_lock = threading.Lock()
+
+
+def _conditional_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Tuple[float, float] = REQUEST_TIMEOUT
+) -> requests.Response:
+    """
+    GET that revalidates a previously seen response instead of re-downloading it.
+
+    Student-scoped endpoints return an ETag; when one is held for the URL it is
+    sent as If-None-Match. A 304 is turned back into a 200 carrying the stored
+    body and headers, so callers handle the response exactly as before.
+
+    Args:
+        url: Endpoint URL
+        params: Optional query parameters
+        timeout: (connect, read) timeout
+
+    Returns:
+        The response, with a cached body if the server answered 304
+    """
+    key = requests.Request("GET", url, params=params).prepare().url
+
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+        if cached is not None:
+            _etag_cache.move_to_end(key)
+
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    response = _session.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached is not None:
+        response.status_code = 200
+        response._content = cached[1]
+        response.headers.update(cached[2])
+        return response
+
+    etag = response.headers.get("ETag")
+    with _etag_lock:
+        if response.status_code == 200 and etag:
+            _etag_cache[key] = (etag, response.content, dict(response.headers))
+            _etag_cache.move_to_end(key)
+            while len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                _etag_cache.popitem(last=False)
+        else:
+            _etag_cache.pop(key, None)
+
+    return response
+
+
+# ================== Read Cache ==================
+#
+# Reads are cached with st.cache_data, shared by every session of this
+# frontend process, so reruns triggered by widget clicks render from memory.
+# Entries are keyed by a generation counter as well as the call arguments:
+# a write bumps the affected student's generation, so that student's next
+# reads miss while every other student's entries stay warm. Class-wide views
+# (dashboard, recent corrections) key on a generation bumped by any write.
+
+READ_CACHE_MAX_ENTRIES = int(os.getenv("READ_CACHE_MAX_ENTRIES", "1000"))
+# Seconds a read is reused; bounds staleness from writes made elsewhere
+STUDENT_READ_TTL = int(os.getenv("STUDENT_READ_TTL", "60"))
+CLASS_READ_TTL = int(os.getenv("CLASS_READ_TTL", "60"))
+ROSTER_READ_TTL = int(os.getenv("ROSTER_READ_TTL", "300"))
+
+_generation_lock = threading.Lock()
+_student_generations: Dict[str, int] = {}
+_class_generation = 0
+
+
+def _read_generation(scope: str, student_id: Optional[str]) -> int:
+    """Current generation for a cached read in the given scope"""
+    with _generation_lock:
+        if scope == "student":
+            return _student_generations.get(student_id, 0)
+        if scope == "class":
+            return _class_generation
+        return 0
+
+
+def evict_student(student_id: Optional[str]):
+    """
+    Drop cached reads for a student after a write.
+
+    Also drops class-wide views, which include every student.
+    """
+    global _class_generation
+    with _generation_lock:
+        if student_id:
+            _student_generations[student_id] = _student_generations.get(student_id, 0) + 1
+        _class_generation += 1
+
+
+def _cached_read(ttl: int, scope: str = "student"):
+    """
+    Cache an APIClient read with st.cache_data.
+
+    Args:
+        ttl: Seconds to reuse a result
+        scope: "student" (evicted by writes to the student_id argument),
+            "class" (evicted by any write) or "roster" (expires only)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def fetch(generation: int, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        # st.cache_data keys its storage by qualified name and source; give
+        # each wrapped method its own so TTLs and entries stay separate
+        fetch.__qualname__ = f"APIClient.{func.__name__}.fetch"
+        cached_fetch = st.cache_data(ttl=ttl, max_entries=READ_CACHE_MAX_ENTRIES, show_spinner=False)(fetch)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            student_id = signature.bind(*args, **kwargs).arguments.get("student_id")
+            return cached_fetch(_read_generation(scope, student_id), *args, **kwargs)
+
+        wrapper.clear = cached_fetch.clear
+        return wrapper
+
+    return decorator
+
+
 class APIClient:
     """
     Static client for making API requests to the backend.
@@ -29,6 +209,7 @@ class APIClient:
     # ================== Students Methods ==================
 
     @staticmethod
+    @_cached_read(ROSTER_READ_TTL, scope="roster")
     def get_students(teacher_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all students, optionally filtered by teacher.
@@ -47,7 +228,7 @@ class APIClient:
 
             logger.info(f"Fetching students from {url} (teacher_id={teacher_id})")
             logger.info(f"Using BACKEND_URL: {BACKEND_URL}")
-            response = requests.get(url, params=params, timeout=BACKEND_TIMEOUT)
+            response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             students = response.json()
@@ -64,6 +245,7 @@ class APIClient:
             raise Exception(f"Failed to fetch students: {str(e)}")
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_student_progress(student_id: str) -> Dict[str, Any]:
         """
         Get comprehensive progress metrics for a student.
@@ -78,7 +260,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/students/{student_id}/progress"
 
             logger.info(f"Fetching progress for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
 
             if response.status_code == 404:
                 raise Exception(f"Student {student_id} not found")
@@ -91,6 +273,46 @@ class APIClient:
             raise Exception(f"Failed to fetch student progress: {str(e)}")
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
+    def get_student_profile(
+        student_id: str,
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get several views of a student in one request.
+
+        Args:
+            student_id: Student ID
+            include: Sections to fetch from trends, progress, targets, badges (default: all)
+            fields: Optional "section.field" names to trim sections to
+
+        Returns:
+            Profile dictionary keyed by section name
+        """
+        try:
+            url = f"{BACKEND_URL}/api/students/{student_id}/profile"
+            params = {}
+            if include:
+                params["include"] = ",".join(include)
+            if fields:
+                params["fields"] = ",".join(fields)
+
+            logger.info(f"Fetching profile for student {student_id} ({params.get('include', 'all')})")
+            response = _conditional_get(url, params=params, timeout=REQUEST_TIMEOUT)
+
+            if response.status_code == 404:
+                raise Exception(f"Student {student_id} not found")
+
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching student profile: {str(e)}")
+            raise Exception(f"Failed to fetch student profile: {str(e)}")
+
+    @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_active_skills_progress(student_id: str) -> List[Dict[str, Any]]:
         """
         Get current proficiency levels for all active targeted skills.
@@ -105,7 +327,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/students/{student_id}/active-skills-progress"
 
             logger.info(f"Fetching active skills progress for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
@@ -114,33 +336,106 @@ class APIClient:
             logger.error(f"Error fetching active skills progress: {str(e)}")
             raise Exception(f"Failed to fetch active skills progress: {str(e)}")
 
+    # ================== Teachers Methods ==================
+
+    @staticmethod
+    @_cached_read(CLASS_READ_TTL, scope="class")
+    def get_teacher_dashboard(teacher_id: str) -> Dict[str, Any]:
+        """
+        Get a teacher's whole class in one request.
+
+        Each student comes back with progress metrics, active targets,
+        pending-review counts and recent growth, so dashboard pages do not
+        need per-student progress or target calls.
+
+        Args:
+            teacher_id: Teacher ID
+
+        Returns:
+            Dashboard dictionary with class totals and a 'students' list
+        """
+        try:
+            url = f"{BACKEND_URL}/api/teachers/{teacher_id}/dashboard"
+
+            logger.info(f"Fetching dashboard for teacher {teacher_id}")
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
+
+            if response.status_code == 404:
+                raise Exception(f"Teacher {teacher_id} not found")
+
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching teacher dashboard: {str(e)}")
+            raise Exception(f"Failed to fetch teacher dashboard: {str(e)}")
+
+    @staticmethod
+    @_cached_read(CLASS_READ_TTL, scope="class")
+    def get_teacher_summary(teacher_id: str) -> Dict[str, Any]:
+        """
+        Get a teacher's headline counts without any student or assessment rows.
+
+        Args:
+            teacher_id: Teacher ID
+
+        Returns:
+            Summary dictionary with class, pending-review, correction and
+            target counts
+        """
+        try:
+            url = f"{BACKEND_URL}/api/teachers/{teacher_id}/summary"
+
+            logger.info(f"Fetching summary for teacher {teacher_id}")
+            response = _session.get(url, timeout=REQUEST_TIMEOUT)
+
+            if response.status_code == 404:
+                raise Exception(f"Teacher {teacher_id} not found")
+
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching teacher summary: {str(e)}")
+            raise Exception(f"Failed to fetch teacher summary: {str(e)}")
+
     # ================== Assessments Methods ==================
 
     @staticmethod
-    def get_student_assessments(student_id: str) -> List[Dict[str, Any]]:
+    @_cached_read(STUDENT_READ_TTL)
+    def get_student_assessments(student_id: str, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get all assessments for a specific student.
+        Get a page of assessments for a specific student, newest first.
 
         Args:
             student_id: Student ID
+            limit: Page size
+            cursor: Optional cursor from a previous page
 
         Returns:
-            List of assessment dictionaries
+            Dictionary with 'assessments' and 'next_cursor' (None on the last page)
         """
         try:
             url = f"{BACKEND_URL}/api/assessments/student/{student_id}"
+            params = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
 
             logger.info(f"Fetching assessments for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            return {
+                "assessments": response.json(),
+                "next_cursor": response.headers.get("X-Next-Cursor")
+            }
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching assessments: {str(e)}")
             raise Exception(f"Failed to fetch assessments: {str(e)}")
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_skill_trends(student_id: str) -> List[Dict[str, Any]]:
         """
         Get skill trend data for charting student progress over time.
@@ -155,7 +450,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/assessments/skill-trends/{student_id}"
 
             logger.info(f"Fetching skill trends for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
@@ -165,33 +460,167 @@ class APIClient:
             raise Exception(f"Failed to fetch skill trends: {str(e)}")
 
     @staticmethod
-    def get_pending_assessments(limit: int = 50, min_confidence: Optional[float] = None) -> List[Dict[str, Any]]:
+    def get_pending_assessments(
+        limit: int = 50,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        student_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        teacher_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get pending (uncorrected) assessments that need teacher review.
 
         Args:
             limit: Maximum number of assessments to return
             min_confidence: Optional minimum confidence score filter
+            max_confidence: Optional maximum confidence score filter
+            student_id: Optional student filter
+            skill_name: Optional skill filter
+            teacher_id: Optional filter to a teacher's students
 
         Returns:
             List of pending assessment dictionaries
         """
+        return APIClient.get_pending_assessments_page(
+            limit=limit,
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            student_id=student_id,
+            skill_name=skill_name,
+            teacher_id=teacher_id
+        )["assessments"]
+
+    @staticmethod
+    def get_pending_assessments_page(
+        limit: int = 50,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        student_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        teacher_id: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of pending assessments, filtered by the backend.
+
+        Args:
+            limit: Page size
+            min_confidence: Optional minimum confidence score filter
+            max_confidence: Optional maximum confidence score filter
+            student_id: Optional student filter
+            skill_name: Optional skill filter
+            teacher_id: Optional filter to a teacher's students
+            cursor: Optional cursor from a previous page
+
+        Returns:
+            Dictionary with 'assessments' and 'next_cursor' (None on the last page)
+        """
         try:
             url = f"{BACKEND_URL}/api/assessments/pending"
             params = {"limit": limit}
-            if min_confidence is not None:
-                params["min_confidence"] = min_confidence
+            filters = {
+                "min_confidence": min_confidence,
+                "max_confidence": max_confidence,
+                "student_id": student_id,
+                "skill_name": skill_name,
+                "teacher_id": teacher_id,
+                "cursor": cursor
+            }
+            params.update({key: value for key, value in filters.items() if value is not None})
 
             logger.info(f"Fetching pending assessments (limit={limit})")
-            response = requests.get(url, params=params, timeout=BACKEND_TIMEOUT)
+            response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            return {
+                "assessments": response.json(),
+                "next_cursor": response.headers.get("X-Next-Cursor")
+            }
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching pending assessments: {str(e)}")
             raise Exception(f"Failed to fetch pending assessments: {str(e)}")
 
+    @staticmethod
+    def claim_review_assessments(
+        claimed_by: str,
+        n: int = 20,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        student_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        teacher_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Lease the next pending assessments to a reviewing teacher.
+
+        Other teachers' claims skip these assessments until the lease expires
+        or is released, so concurrent reviewers never get the same work. Each
+        claim also renews the teacher's earlier leases.
+
+        Args:
+            claimed_by: Reviewing teacher's ID
+            n: Number of assessments to claim
+            min_confidence: Optional minimum confidence score filter
+            max_confidence: Optional maximum confidence score filter
+            student_id: Optional student filter
+            skill_name: Optional skill filter
+            teacher_id: Optional filter to a teacher's students
+
+        Returns:
+            Dictionary with 'assessments' (empty when none are left),
+            'claimed_until' and 'available'
+        """
+        try:
+            url = f"{BACKEND_URL}/api/assessments/pending/claim"
+            params = {"claimed_by": claimed_by, "n": n}
+            filters = {
+                "min_confidence": min_confidence,
+                "max_confidence": max_confidence,
+                "student_id": student_id,
+                "skill_name": skill_name,
+                "teacher_id": teacher_id
+            }
+            params.update({key: value for key, value in filters.items() if value is not None})
+
+            logger.info(f"Claiming {n} assessments for review by {claimed_by}")
+            response = _session.post(url, params=params, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error claiming assessments: {str(e)}")
+            raise Exception(f"Failed to claim assessments: {str(e)}")
+
+    @staticmethod
+    def release_review_claims(claimed_by: str, assessment_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Release a teacher's review leases so other teachers can claim them.
+
+        Args:
+            claimed_by: Reviewing teacher's ID
+            assessment_ids: Leases to release, or None for all of the teacher's
+
+        Returns:
+            Response dictionary with the number of leases released
+        """
+        try:
+            url = f"{BACKEND_URL}/api/assessments/pending/release"
+            data = {
+                "claimed_by": claimed_by,
+                "assessment_ids": assessment_ids
+            }
+
+            logger.info(f"Releasing review leases for {claimed_by}")
+            response = _session.post(url, json=data, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error releasing review leases: {str(e)}")
+            raise Exception(f"Failed to release review leases: {str(e)}")
+
     @staticmethod
     def get_assessment_by_id(assessment_id: int) -> Dict[str, Any]:
         """
@@ -207,7 +636,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/assessments/{assessment_id}"
 
             logger.info(f"Fetching assessment {assessment_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _session.get(url, timeout=REQUEST_TIMEOUT)
 
             if response.status_code == 404:
                 raise Exception(f"Assessment {assessment_id} not found")
@@ -241,10 +670,12 @@ class APIClient:
             url = f"{BACKEND_URL}/api/corrections/submit"
 
             logger.info(f"Submitting correction for assessment {correction_data.get('assessment_id')}")
-            response = requests.post(url, json=correction_data, timeout=BACKEND_TIMEOUT)
+            response = _session.post(url, json=correction_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            result = response.json()
+            evict_student(result.get("student_id"))
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error submitting correction: {str(e)}")
@@ -270,16 +701,59 @@ class APIClient:
             }
 
             logger.info(f"Approving assessment {assessment_id}")
-            response = requests.post(url, json=data, timeout=BACKEND_TIMEOUT)
+            response = _session.post(url, json=data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            result = response.json()
+            evict_student(result.get("student_id"))
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error approving assessment: {str(e)}")
             raise Exception(f"Failed to approve assessment: {str(e)}")
 
     @staticmethod
+    def submit_review_batch(
+        approvals: List[Dict[str, Any]],
+        corrections: List[Dict[str, Any]],
+        skip_missing: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Apply a batch of approvals and corrections in one backend transaction.
+
+        Args:
+            approvals: Dictionaries with assessment_id and approved_by
+            corrections: Dictionaries shaped like submit_correction's correction_data
+            skip_missing: Apply the rest of the batch when some assessments no
+                longer exist, instead of rejecting it
+
+        Returns:
+            Response dictionary with approved_ids, correction_ids, student_ids
+            and missing_ids (assessments skipped because they no longer exist)
+        """
+        try:
+            url = f"{BACKEND_URL}/api/corrections/bulk"
+            data = {
+                "approvals": approvals,
+                "corrections": corrections,
+                "skip_missing": skip_missing
+            }
+
+            logger.info(f"Submitting review batch ({len(approvals)} approvals, {len(corrections)} corrections)")
+            response = _session.post(url, json=data, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+
+            result = response.json()
+            for student_id in result.get("student_ids", []):
+                evict_student(student_id)
+            return result
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error submitting review batch: {str(e)}")
+            raise Exception(f"Failed to submit review batch: {str(e)}")
+
+    @staticmethod
+    @_cached_read(CLASS_READ_TTL, scope="class")
     def get_recent_corrections(limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent teacher corrections.
@@ -295,7 +769,7 @@ class APIClient:
             params = {"limit": limit}
 
             logger.info(f"Fetching recent corrections (limit={limit})")
-            response = requests.get(url, params=params, timeout=BACKEND_TIMEOUT)
+            response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
@@ -327,16 +801,19 @@ class APIClient:
             url = f"{BACKEND_URL}/api/students/{student_id}/target-skill"
 
             logger.info(f"Assigning target to student {student_id}: {target_data.get('skill_name')}")
-            response = requests.post(url, json=target_data, timeout=BACKEND_TIMEOUT)
+            response = _session.post(url, json=target_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            result = response.json()
+            evict_student(student_id)
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error assigning target: {str(e)}")
             raise Exception(f"Failed to assign target: {str(e)}")
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_student_targets(student_id: str, completed: Optional[bool] = None) -> List[Dict[str, Any]]:
         """
         Get all skill targets for a student.
@@ -355,7 +832,7 @@ class APIClient:
                 params["completed"] = str(completed).lower()
 
             logger.info(f"Fetching targets for student {student_id}")
-            response = requests.get(url, params=params, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
@@ -379,10 +856,12 @@ class APIClient:
             url = f"{BACKEND_URL}/api/students/targets/{target_id}/complete"
 
             logger.info(f"Completing target {target_id}")
-            response = requests.put(url, timeout=BACKEND_TIMEOUT)
+            response = _session.put(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            result = response.json()
+            evict_student(result.get("student_id"))
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error completing target: {str(e)}")
@@ -391,6 +870,7 @@ class APIClient:
     # ================== Badges Methods ==================
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_student_badges(student_id: str) -> Dict[str, Any]:
         """
         Get all badges (earned and locked) for a student.
@@ -405,7 +885,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/badges/students/{student_id}/badges"
 
             logger.info(f"Fetching badges for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
@@ -433,16 +913,19 @@ class APIClient:
             url = f"{BACKEND_URL}/api/badges/grant"
 
             logger.info(f"Granting badge to student {badge_data.get('student_id')}: {badge_data.get('skill_name')}")
-            response = requests.post(url, json=badge_data, timeout=BACKEND_TIMEOUT)
+            response = _session.post(url, json=badge_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            return response.json()
+            result = response.json()
+            evict_student(badge_data.get("student_id"))
+            return result
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error granting badge: {str(e)}")
             raise Exception(f"Failed to grant badge: {str(e)}")
 
     @staticmethod
+    @_cached_read(STUDENT_READ_TTL)
     def get_badge_progress(student_id: str) -> Dict[str, Any]:
         """
         Get badge progress summary for a student.
@@ -457,7 +940,7 @@ class APIClient:
             url = f"{BACKEND_URL}/api/badges/students/{student_id}/badge-progress"
 
             logger.info(f"Fetching badge progress for student {student_id}")
-            response = requests.get(url, timeout=BACKEND_TIMEOUT)
+            response = _conditional_get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             return response.json()
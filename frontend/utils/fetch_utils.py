@@ -0,0 +1,84 @@
+"""
+Concurrent Fetch Utilities
+
+Helpers for issuing independent backend calls in parallel from a page.
+
+Streamlit runs a page script top to bottom, so several APIClient calls in a
+row cost the sum of their latencies. fetch_all runs them on a shared,
+bounded thread pool (over the APIClient's pooled session) so the page waits
+only for the slowest one.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Upper bound on backend calls in flight from this process at once
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "8"))
+
+_executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="fetch")
+
+
+def fetch_all(*calls: Callable[[], Any], return_exceptions: bool = False) -> List[Any]:
+    """
+    Run independent calls concurrently and return their results in order.
+
+    Example:
+        active, completed, trends = fetch_all(
+            lambda: APIClient.get_student_targets(student_id, completed=False),
+            lambda: APIClient.get_student_targets(student_id, completed=True),
+            lambda: APIClient.get_skill_trends(student_id)
+        )
+
+    Args:
+        *calls: Zero-argument callables, typically lambdas around APIClient methods
+        return_exceptions: If True, a failed call's exception is returned in its
+            place instead of being raised
+
+    Returns:
+        List of results, one per call, in the order given
+
+    Raises:
+        The first failed call's exception (in argument order) once all calls
+        have finished, unless return_exceptions is True
+    """
+    # Workers run inside the page's script context so st.cache_data and
+    # session state behave as they would in the page itself
+    ctx = get_script_run_ctx()
+
+    def run(call: Callable[[], Any]) -> Any:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return call()
+
+    futures = [_executor.submit(run, call) for call in calls]
+
+    results = []
+    for future in futures:
+        error = future.exception()
+        results.append(error if error is not None else future.result())
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    return results
+
+
+def fetch_in_background(call: Callable[[], Any]) -> Future:
+    """
+    Start a call on the shared pool without waiting for it.
+
+    The call may outlive the script run that started it, so it runs without
+    a script context: it must not use st.* (uncached APIClient methods are fine).
+
+    Args:
+        call: Zero-argument callable
+
+    Returns:
+        Future for the call's result
+    """
+    return _executor.submit(call)
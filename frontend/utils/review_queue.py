@@ -0,0 +1,277 @@
+"""
+Review Queue Utilities
+
+Works through the teacher review queue for the Assessment Review page.
+
+Assessments are claimed a batch at a time from
+POST /api/assessments/pending/claim, which leases them to this teacher so
+other teachers reviewing at the same time are given different work. While
+the teacher works through the loaded items, the next batch is claimed in
+the background, so moving to the next assessment never waits on the backend
+unless the teacher outpaces the prefetch. Each claim also renews the
+teacher's earlier leases; leases left unreviewed are released when the
+teacher resets or changes filters, or expire on their own.
+
+State lives in session state next to the rest of the review state (see
+session_utils.initialize_session_state):
+    assessments_to_review  Loaded items, in queue order
+    review_filters         Filters the queue was started with
+    review_reviewer        Teacher the assessments are leased to
+    review_more_available  False once a claim came back short
+    review_total           Assessments available when the queue was started
+    review_prefetch        Future for the next batch while it is in flight
+    review_decisions       Approvals and corrections not yet sent, by assessment ID
+    review_notice          Message about the last save for the page to show once
+
+Decisions are queued locally and sent to POST /api/corrections/bulk in
+batches of REVIEW_FLUSH_SIZE, when the queue runs out, or when the teacher
+saves, so approving or correcting an assessment does not wait on a write.
+Decisions for assessments deleted in the meantime (e.g. by a rubric rescore)
+are dropped and reported rather than failing the batch.
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+import streamlit as st
+
+from utils.api_client import APIClient
+from utils.fetch_utils import fetch_in_background
+from utils.session_utils import advance_review_index, reset_review_state
+
+logger = logging.getLogger(__name__)
+
+# Assessments per claim
+REVIEW_PAGE_SIZE = int(os.getenv("REVIEW_PAGE_SIZE", "20"))
+
+# Claim the next batch once this many loaded items remain
+REVIEW_PREFETCH_AHEAD = int(os.getenv("REVIEW_PREFETCH_AHEAD", "10"))
+
+# Send queued decisions once this many are waiting
+REVIEW_FLUSH_SIZE = int(os.getenv("REVIEW_FLUSH_SIZE", "10"))
+
+
+def start_review_queue(reviewer: str, filters: Dict[str, Any]) -> int:
+    """
+    Claim the first batch of the review queue and reset the review position.
+
+    Leases the reviewer still holds from an earlier queue, including a
+    prefetched batch still being claimed, are released first.
+
+    Args:
+        reviewer: Teacher ID the assessments are leased to
+        filters: claim_review_assessments filter arguments (None values are ignored)
+
+    Returns:
+        Number of matching assessments not leased to another teacher
+    """
+    release_review_queue()
+    if reviewer != st.session_state.get("review_reviewer"):
+        APIClient.release_review_claims(reviewer)
+    batch = APIClient.claim_review_assessments(reviewer, n=REVIEW_PAGE_SIZE, **filters)
+
+    st.session_state.assessments_to_review = batch["assessments"]
+    st.session_state.review_filters = filters
+    st.session_state.review_reviewer = reviewer
+    st.session_state.review_more_available = len(batch["assessments"]) == REVIEW_PAGE_SIZE
+    st.session_state.review_total = batch["available"]
+    st.session_state.review_prefetch = None
+    st.session_state.review_index = 0
+
+    return batch["available"]
+
+
+def release_review_queue():
+    """
+    Release the reviewer's remaining leases so other teachers can claim them.
+
+    A prefetch still in flight is waited for first: if its claim committed
+    after the release, it would lease a batch that no one reviews until the
+    leases expire.
+    """
+    future = st.session_state.get("review_prefetch")
+    if future is not None:
+        st.session_state.review_prefetch = None
+        try:
+            future.result()
+        except Exception as e:
+            logger.warning(f"Review queue prefetch failed: {str(e)}")
+
+    reviewer = st.session_state.get("review_reviewer")
+    if reviewer:
+        APIClient.release_review_claims(reviewer)
+
+
+def prefetch_next_page():
+    """
+    Start claiming the next batch in the background when the teacher is near
+    the end of the loaded items. Does nothing if a claim is already in flight
+    or nothing is left to claim.
+    """
+    if not st.session_state.review_more_available or st.session_state.review_prefetch is not None:
+        return
+
+    remaining = len(st.session_state.assessments_to_review) - st.session_state.review_index - 1
+    if remaining > REVIEW_PREFETCH_AHEAD:
+        return
+
+    reviewer = st.session_state.review_reviewer
+    filters = st.session_state.review_filters
+    st.session_state.review_prefetch = fetch_in_background(
+        lambda: APIClient.claim_review_assessments(reviewer, n=REVIEW_PAGE_SIZE, **filters)
+    )
+
+
+def collect_prefetched_page(wait: bool = False):
+    """
+    Append the prefetched batch to the loaded items once it has arrived.
+
+    A failed prefetch is logged and dropped; the next prefetch_next_page call
+    retries it.
+
+    Args:
+        wait: Block until the batch arrives instead of returning if it is
+            still in flight
+    """
+    future = st.session_state.review_prefetch
+    if future is None or (not wait and not future.done()):
+        return
+
+    st.session_state.review_prefetch = None
+    try:
+        batch = future.result()
+    except Exception as e:
+        logger.warning(f"Review queue prefetch failed: {str(e)}")
+        return
+
+    st.session_state.assessments_to_review.extend(batch["assessments"])
+    st.session_state.review_more_available = len(batch["assessments"]) == REVIEW_PAGE_SIZE
+
+
+def has_more_reviews() -> bool:
+    """
+    Check whether the queue has items beyond the current one.
+
+    Returns:
+        True if a later item is loaded or more may still be claimed
+    """
+    return (
+        st.session_state.review_index < len(st.session_state.assessments_to_review) - 1
+        or st.session_state.review_more_available
+    )
+
+
+def advance_review() -> bool:
+    """
+    Move to the next assessment, pulling in the next batch first if the
+    teacher is on the last loaded item.
+
+    Returns:
+        True if the position moved
+    """
+    at_last_loaded = st.session_state.review_index >= len(st.session_state.assessments_to_review) - 1
+
+    if at_last_loaded and st.session_state.review_more_available:
+        if st.session_state.review_prefetch is None:
+            prefetch_next_page()
+        collect_prefetched_page(wait=True)
+
+    return advance_review_index()
+
+
+def queue_review_decision(kind: str, data: Dict[str, Any]) -> bool:
+    """
+    Queue an approval or correction and move to the next assessment.
+
+    A later decision for the same assessment (after going back) replaces the
+    queued one. The queue is sent once it holds REVIEW_FLUSH_SIZE decisions
+    or the decision was for the last assessment in the review queue.
+
+    Args:
+        kind: "approval" or "correction"
+        data: Approval (assessment_id, approved_by) or correction payload
+
+    Returns:
+        True if the position moved
+
+    Raises:
+        Exception: If sending the queue fails; the decisions stay queued
+    """
+    st.session_state.review_decisions[data["assessment_id"]] = (kind, data)
+
+    moved = advance_review()
+
+    if len(st.session_state.review_decisions) >= REVIEW_FLUSH_SIZE or not moved:
+        flush_review_decisions()
+
+    return moved
+
+
+def flush_review_decisions() -> int:
+    """
+    Send all queued decisions to the backend as one batch.
+
+    Decisions for assessments that no longer exist are dropped, and the
+    review_notice says which.
+
+    Returns:
+        Number of decisions saved
+
+    Raises:
+        Exception: If the batch fails; the decisions stay queued for a retry
+    """
+    decisions = st.session_state.review_decisions
+    if not decisions:
+        return 0
+
+    approvals = [data for kind, data in decisions.values() if kind == "approval"]
+    corrections = [data for kind, data in decisions.values() if kind == "correction"]
+
+    result = APIClient.submit_review_batch(approvals, corrections, skip_missing=True)
+
+    missing = result.get("missing_ids", [])
+    if missing:
+        logger.warning(f"Dropped review decisions for deleted assessments: {missing}")
+        st.session_state.review_notice = (
+            f"{len(missing)} decision(s) were not saved because the assessments no longer exist "
+            f"(IDs: {', '.join(map(str, missing))})."
+        )
+
+    st.session_state.review_decisions = {}
+    return len(decisions) - len(missing)
+
+
+def end_review_queue():
+    """
+    Save queued decisions, give up the leases and clear the review state.
+
+    Never raises, so the teacher can always leave the current queue: if the
+    save fails the decisions stay queued (reset_review_state keeps them) and
+    go out with the next save, and leases that fail to release expire.
+    """
+    try:
+        flush_review_decisions()
+    except Exception as e:
+        logger.error(f"Error saving review decisions: {str(e)}")
+        st.session_state.review_notice = (
+            f"{pending_decision_count()} decision(s) could not be saved yet and will be "
+            f"saved with your next batch ({str(e)})."
+        )
+
+    try:
+        release_review_queue()
+    except Exception as e:
+        logger.warning(f"Error releasing review leases: {str(e)}")
+
+    reset_review_state()
+
+
+def pending_decision_count() -> int:
+    """
+    Get the number of decisions waiting to be sent.
+
+    Returns:
+        Number of queued approvals and corrections
+    """
+    return len(st.session_state.review_decisions)
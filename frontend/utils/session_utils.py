@@ -38,6 +38,28 @@ def initialize_session_state():
     if "filters_applied" not in st.session_state:
         st.session_state.filters_applied = False
 
+    # Review queue claims (see review_queue.py)
+    if "review_filters" not in st.session_state:
+        st.session_state.review_filters = {}
+
+    if "review_reviewer" not in st.session_state:
+        st.session_state.review_reviewer = None
+
+    if "review_more_available" not in st.session_state:
+        st.session_state.review_more_available = False
+
+    if "review_total" not in st.session_state:
+        st.session_state.review_total = None
+
+    if "review_prefetch" not in st.session_state:
+        st.session_state.review_prefetch = None
+
+    if "review_decisions" not in st.session_state:
+        st.session_state.review_decisions = {}
+
+    if "review_notice" not in st.session_state:
+        st.session_state.review_notice = None
+
     # Review statistics
     if "reviews_approved" not in st.session_state:
         st.session_state.reviews_approved = 0
@@ -111,10 +133,18 @@ def navigate_to_student(student_id: str, student_name: str):
 def reset_review_state():
     """
     Reset the assessment review state to start fresh.
+
+    Decisions not yet sent are kept, so they are saved with the next flush
+    rather than lost when a save fails.
     """
     st.session_state.review_index = 0
     st.session_state.assessments_to_review = []
     st.session_state.filters_applied = False
+    st.session_state.review_filters = {}
+    st.session_state.review_reviewer = None
+    st.session_state.review_more_available = False
+    st.session_state.review_total = None
+    st.session_state.review_prefetch = None
     st.session_state.reviews_approved = 0
     st.session_state.reviews_corrected = 0
     st.session_state.reviews_skipped = 0
@@ -0,0 +1,120 @@
+"""
+Static Asset Utilities
+
+Prepares images for Streamlit's static file server (server.enableStaticServing
+in .streamlit/config.toml), which serves frontend/static/ at /app/static/.
+
+Pages reference images by URL instead of inlining them as base64, so the
+browser downloads each image once and reuses it across reruns and pages.
+Images are resized and re-encoded from the originals in assets/ into
+static/ the first time they are needed (or ahead of time by
+scripts/build_static_assets.py during the Docker build). URLs carry a
+content hash as ?v=, which makes the static server send long-lived cache
+headers.
+"""
+
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image
+
+FRONTEND_DIR = Path(__file__).parent.parent
+ASSETS_DIR = FRONTEND_DIR / "assets"
+STATIC_DIR = FRONTEND_DIR / "static"
+STATIC_URL_PATH = "/app/static"
+
+WEBP_QUALITY = 82
+
+# Avatars are shown at up to 160px (road map) and 150px (login picker);
+# thumbnails are twice that for high-DPI screens
+AVATAR_THUMBNAIL_SIZE = (320, 320)
+
+# Avatar catalog: display name and original file under assets/avatars/
+AVATARS = [
+    ("Boy", "avatar1.png"),
+    ("Girl", "avatar2.png"),
+    ("Robot", "avatar3.png"),
+    ("Axolotl", "avatar4.png"),
+]
+
+_build_lock = threading.Lock()
+
+
+def build_image(source: Path, name: str, max_size: Optional[Tuple[int, int]] = None) -> Path:
+    """
+    Write a web-optimized WebP copy of an image into the static directory.
+
+    The copy is rebuilt only when it is missing or older than the source.
+
+    Args:
+        source: Original image under assets/
+        name: File name (without extension) for the copy
+        max_size: Optional (width, height) bound; aspect ratio is preserved
+
+    Returns:
+        Path of the built file
+    """
+    target = STATIC_DIR / f"{name}.webp"
+
+    with _build_lock:
+        if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            return target
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(source) as image:
+            if max_size:
+                image.thumbnail(max_size, Image.LANCZOS)
+            # Write to a temporary name first so concurrent readers never
+            # see a half-written file
+            partial = target.with_suffix(".partial")
+            image.save(partial, "WEBP", quality=WEBP_QUALITY, method=6)
+            partial.replace(target)
+
+    return target
+
+
+@lru_cache(maxsize=None)
+def _content_version(path: Path, mtime: float) -> str:
+    """Short content hash used to version a static URL"""
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:12]
+
+
+def static_url(path: Path) -> str:
+    """
+    URL of a file in the static directory, versioned by its content.
+
+    Args:
+        path: File under STATIC_DIR
+
+    Returns:
+        Absolute URL path, e.g. /app/static/road_map_background.webp?v=1a2b3c4d5e6f
+    """
+    relative = path.relative_to(STATIC_DIR).as_posix()
+    return f"{STATIC_URL_PATH}/{relative}?v={_content_version(path, path.stat().st_mtime)}"
+
+
+def road_map_background_url() -> str:
+    """URL of the Road to Skills map background"""
+    source = ASSETS_DIR / "backgrounds" / "road_map_background.png"
+    return static_url(build_image(source, "road_map_background"))
+
+
+def avatar_url(file: str) -> str:
+    """
+    URL of an avatar thumbnail.
+
+    Args:
+        file: Original file name under assets/avatars/, e.g. avatar1.png
+
+    Returns:
+        Versioned static URL of the thumbnail
+
+    Raises:
+        FileNotFoundError: If the original avatar image does not exist
+    """
+    source = ASSETS_DIR / "avatars" / file
+    name = f"avatars/{Path(file).stem}"
+    return static_url(build_image(source, name, max_size=AVATAR_THUMBNAIL_SIZE))